@@ -15,9 +15,10 @@ from pathlib import Path
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 sys.path.insert(0, str(current_dir.parent))
+sys.path.insert(0, str(current_dir.parent / "src"))
 
-from crewai import LLM
 from dotenv import load_dotenv
+from utils.llm_client import create_llm
 
 # Import SingleAgentCrew from single.py in same directory
 from single import SingleAgentCrew
@@ -31,7 +32,7 @@ class SingleAgentRunner:
     """Runner for single-agent market trends analysis"""
     
     def __init__(self):
-        self.llm = LLM(model="gpt-4o-mini")
+        self.llm = create_llm(model="gpt-4o-mini")
         
     def run_from_multi_agent_session(self, session_dir: str) -> dict:
         """
@@ -1,5 +1,5 @@
 from crewai import Agent, Task, Crew
-from crewai_tools import SerperDevTool
+from Tools.serper_tool import RateLimitedSerperDevTool
 
 class SingleAgentCrew:
     """Single agent that handles all tasks sequentially"""
@@ -16,7 +16,7 @@ class SingleAgentCrew:
                 - Analyzing market trends
                 - Verifying data quality
                 - Generating insights''',
-            tools=[SerperDevTool()],
+            tools=[RateLimitedSerperDevTool()],
             llm=self.llm,
             verbose=True
         )
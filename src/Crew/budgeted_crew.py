@@ -0,0 +1,42 @@
+"""
+Budgeted Crew - Crew whose tasks receive context within their agent's token budget
+CrewAI passes every context task's full raw output to the next task; this crew
+prunes, minifies and fits those outputs into the budget of the agent that runs
+the task (see utils.token_budget). With ``parallel_levels`` the tasks of each
+dependency level run in parallel threads (see utils.task_dag)
+"""
+
+from typing import Dict
+
+from crewai import Crew
+from pydantic import Field
+
+from utils.task_dag import execute_task_levels
+from utils.token_budget import fit_context, task_budget, task_context
+
+
+class BudgetedCrew(Crew):
+    """Crew that fits task context into per-agent token budgets"""
+
+    agent_budgets: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Token budget per agent role (utils.token_budget.role_budgets)"
+    )
+    parallel_levels: bool = Field(
+        default=False,
+        description="Run tasks that share a context dependency level in parallel threads"
+    )
+
+    def _execute_tasks(self, tasks, start_index=0, was_replayed=False):
+        """Level-by-level execution with parallel_levels; CrewAI's loop otherwise (and for replays)"""
+        if self.parallel_levels and not start_index and not was_replayed:
+            return execute_task_levels(self, tasks)
+        return super()._execute_tasks(tasks, start_index, was_replayed)
+
+    def _get_context(self, task, task_outputs) -> str:
+        """Context for a task: its context tasks' outputs (or all earlier outputs), within budget"""
+        if not task.context:
+            return ""
+        if isinstance(task.context, list):
+            return task_context(task, self.agent_budgets)
+        return fit_context([output.raw for output in task_outputs], task_budget(task, self.agent_budgets))
@@ -1,6 +1,6 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import SerperDevTool
+from Tools.serper_tool import RateLimitedSerperDevTool
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
 
@@ -27,7 +27,7 @@ class MainCrew:
     def lead_research_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config['lead_research_analyst'], # type: ignore[index]
-            tools=[SerperDevTool()],
+            tools=[RateLimitedSerperDevTool()],
             llm=self.llm 
         )
     
@@ -42,7 +42,7 @@ class MainCrew:
     def linkedin_market_trends_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config['linkedin_market_trends_analyst'], # type: ignore[index]
-            tools=[SerperDevTool()],
+            tools=[RateLimitedSerperDevTool()],
             llm=self.llm 
         )
     
@@ -50,7 +50,7 @@ class MainCrew:
     def linkedin_scraper(self) -> Agent:
         return Agent(
             config=self.agents_config['LinkedIn_Scraper'], # type: ignore[index]
-            tools=[SerperDevTool()],
+            tools=[RateLimitedSerperDevTool()],
             llm=self.llm 
         )
     
@@ -72,7 +72,7 @@ class MainCrew:
     def verification_specialist(self) -> Agent:
         return Agent(
             config=self.agents_config['verification_specialist'], # type: ignore[index]
-            tools=[SerperDevTool()],
+            tools=[RateLimitedSerperDevTool()],
             llm=self.llm 
         )
 
@@ -5,10 +5,12 @@ Focuses on LinkedIn-specific agents and tasks for targeted job discovery
 
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import SerperDevTool
+from Tools.serper_tool import RateLimitedSerperDevTool
+from Tools.LinkedInJobSearchTool import LinkedInJobSearchTool
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
+from typing import List, Optional
 from datetime import datetime
+import shutil
 
 # Import json_manager functions directly
 from utils.json_manager import (
@@ -17,6 +19,13 @@ from utils.json_manager import (
     get_linkedin_search_history,
     SearchResultsManager
 )
+from utils.search_session import SearchSession
+from utils.task_dag import parallelize_tasks, describe_schedule
+from utils.crew_cache import crew_cache, cached_crew_output
+from utils.crew_metrics import track_crew
+from utils.token_budget import budget_for, role_budgets
+from utils.input_parser import complete_task_locally, parse_search_inputs
+from Crew.budgeted_crew import BudgetedCrew
 
 @CrewBase
 class LinkedInSearchCrew:
@@ -27,11 +36,30 @@ class LinkedInSearchCrew:
     
     agents_config = '../config/linkedin_agents.yaml'
     tasks_config = '../config/linkedin_tasks.yaml'
+    CACHE_NAME = "linkedin_search"
+    # Scratch sessions for background cache refreshes (not listed with the user's searches)
+    REFRESH_DIR = "src/outputs/cache/refresh"
+    # Filters referenced by the task templates; omitted ones mean "no filter"
+    FILTER_DEFAULTS = {
+        "company": "",
+        "job_type": "Any",
+        "remote_option": "Any",
+        "date_posted": "Any",
+        "work_authorization": "Any",
+    }
     
-    def __init__(self, llm):
+    def __init__(self, llm, session: Optional[SearchSession] = None):
+        """
+        Args:
+            llm: LLM shared by all agents
+            session: Search session whose directory receives every output file
+                     (a new session is created when omitted)
+        """
         self.llm = llm  
+        self.session = session or SearchSession.create()
         self.agents: List[BaseAgent] = []
         self.tasks: List[Task] = []
+        self.local_tasks: List[Task] = []  # completed by the rule-based input parser
     
     @agent
     def dashboard_input_processor(self) -> Agent:
@@ -43,10 +71,20 @@ class LinkedInSearchCrew:
     
     @agent
     def linkedin_scraper(self) -> Agent:
-        """Specialized agent for LinkedIn job posting discovery and scraping"""
+        """
+        Specialized agent for LinkedIn job posting discovery and scraping
+
+        The scraping task's STEP 1 asks for the "Search LinkedIn Jobs with
+        Filters" tool, so the agent gets it next to SerperDev. Each call
+        costs one Serper search per company batch.
+        """
         return Agent(
             config=self.agents_config['LinkedIn_Scraper'], # type: ignore[index]
-            tools=[SerperDevTool()],
+            tools=[
+                LinkedInJobSearchTool(output_dir=self.session.output_dir,
+                                      token_budget=budget_for("LinkedIn_Scraper")),
+                RateLimitedSerperDevTool(token_budget=budget_for("LinkedIn_Scraper"))
+            ],
             llm=self.llm 
         )
     
@@ -55,7 +93,7 @@ class LinkedInSearchCrew:
         """Analyze LinkedIn market trends and employment patterns"""
         return Agent(
             config=self.agents_config['linkedin_market_trends_analyst'], # type: ignore[index]
-            tools=[SerperDevTool()],
+            tools=[RateLimitedSerperDevTool(token_budget=budget_for("linkedin_market_trends_analyst"))],
             llm=self.llm 
         )
     
@@ -64,7 +102,7 @@ class LinkedInSearchCrew:
         """Verify and validate LinkedIn search results and market data"""
         return Agent(
             config=self.agents_config['verification_specialist'], # type: ignore[index]
-            tools=[SerperDevTool()],
+            tools=[RateLimitedSerperDevTool(token_budget=budget_for("verification_specialist"))],
             llm=self.llm 
         )
 
@@ -74,7 +112,7 @@ class LinkedInSearchCrew:
         return Task(
             config=self.tasks_config['dashboard_input_processing_task'], # type: ignore[index]
             agent=self.dashboard_input_processor(),
-            output_file="src/outputs/linkedin/user_search_params.json"
+            output_file=self.session.path("user_search_params.json")
         )
     
     @task
@@ -84,7 +122,7 @@ class LinkedInSearchCrew:
             config=self.tasks_config['linkedin_scraping_task'], # type: ignore[index]
             agent=self.linkedin_scraper(),
             context=[self.linkedin_input_processing_task()],
-            output_file="src/outputs/linkedin/job_postings.json"
+            output_file=self.session.path("job_postings.json")
         )
     
     @task
@@ -94,7 +132,7 @@ class LinkedInSearchCrew:
             config=self.tasks_config['linkedin_market_trends_task'], # type: ignore[index]
             agent=self.linkedin_market_trends_analyst(),
             context=[self.linkedin_input_processing_task()],
-            output_file="src/outputs/linkedin/market_trends.json"
+            output_file=self.session.path("market_trends.json")
         )
     
     @task
@@ -104,7 +142,7 @@ class LinkedInSearchCrew:
             config=self.tasks_config['linkedin_verification_task'], # type: ignore[index]
             agent=self.verification_specialist(),
             context=[self.linkedin_scraping_task(), self.linkedin_market_trends_task()],
-            output_file="src/outputs/linkedin/verification_report.json"
+            output_file=self.session.path("verification_report.json")
         )
 
     @crew
@@ -112,39 +150,87 @@ class LinkedInSearchCrew:
         """
         Create the LinkedIn search crew with sequential processing
         Optimized for LinkedIn job discovery and market analysis workflow
+
+        Tasks are scheduled from their context dependencies: scraping and
+        market trends both depend only on input processing, so they run
+        concurrently and verification joins on both. Each task's context is
+        fitted into its agent's token budget. Tasks already completed locally
+        (input processing on the fast path) are left out.
         """
-        return Crew(
+        local = {id(task) for task in self.local_tasks}
+        tasks = parallelize_tasks([task for task in self.tasks if id(task) not in local])
+        print(f"🗂️ LinkedIn crew schedule:\n{describe_schedule(tasks)}")
+        return BudgetedCrew(
             agents=self.agents, 
-            tasks=self.tasks, 
+            tasks=tasks, 
+            agent_budgets=role_budgets(self.agents_config),
             process=Process.sequential,
             verbose=True
         )
     
-    def search_jobs(self, job_title: str, location: str = None, **kwargs):
+    def search_jobs(self, job_title: str, location: str = None, use_cache: bool = True,
+                    save_results: bool = True, **kwargs):
         """
         Convenience method to execute LinkedIn job search
         
         Args:
             job_title (str): The job title to search for
             location (str, optional): Location for job search
+            use_cache (bool): Reuse a cached run for equivalent inputs
+            save_results (bool): Add the search to the saved search history
             **kwargs: Additional search parameters
             
         Returns:
-            CrewAI result object with job search results
+            CrewAI result object with job search results; output files are
+            written to ``self.session.output_dir``
         """
         inputs = {
             "job_title": job_title,
             "location": location or "",
             "search_timestamp": datetime.now().isoformat(),
+            **self.FILTER_DEFAULTS,
             **kwargs
         }
         
-        # Execute crew search
-        result = self.crew().kickoff(inputs=inputs)
+        # Serve equivalent earlier searches from the cache
+        cached = crew_cache.get(self.CACHE_NAME, inputs) if use_cache else None
+        if cached:
+            result = self._restore_cached_search(cached, inputs)
+            if cached.is_stale:
+                print(f"♻️ Cached search is stale ({', '.join(cached.stale_artifacts)}), refreshing in background")
+                crew_cache.refresh_in_background(
+                    cached.key,
+                    lambda: self._refresh_cache(job_title, location, **kwargs)
+                )
+        else:
+            # Execute crew search
+            self.session.update(status="running", search_params=inputs)
+            try:
+                # Common titles and filters are parsed locally instead of by the LLM
+                parsed = parse_search_inputs(inputs)
+                if parsed:
+                    input_task = self.linkedin_input_processing_task()
+                    complete_task_locally(input_task, parsed)
+                    self.local_tasks.append(input_task)
+                crew = self.crew()
+                with track_crew(crew, self.CACHE_NAME, self.session.output_dir):
+                    result = crew.kickoff(inputs=inputs)
+            except Exception:
+                self.session.update(status="failed")
+                raise
+            self.session.update(status="completed")
+            
+            try:
+                crew_cache.put(self.CACHE_NAME, inputs, self.session.artifact_paths(), result.raw)
+            except OSError as e:
+                print(f"⚠️ Warning: Could not cache search results: {e}")
+        
+        if not save_results:
+            return result
         
         # Save search results using JSON manager
         try:
-            saved_file = save_linkedin_search(result, job_title, location, **kwargs)
+            saved_file = save_linkedin_search(result, job_title, location, session=self.session, **kwargs)
             if saved_file:
                 print(f"✅ Search results saved to: {saved_file}")
         except Exception as e:
@@ -152,6 +238,31 @@ class LinkedInSearchCrew:
         
         return result
     
+    def _refresh_cache(self, job_title: str, location: str = None, **kwargs):
+        """Re-run a stale search in a scratch session that only feeds the cache"""
+        scratch = SearchSession.create(base_dir=self.REFRESH_DIR)
+        try:
+            LinkedInSearchCrew(self.llm, session=scratch).search_jobs(
+                job_title, location, use_cache=False, save_results=False, **kwargs
+            )
+        finally:
+            shutil.rmtree(scratch.output_dir, ignore_errors=True)
+    
+    def _restore_cached_search(self, cached, inputs):
+        """Copy a cached run's artifacts into this session and return its result"""
+        restored = cached.restore(self.session.artifact_paths())
+        self.session.update(
+            status="completed",
+            search_params=inputs,
+            cache_hit=True,
+            cache_key=cached.key,
+            cache_age_s=round(cached.age_seconds),
+            stale_artifacts=cached.stale_artifacts
+        )
+        print(f"⚡ Restored {len(restored)} cached artifacts into {self.session.output_dir} "
+              f"(cached {cached.age_seconds / 60:.0f} min ago)")
+        return cached_crew_output(cached.result)
+    
     @staticmethod
     def load_latest_search_results():
         """
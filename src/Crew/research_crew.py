@@ -1,9 +1,17 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import SerperDevTool, FileReadTool
+from crewai_tools import FileReadTool
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
-import yaml
+from typing import List, Optional
+from Tools.serper_tool import RateLimitedSerperDevTool
+from utils.llm_client import create_llm
+from utils.crew_cache import crew_cache, cached_crew_output, copy_artifacts
+from utils.crew_metrics import track_crew
+from utils.token_budget import budget_for, role_budgets
+from Crew.budgeted_crew import BudgetedCrew
+from utils.lazy_registry import registry, load_env
+from utils.search_session import SearchSession
+from onet_get import ONET_SNAPSHOT_PATH
 
 import os
 import yaml
@@ -13,22 +21,72 @@ CONFIG_PATH = os.path.join(
     '..', 'config', 'research_agents.yaml'
 )
 
-with open(os.path.abspath(CONFIG_PATH), 'r') as f:
-    agents_config = yaml.safe_load(f)
 
-manager = Agent(
-    config=agents_config['manager'], # type: ignore[index]
-    allow_delegation=True,
-)
+@registry.provide("research_agents_config")
+def load_agents_config():
+    """Research agent definitions, read on first use"""
+    with open(os.path.abspath(CONFIG_PATH), 'r') as f:
+        return yaml.safe_load(f)
+
+
+@registry.provide("research_manager")
+def build_manager() -> Agent:
+    """Manager agent for hierarchical mode, built the first time it is needed"""
+    from crewai.constants import DEFAULT_LLM_MODEL
+
+    load_env()
+    # The manager config sets no llm: use the model CrewAI would pick for it
+    # (MODEL, MODEL_NAME, OPENAI_MODEL_NAME, then CrewAI's default), rate limited
+    model = os.getenv("MODEL") or os.getenv("MODEL_NAME") or os.getenv("OPENAI_MODEL_NAME") or DEFAULT_LLM_MODEL
+    return Agent(
+        config=registry.get("research_agents_config")['manager'], # type: ignore[index]
+        allow_delegation=True,
+        llm=create_llm(model),
+    )
+
+
+def __getattr__(name):
+    # Backwards compatible module attributes, built lazily
+    if name == "manager":
+        return registry.get("research_manager")
+    if name == "agents_config":
+        return registry.get("research_agents_config")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 @CrewBase
 class JobResearchCrew:
     agents_config = '../config/research_agents.yaml'
     tasks_config = '../config/research_tasks.yaml'
     
+    CACHE_NAME = "job_research"
+    # Each run writes into its own session directory under SESSIONS_DIR
+    SESSIONS_DIR = "src/outputs/research"
+    # Files written by the research tasks -> shared "latest research" paths
+    # the coaches and other pages read; a finished run is published there
+    ARTIFACTS = {
+        "research_data.json": "src/outputs/lead_research_analyst/research_data.json",
+        "verification_score.json": "src/outputs/verification_analyst/verification_score.json",
+        "job_market_summary.json": "src/outputs/content/job_market_summary.json",
+    }
+    
+    # "hierarchical": the manager agent plans and delegates every task
+    # "flat": the fixed task graph runs directly, verify and content in parallel
+    EXECUTION_MODES = ("hierarchical", "flat")
     
-    def __init__(self, llm):
+    def __init__(self, llm, execution_mode: str = None, session: Optional[SearchSession] = None):
+        """
+        Args:
+            llm: LLM shared by all agents
+            execution_mode: "hierarchical" or "flat" (defaults to the
+                            RESEARCH_CREW_MODE env var, then "hierarchical")
+            session: Session whose directory receives the output files
+                     (a new one under SESSIONS_DIR is created when omitted)
+        """
         self.llm = llm  
+        self.session = session or SearchSession.create(base_dir=self.SESSIONS_DIR)
+        self.execution_mode = (execution_mode or os.getenv("RESEARCH_CREW_MODE", "hierarchical")).lower()
+        if self.execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode '{self.execution_mode}', expected one of {self.EXECUTION_MODES}")
         self.agents: List[BaseAgent] = []
         self.tasks: List[Task] = []
     
@@ -38,7 +96,7 @@ class JobResearchCrew:
     def lead_research_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config['lead_research_analyst'], # type: ignore[index]
-            tools=[SerperDevTool()],
+            tools=[RateLimitedSerperDevTool(token_budget=budget_for("lead_research_analyst"))],
             llm=self.llm
         )
         
@@ -46,7 +104,7 @@ class JobResearchCrew:
     def verification_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config['verification_analyst'], # type: ignore[index]
-            tools=[SerperDevTool(),FileReadTool(file_path="src/outputs/lead_research_analyst/research_data.json"),FileReadTool(file_path="src/data/onet/onet_snapshot.json")],
+            tools=[RateLimitedSerperDevTool(token_budget=budget_for("verification_analyst")),FileReadTool(file_path=self.session.path("research_data.json")),FileReadTool(file_path=self.onet_snapshot_path())],
             llm=self.llm
         )
     
@@ -54,7 +112,7 @@ class JobResearchCrew:
     def content_editor(self) -> Agent:
         return Agent(
             config=self.agents_config['content_editor'], # type: ignore[index]
-            tools=[FileReadTool(file_path="src/outputs/lead_research_analyst/research_data.json")],
+            tools=[FileReadTool(file_path=self.session.path("research_data.json"))],
             llm=self.llm
         )
         
@@ -63,7 +121,7 @@ class JobResearchCrew:
         return Task(
             config=self.tasks_config['research_task'], # type: ignore[index]
             agent=self.lead_research_analyst(),
-            output_file="src/outputs/lead_research_analyst/research_data.json"
+            output_file=self.session.path("research_data.json")
         )
     
     @task
@@ -72,24 +130,100 @@ class JobResearchCrew:
             config=self.tasks_config['verify_research_task'], # type: ignore[index]
             agent=self.verification_analyst(),
             context=[self.research_task()],
-            output_file="src/outputs/verification_analyst/verification_score.json"
+            output_file=self.session.path("verification_score.json")
         )
         
     @task
     def content_generation_task(self) -> Task:
+        # Flat mode schedules content next to verification, so it may only
+        # depend on research; the manager keeps CrewAI's default of passing
+        # every earlier task's output
+        dependencies = {"context": [self.research_task()]} if self.execution_mode == "flat" else {}
         return Task(
             config=self.tasks_config['content_generation_task'], # type: ignore[index]
             agent=self.content_editor(),
-            tools=[FileReadTool(file_path="outputs/lead_research_analyst/research_data.json")],
-            output_file="src/outputs/content/job_market_summary.json"
+            tools=[FileReadTool(file_path=self.session.path("research_data.json"))],
+            output_file=self.session.path("job_market_summary.json"),
+            **dependencies
         )
         
     @crew
     def crew(self) -> Crew:
-        return Crew(
+        if self.execution_mode == "flat":
+            return BudgetedCrew(
+                agents=self.agents,
+                tasks=self.tasks,
+                agent_budgets=role_budgets(self.agents_config),
+                parallel_levels=True,
+                process=Process.sequential,
+                verbose=True
+            )
+        return BudgetedCrew(
             agents=self.agents,
             tasks=self.tasks, 
-            manager_agent=manager,
+            agent_budgets=role_budgets(self.agents_config),
+            manager_agent=registry.get("research_manager"),
             process=Process.hierarchical,
             verbose=True
-        )
\ No newline at end of file
+        )
+    
+    def onet_snapshot_path(self) -> str:
+        """This session's O*NET snapshot, or the shared one when the lookup wrote none"""
+        path = self.session.path("onet_snapshot.json")
+        return path if os.path.exists(path) else ONET_SNAPSHOT_PATH
+
+    def artifact_paths(self):
+        """Paths of the research artifacts in this session's directory"""
+        return {name: self.session.path(name) for name in self.ARTIFACTS}
+
+    def publish(self):
+        """Copy this session's artifacts (and O*NET snapshot) to the shared latest-research paths"""
+        copy_artifacts(self.session.output_dir, {**self.ARTIFACTS, "onet_snapshot.json": ONET_SNAPSHOT_PATH})
+    
+    def run(self, job_title: str, use_cache: bool = True, publish: bool = True):
+        """
+        Run the research crew for a job title, reusing a cached run for
+        equivalent titles ("Sr. Data Analyst" == "senior data analyst")
+        
+        Args:
+            job_title (str): The job title to research
+            use_cache (bool): Reuse a cached run when available
+            publish (bool): Copy the finished artifacts to the ARTIFACTS paths
+            
+        Returns:
+            CrewAI result object; output files are written to the session
+            directory
+        """
+        inputs = {"job_title": job_title}
+        self.session.update(status="running", search_params=inputs)
+        
+        cached = crew_cache.get(self.CACHE_NAME, inputs) if use_cache else None
+        if cached:
+            cached.restore(self.artifact_paths())
+            if publish:
+                self.publish()
+            self.session.update(status="completed", cached=True)
+            print(f"⚡ Restored cached research for '{job_title}' (cached {cached.age_seconds / 60:.0f} min ago)")
+            if cached.is_stale:
+                crew_cache.refresh_in_background(
+                    cached.key,
+                    # Refreshes only update the cache; the user's result is already shown
+                    lambda: JobResearchCrew(self.llm, self.execution_mode).run(job_title, use_cache=False, publish=False)
+                )
+            return cached_crew_output(cached.result)
+        
+        crew = self.crew()
+        try:
+            with track_crew(crew, f"{self.CACHE_NAME}_{self.execution_mode}", self.session.output_dir):
+                result = crew.kickoff(inputs=inputs)
+        except Exception:
+            self.session.update(status="failed")
+            raise
+        if publish:
+            self.publish()
+        self.session.update(status="completed")
+        try:
+            crew_cache.put(self.CACHE_NAME, inputs, self.artifact_paths(), result.raw)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not cache research results: {e}")
+        return result
@@ -10,10 +10,12 @@ from datetime import datetime
 from typing import Type, Optional
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from dotenv import load_dotenv
-import requests
 
-load_dotenv()
+from .serper_query_planner import SerperQueryPlanner
+from .linkedin_result_parser import parse_search_result
+from utils.http_replay import http_request, serper_url
+from utils.lazy_registry import registry, load_env
+from utils.token_budget import LINKEDIN_UNUSED_FIELDS, budget_for, fit_json
 
 
 class LinkedInSearchInput(BaseModel):
@@ -45,6 +47,8 @@ class LinkedInJobSearchTool(BaseTool):
     """
     args_schema: Type[BaseModel] = LinkedInSearchInput
     output_dir: str = "src/outputs/linkedin"  # Default output directory
+    batch_size: int = 5  # Companies combined into one Serper query (1 = per-company queries)
+    token_budget: int = 0  # Max tokens of the result returned to the agent (0 = LinkedIn_Scraper budget)
     
     def __init__(self, output_dir: str = None, **kwargs):
         """Initialize the tool with optional custom output directory"""
@@ -68,7 +72,47 @@ class LinkedInJobSearchTool(BaseTool):
             work_authorization: Work authorization filter
             
         Returns:
-            JSON string with job postings including actual LinkedIn URLs
+            Minified JSON string with job postings including actual LinkedIn URLs,
+            fitted into the token budget (job_postings_raw.json keeps every field)
+        """
+        result_data = None
+        for event in self.stream_jobs(job_title, location, company, job_type,
+                                      remote_option, date_posted, work_authorization):
+            if event["event"] == "error":
+                return json.dumps({"error": event["message"]})
+            if event["event"] == "done":
+                result_data = event["result"]
+        
+        # Save to file (use dynamic output directory); job_postings.json is the
+        # scraping task's own output, so the tool's full result gets its own name
+        output_file = f"{self.output_dir}/job_postings_raw.json"
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result_data, f, indent=2, ensure_ascii=False)
+        
+        return fit_json(result_data, self.token_budget or budget_for("LinkedIn_Scraper"),
+                        drop=LINKEDIN_UNUSED_FIELDS)
+
+    def stream_jobs(self, job_title: str, location: str = "", company: str = "",
+                    job_type: str = "", remote_option: str = "", date_posted: str = "",
+                    work_authorization: str = ""):
+        """
+        Run the LinkedIn job search, yielding postings as each query completes.
+        
+        Every new posting is also appended to ``job_postings.jsonl`` in the
+        output directory, so other readers can follow the search while it runs.
+        
+        Args:
+            Same as ``_run``
+            
+        Yields:
+            Event dicts with an ``event`` key:
+            - ``progress``: a query finished (``query``, ``companies``,
+              ``serper_calls``, ``jobs_found``, ``batches_remaining``)
+            - ``job``: a new posting (``job``)
+            - ``error``: the search could not start (``message``)
+            - ``done``: the search finished (``result``, the full result JSON)
         """
         # Build params dict
         params = {
@@ -82,9 +126,11 @@ class LinkedInJobSearchTool(BaseTool):
         }
         
         # Get API key
+        load_env()
         api_key = os.getenv("SERPER_API_KEY")
         if not api_key:
-            return json.dumps({"error": "SERPER_API_KEY not found in environment"})
+            yield {"event": "error", "message": "SERPER_API_KEY not found in environment"}
+            return
         
         # Target companies list (can be customized)
         target_companies = [
@@ -100,58 +146,50 @@ class LinkedInJobSearchTool(BaseTool):
         all_jobs = []
         max_jobs_target = 40  # Target: 40 job postings
         
-        # Search each company until we reach 40 jobs
-        for comp in target_companies[:15]:  # Search more companies if needed
-            if len(all_jobs) >= max_jobs_target:
-                break  # Stop when we have enough jobs
+        # Plan batched OR-queries over the companies to search
+        planner = SerperQueryPlanner(job_title, location, batch_size=self.batch_size)
+        search_companies = target_companies[:15]  # Search more companies if needed
+        pending_batches = planner.plan(search_companies)
+        serper_calls = 0
+        
+        # Start a fresh JSONL sidecar for this search
+        sidecar_file = f"{self.output_dir}/job_postings.jsonl"
+        os.makedirs(os.path.dirname(sidecar_file), exist_ok=True)
+        
+        with open(sidecar_file, 'w', encoding='utf-8') as sidecar:
+            # Run batches until we reach 40 jobs
+            while pending_batches:
+                if len(all_jobs) >= max_jobs_target:
+                    break  # Stop when we have enough jobs
                 
-            # Build search query: target /jobs/view specifically
-            query = f'site:linkedin.com/jobs/view "{job_title}" {comp}'
-            if location:
-                query += f' {location}'
-            
-            try:
-                response = requests.post(
-                    "https://google.serper.dev/search",
-                    headers={
-                        "X-API-KEY": api_key,
-                        "Content-Type": "application/json"
-                    },
-                    json={"q": query, "num": 10}  # 10 results per company
-                )
+                batch = pending_batches.pop(0)
+                query = planner.build_query(batch)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get("organic", [])
-                    
-                    for result in results:
-                        url = result.get("link", "")
-                        title = result.get("title", "")
-                        snippet = result.get("snippet", "")
-                        
-                        # Extract job_id from URL
-                        match = re.search(r'/jobs/view/[^/]+-(\d+)', url)
-                        if match:
-                            job_id = match.group(1)
-                            
-                            # Don't add duplicates
-                            if not any(j["job_id"] == job_id for j in all_jobs):
-                                all_jobs.append({
-                                    "job_id": job_id,
-                                    "job_title": title,
-                                    "company_name": comp,  # Searched company
-                                    "location": location or "Not specified",
-                                    "application_url": url,
-                                    "job_description": snippet,
-                                    "employment_type": params.get("job_type", "Not specified"),
-                                    "work_arrangement": params.get("remote_option", "Not specified"),
-                                    "date_posted": "Recent",
-                                    "source": "LinkedIn"
-                                })
-            
-            except Exception as e:
-                print(f"Error searching {comp}: {e}")
-                continue
+                results = self._serper_search(api_key, query, planner.num_results(batch))
+                serper_calls += 1
+                
+                # A full page may have cut off some companies: search those on their own
+                pending_batches[:0] = planner.fallback(results or [], batch)
+                
+                for result in results or []:
+                    comp = batch[0] if len(batch) == 1 else planner.attribute(result, batch)
+                    job = self._add_job(all_jobs, result, comp, location, params)
+                    if job:
+                        sidecar.write(json.dumps(job, ensure_ascii=False) + "\n")
+                        sidecar.flush()
+                        yield {"event": "job", "job": job}
+                
+                yield {
+                    "event": "progress",
+                    "query": query,
+                    "companies": batch,
+                    "serper_calls": serper_calls,
+                    "jobs_found": len(all_jobs),
+                    "batches_remaining": len(pending_batches)
+                }
+        
+        print(f"📊 Serper call budget: {serper_calls} calls for {len(search_companies)} companies "
+              f"(per-company plan: {len(search_companies)} calls)")
         
         # Build result JSON
         result_data = {
@@ -165,22 +203,104 @@ class LinkedInJobSearchTool(BaseTool):
                 "work_authorization": params.get("work_authorization", "Any"),
                 "search_date": datetime.now().isoformat(),
                 "total_results_found": len(all_jobs),
+                "serper_calls": serper_calls,
                 "method": "serperdev_targeted_company_search"
             },
             "job_postings": all_jobs
         }
         
-        # Save to file (use dynamic output directory)
-        output_file = f"{self.output_dir}/job_postings.json"
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        yield {"event": "done", "result": result_data}
+
+    def _serper_search(self, api_key: str, query: str, num: int) -> Optional[list]:
+        """
+        Run one Serper search query.
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result_data, f, indent=2, ensure_ascii=False)
+        Returns:
+            List of organic results, or None if the request failed
+        """
+        try:
+            response = http_request(
+                "POST",
+                serper_url("search"),
+                provider="serper",
+                headers={
+                    "X-API-KEY": api_key,
+                    "Content-Type": "application/json"
+                },
+                json_body={"q": query, "num": num}
+            )
+        except Exception as e:
+            print(f"Error searching '{query}': {e}")
+            return None
+        
+        if response.status_code != 200:
+            return None
+        return response.json().get("organic", [])
+
+    def _add_job(self, all_jobs: list, result: dict, company: Optional[str],
+                 location: str, params: dict) -> Optional[dict]:
+        """
+        Convert a Serper result to a job posting and append it unless duplicated.
         
-        return json.dumps(result_data, indent=2, ensure_ascii=False)
+        Returns:
+            The new job posting, or None if the result was skipped
+        """
+        url = result.get("link", "")
+        title = result.get("title", "")
+        snippet = result.get("snippet", "")
+        
+        # Extract job_id from URL
+        match = re.search(r'/jobs/view/[^/]+-(\d+)', url)
+        if not match:
+            return None
+        job_id = match.group(1)
+        
+        # Don't add duplicates
+        if any(j["job_id"] == job_id for j in all_jobs):
+            return None
+        
+        # Structured fields parsed from the result title and snippet; the
+        # company the result was attributed to and the user's own filters
+        # are more reliable than guesses from free text
+        parsed = parse_search_result(result)
+        
+        job = {
+            "job_id": job_id,
+            "job_title": parsed["job_title"] or title,
+            "company_name": company or parsed["company_name"] or "Not specified",
+            "location": parsed["location"] or location or "Not specified",
+            "application_url": url,
+            "job_description": snippet,
+            "employment_type": self._filter(params, "job_type") or parsed["employment_type"] or "Not specified",
+            "work_arrangement": self._filter(params, "remote_option") or parsed["work_arrangement"] or "Not specified",
+            "experience_level": parsed["experience_level"] or "Not specified",
+            "salary_range": parsed["salary_range"] or "Not specified",
+            "date_posted": parsed["date_posted"] or "Recent",
+            "posting_age_days": parsed["posting_age_days"],
+            "is_repost": parsed["is_repost"],
+            "date_info_raw": parsed["date_info_raw"],
+            "applicant_count": parsed["applicant_count"],
+            "work_authorization": parsed["work_authorization"] or "Not specified",
+            "raw_title": title,
+            "source": "LinkedIn"
+        }
+        all_jobs.append(job)
+        return job
+
+    @staticmethod
+    def _filter(params: dict, key: str) -> Optional[str]:
+        """A search filter the user set, or None for empty and "Any" values"""
+        value = (params.get(key) or "").strip()
+        return None if value.lower() in ("", "any", "any time") else value
+
+
+# Shared instance, created on first access
+registry.register("search_linkedin_jobs_with_filters", LinkedInJobSearchTool)
 
 
-# Create instance for import
-search_linkedin_jobs_with_filters = LinkedInJobSearchTool()
+def __getattr__(name):
+    if name == "search_linkedin_jobs_with_filters":
+        return registry.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -1,5 +1,18 @@
 # Tools package for CrewAI project
+# Tool modules pull in crewai, so they are imported on first attribute access
 
-from .LinkedInJobSearchTool import search_linkedin_jobs_with_filters
+import importlib
 
-__all__ = ['search_linkedin_jobs_with_filters']
+_LAZY_ATTRS = {
+    'search_linkedin_jobs_with_filters': '.LinkedInJobSearchTool',
+    'LinkedInJobSearchTool': '.LinkedInJobSearchTool',
+    'RateLimitedSerperDevTool': '.serper_tool',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        return getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,237 @@
+"""
+LinkedIn Result Parser - Deterministic field extraction from Serper results
+Parses LinkedIn job result titles and snippets with precompiled patterns so
+structured fields are filled at scrape time instead of by an LLM pass
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+
+# "Google hiring Data Analyst in Mountain View, CA | LinkedIn"
+HIRING_TITLE_RE = re.compile(
+    r"^(?P<company>.+?)\s+hiring\s+(?P<title>.+?)(?:\s+in\s+(?P<location>[^|]+?))?\s*(?:[|\-–]\s*LinkedIn.*)?$",
+    re.IGNORECASE,
+)
+
+# "Data Analyst job at Google in Mountain View, CA"
+JOB_AT_TITLE_RE = re.compile(
+    r"^(?P<title>.+?)\s+(?:job\s+)?at\s+(?P<company>.+?)(?:\s+in\s+(?P<location>[^|]+?))?\s*(?:[|\-–]\s*LinkedIn.*)?$",
+    re.IGNORECASE,
+)
+
+# Separator of "Data Analyst - Google - Mountain View, CA" and "Data Analyst | Google"
+SEGMENT_SEPARATOR_RE = re.compile(r"\s+[|\-–]\s+")
+
+# Segments that name a place rather than a company: "Mountain View, CA", "Remote", "Greater Boston Area"
+LOCATION_SEGMENT_RE = re.compile(
+    r",\s*\w|\b(?:remote|hybrid|on[\s-]?site|united states|usa|metropolitan|area)\b",
+    re.IGNORECASE,
+)
+
+LINKEDIN_SUFFIX_RE = re.compile(r"\s*[|\-–]\s*LinkedIn\s*$", re.IGNORECASE)
+
+# "3 days ago", "Reposted 2 weeks ago", "Posted 5 hours ago", "1 mo ago"
+POSTING_AGE_RE = re.compile(
+    r"(?P<repost>Reposted\s+)?(?:Posted\s+)?(?P<count>\d+|an?|one)\s*"
+    r"(?P<unit>minute|min|hour|hr|day|week|wk|month|mo|year|yr)s?\s+ago",
+    re.IGNORECASE,
+)
+
+# "$120,000.00/yr - $150,000.00/yr", "$45/hr", "$120K - $150K", "$90,000 per year";
+# an amount alone ("$5 gift card") is not a salary
+SALARY_AMOUNT = r"\$\s?\d[\d,]*(?:\.\d+)?\s?[kK]?"
+SALARY_PERIOD = r"(?:\s?/\s?|\s+per\s+|\s+an?\s+)(?:yr|year|hr|hour|annum)\b"
+SALARY_RE = re.compile(
+    rf"{SALARY_AMOUNT}(?:{SALARY_PERIOD})?\s?(?:-|–|to)\s?{SALARY_AMOUNT}(?:{SALARY_PERIOD})?"
+    rf"|{SALARY_AMOUNT}{SALARY_PERIOD}",
+    re.IGNORECASE,
+)
+
+# "Be among the first 25 applicants", "Over 200 applicants", "57 applicants"
+APPLICANTS_RE = re.compile(r"(?:(?P<prefix>over|first)\s+)?(?P<count>\d[\d,]*)\+?\s+applicants", re.IGNORECASE)
+
+EMPLOYMENT_TYPE_RE = re.compile(r"\b(full[\s-]?time|part[\s-]?time|contract|internship|temporary)\b", re.IGNORECASE)
+WORK_ARRANGEMENT_RE = re.compile(r"\b(remote|hybrid|on[\s-]?site)\b", re.IGNORECASE)
+# Levels only count as "<level> level" or after "Seniority level", so
+# "report to the Director" is not an experience level
+EXPERIENCE_LEVEL_RE = re.compile(
+    r"\b(?:seniority|experience)\s+level:?\s+(entry[\s-]level|mid[\s-]senior(?:[\s-]level)?|associate|director|executive|internship)\b"
+    r"|\b(entry[\s-]level|mid[\s-]senior[\s-]level|associate[\s-]level|director[\s-]level|executive[\s-]level)\b",
+    re.IGNORECASE,
+)
+# OPT and CPT only in capitals, so "Opt out" is not a work authorization
+WORK_AUTHORIZATION_RE = re.compile(
+    r"\b(?:(?i:visa sponsorship|sponsorship|h-?1b|green card|us citizen(?:ship)?|security clearance)|OPT|CPT)\b"
+)
+
+AGE_UNIT_DAYS = {
+    "minute": 0, "min": 0,
+    "hour": 0, "hr": 0,
+    "day": 1,
+    "week": 7, "wk": 7,
+    "month": 30, "mo": 30,
+    "year": 365, "yr": 365,
+}
+
+EMPLOYMENT_TYPES = {
+    "fulltime": "Full-time",
+    "parttime": "Part-time",
+    "contract": "Contract",
+    "internship": "Internship",
+    "temporary": "Temporary",
+}
+
+WORK_ARRANGEMENTS = {
+    "remote": "Remote",
+    "hybrid": "Hybrid",
+    "onsite": "On-site",
+}
+
+EXPERIENCE_LEVELS = {
+    "entrylevel": "Entry level",
+    "midsenior": "Mid-Senior level",
+    "midseniorlevel": "Mid-Senior level",
+    "associate": "Associate",
+    "associatelevel": "Associate",
+    "director": "Director",
+    "directorlevel": "Director",
+    "executive": "Executive",
+    "executivelevel": "Executive",
+    "internship": "Internship",
+}
+
+
+def parse_title(title: str) -> Dict[str, Optional[str]]:
+    """
+    Split a LinkedIn result title into job title, company and location.
+
+    "<company> hiring <title>" is tried first, then dash or pipe separated
+    segments, and " at " last, since job titles themselves can contain
+    "at" ("Data at Scale").
+
+    Returns:
+        Dict with ``job_title``, ``company_name`` and ``location`` (None when absent)
+    """
+    title = (title or "").strip()
+    match = HIRING_TITLE_RE.match(title)
+    if match:
+        return _title_fields(match.group("title"), match.group("company"), match.group("location"))
+
+    # "Data Analyst - Google - Mountain View, CA": a trailing place is the location
+    segments = SEGMENT_SEPARATOR_RE.split(LINKEDIN_SUFFIX_RE.sub("", title))
+    location = segments.pop() if len(segments) >= 2 and LOCATION_SEGMENT_RE.search(segments[-1]) else None
+    if len(segments) >= 2:
+        # "Senior Data Scientist - Machine Learning - Google": the company comes last
+        return _title_fields(" - ".join(segments[:-1]), segments[-1], location)
+
+    match = JOB_AT_TITLE_RE.match(segments[0])
+    if match:
+        return _title_fields(match.group("title"), match.group("company"), match.group("location") or location)
+
+    return _title_fields(segments[0], None, location)
+
+
+def _title_fields(job_title: Optional[str], company: Optional[str], location: Optional[str]) -> Dict:
+    return {
+        "job_title": _clean(job_title),
+        "company_name": _clean(company),
+        "location": _clean(location),
+    }
+
+
+def parse_posting_age(text: str, now: Optional[datetime] = None) -> Dict:
+    """
+    Parse a relative posting age such as "3 days ago" or "Reposted 1 week ago".
+
+    Returns:
+        Dict with ``date_posted`` (YYYY-MM-DD or None), ``posting_age_days``,
+        ``is_repost`` and ``date_info_raw``
+    """
+    match = POSTING_AGE_RE.search(text or "")
+    if not match:
+        return {"date_posted": None, "posting_age_days": None, "is_repost": False, "date_info_raw": None}
+
+    count = match.group("count").lower()
+    count = 1 if count in ("a", "an", "one") else int(count)
+    age_days = count * AGE_UNIT_DAYS[match.group("unit").lower()]
+    posted = (now or datetime.now()) - timedelta(days=age_days)
+
+    return {
+        "date_posted": posted.strftime("%Y-%m-%d"),
+        "posting_age_days": age_days,
+        "is_repost": bool(match.group("repost")),
+        "date_info_raw": match.group(0),
+    }
+
+
+def parse_snippet(snippet: str, now: Optional[datetime] = None) -> Dict:
+    """
+    Extract posting age, salary, applicants and job attributes from a snippet.
+
+    Returns:
+        Dict of extracted fields; values are None when not mentioned
+    """
+    snippet = snippet or ""
+    fields = parse_posting_age(snippet, now)
+
+    salary = SALARY_RE.search(snippet)
+    fields["salary_range"] = salary.group(0).strip() if salary else None
+
+    applicants = APPLICANTS_RE.search(snippet)
+    if applicants:
+        count = applicants.group("count").replace(",", "")
+        prefix = (applicants.group("prefix") or "").lower()
+        fields["applicant_count"] = f"{count}+" if prefix == "over" else count
+    else:
+        fields["applicant_count"] = None
+
+    fields["employment_type"] = _lookup(EMPLOYMENT_TYPE_RE, snippet, EMPLOYMENT_TYPES)
+    fields["work_arrangement"] = _lookup(WORK_ARRANGEMENT_RE, snippet, WORK_ARRANGEMENTS)
+    fields["experience_level"] = _lookup(EXPERIENCE_LEVEL_RE, snippet, EXPERIENCE_LEVELS)
+
+    authorization = sorted({m.group(0) for m in WORK_AUTHORIZATION_RE.finditer(snippet)})
+    fields["work_authorization"] = ", ".join(authorization) if authorization else None
+
+    return fields
+
+
+def parse_search_result(result: Dict, now: Optional[datetime] = None) -> Dict:
+    """
+    Parse one Serper organic result for a LinkedIn job posting.
+
+    Serper sometimes reports the posting age in a separate ``date`` field,
+    which is used when the snippet does not mention it.
+
+    Args:
+        result: Serper organic result with ``title``, ``snippet`` and optional ``date``
+        now: Reference time for relative dates (defaults to the current time)
+
+    Returns:
+        Dict combining ``parse_title`` and ``parse_snippet`` fields
+    """
+    fields = parse_title(result.get("title", ""))
+    fields.update(parse_snippet(result.get("snippet", ""), now))
+
+    if fields["date_posted"] is None and result.get("date"):
+        fields.update(parse_posting_age(result["date"], now))
+
+    return fields
+
+
+def _lookup(pattern: re.Pattern, text: str, labels: Dict[str, str]) -> Optional[str]:
+    """Return the canonical label for the first pattern match in text"""
+    match = pattern.search(text)
+    if not match:
+        return None
+    value = next(group for group in match.groups() if group)
+    return labels.get(re.sub(r"[\s-]", "", value.lower()))
+
+
+def _clean(value: Optional[str]) -> Optional[str]:
+    """Strip whitespace and trailing separators from a captured group"""
+    if not value:
+        return None
+    value = LINKEDIN_SUFFIX_RE.sub("", value).strip(" |-–,")
+    return value or None
@@ -0,0 +1,106 @@
+"""
+Serper Query Planner - Batches several companies into one Serper query
+Combines companies with OR so broad searches need fewer API round trips,
+and attributes each result back to a company from its title and URL
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# Largest page Serper returns for one query
+MAX_RESULTS_PER_CALL = 100
+
+
+class SerperQueryPlanner:
+    """
+    Plans Serper queries for a LinkedIn job search over a list of companies.
+
+    Companies are grouped into batches of ``batch_size`` and searched with a
+    single query such as ``("Google" OR "Amazon" OR ...)`` that asks for
+    ``results_per_query`` results per company. Only when that query is
+    saturated (it filled the whole page, so hits may have been cut off) are
+    the companies that got no results searched again on their own.
+    """
+
+    def __init__(self, job_title: str, location: str = "", batch_size: int = 5,
+                 results_per_query: int = 10):
+        """
+        Args:
+            job_title: Job title to search for
+            location: Optional location appended to every query
+            batch_size: Maximum number of companies combined into one query
+            results_per_query: Number of results requested per company
+        """
+        self.job_title = job_title
+        self.location = location
+        self.batch_size = max(1, batch_size)
+        self.results_per_query = results_per_query
+
+    def plan(self, companies: List[str]) -> List[List[str]]:
+        """Split the company list into query batches, preserving order"""
+        return [
+            companies[i:i + self.batch_size]
+            for i in range(0, len(companies), self.batch_size)
+        ]
+
+    def build_query(self, companies: List[str]) -> str:
+        """Build the Serper query for one batch of companies"""
+        if len(companies) == 1:
+            company_clause = companies[0]
+        else:
+            company_clause = "(" + " OR ".join(f'"{c}"' for c in companies) + ")"
+
+        query = f'site:linkedin.com/jobs/view "{self.job_title}" {company_clause}'
+        if self.location:
+            query += f' {self.location}'
+        return query
+
+    def num_results(self, companies: List[str]) -> int:
+        """Results to request for a batch (Serper returns at most 100 per call)"""
+        return min(MAX_RESULTS_PER_CALL, self.results_per_query * len(companies))
+
+    def is_saturated(self, results: List[Dict], companies: List[str]) -> bool:
+        """A combined query is saturated when it returned a full page of results"""
+        return len(companies) > 1 and len(results) >= self.num_results(companies)
+
+    def fallback(self, results: List[Dict], companies: List[str]) -> List[List[str]]:
+        """
+        Per-company batches to search after a combined query.
+
+        Returns:
+            One batch per company without an attributed result, when the
+            combined query was saturated; otherwise no batches
+        """
+        if not self.is_saturated(results, companies):
+            return []
+        found = {self.attribute(result, companies) for result in results}
+        return [[company] for company in companies if company not in found]
+
+    def attribute(self, result: Dict, companies: List[str]) -> Optional[str]:
+        """
+        Attribute a search result to one of the batch companies.
+
+        LinkedIn job URLs end in ``<title>-at-<company>-<id>`` and result titles
+        look like ``"<Company> hiring <Title> in <Location> | LinkedIn"``, so the
+        URL slug is checked first and the title second.
+
+        Returns:
+            The matching company name, or None if no company could be matched
+        """
+        url = result.get("link", "").lower()
+        title = result.get("title", "")
+
+        for company in companies:
+            if f"-at-{_slugify(company)}-" in url:
+                return company
+
+        for company in companies:
+            if re.search(rf"\b{re.escape(company)}\b", title, re.IGNORECASE):
+                return company
+
+        return None
+
+
+def _slugify(name: str) -> str:
+    """Convert a company name to the slug LinkedIn uses in job URLs"""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
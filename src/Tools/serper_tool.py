@@ -0,0 +1,52 @@
+"""
+Rate-limited SerperDev tool used by every crew agent that searches the web
+Requests go through utils.http_replay, so they can be recorded, replayed
+offline or sent to the local stand-in server via SERPER_BASE_URL. Results are
+returned to the agent as minified JSON within its token budget
+"""
+
+import os
+
+from crewai_tools import SerperDevTool
+
+from utils.http_replay import http_request, serper_url
+from utils.lazy_registry import load_env
+from utils.token_budget import SERPER_UNUSED_FIELDS, budget_for, fit_json
+
+
+class RateLimitedSerperDevTool(SerperDevTool):
+    """SerperDevTool that waits for the shared Serper budget before each search"""
+
+    token_budget: int = 0  # Max tokens of a result returned to the agent (0 = TOKEN_BUDGET)
+
+    def _run(self, **kwargs) -> str:
+        """Search, then drop unused fields and fit the results into the token budget"""
+        return fit_json(super()._run(**kwargs), self.token_budget or budget_for(), drop=SERPER_UNUSED_FIELDS)
+
+    def _make_api_request(self, search_query: str, search_type: str) -> dict:
+        """Send the Serper request through the rate limiter and record/replay layer"""
+        payload = {"q": search_query, "num": self.n_results}
+        if getattr(self, "country", ""):
+            payload["gl"] = self.country
+        if getattr(self, "location", ""):
+            payload["location"] = self.location
+        if getattr(self, "locale", ""):
+            payload["hl"] = self.locale
+
+        load_env()
+        response = http_request(
+            "POST",
+            serper_url(search_type),
+            provider="serper",
+            headers={
+                "X-API-KEY": os.getenv("SERPER_API_KEY", ""),
+                "Content-Type": "application/json"
+            },
+            json_body=payload,
+            timeout=15
+        )
+        response.raise_for_status()
+        results = response.json()
+        if not results:
+            raise ValueError("Empty response from Serper API")
+        return results
@@ -11,6 +11,7 @@ import os
 # Add the parent directory to the Python path to import crew
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from crew import JobResearchCrew
+from utils.input_parser import parse_dashboard_input
 
 class WorkflowController:
     """
@@ -46,8 +47,13 @@ class WorkflowController:
     
     def _analyze_user_input(self, user_input: str, location: str = None) -> Dict[str, Any]:
         """
-        Use dashboard_input_catcher agent to analyze user input
+        Analyze user input with the rule-based parser, falling back to the
+        dashboard_input_catcher agent when the parser is not confident
         """
+        parsed = parse_dashboard_input(user_input, location)
+        if parsed:
+            return parsed
+
         # Create input analysis task
         analysis_task = self.crew.dashboard_input_processing_task()
         
@@ -174,10 +180,10 @@ def example_usage():
     """
     Example of how to use the WorkflowController
     """
-    from crewai import LLM
+    from utils.llm_client import create_llm
     
     # Initialize LLM using CrewAI (replace with your preferred configuration)
-    llm = LLM(model="gpt-4", api_key=os.getenv("OPENAI_API_KEY"))
+    llm = create_llm(model="gpt-4", api_key=os.getenv("OPENAI_API_KEY"))
     
     # Create workflow controller
     controller = WorkflowController(llm)
@@ -3,13 +3,20 @@ CrewAI Job Search Assistant - AI-Powered Job Search Platform
 Main entry point for the multipage app with integrated CrewAI agents and tasks
 """
 
+import importlib
+
 import streamlit as st
-from streamlit_pages.home import home_page
-from streamlit_pages.info_page import info_page
-from streamlit_pages.analytics import analytics_page
-from streamlit_pages.specific_jobs import specific_jobs_page
-from streamlit_pages.resume_prep import resume_prep_page
-from streamlit_pages.job_search import job_search_page  # Added missing import for Career Research page
+
+# Route table: ?page=<name> -> (module, render function)
+# A page module (and its crewai / plotly / PyPDF2 imports) is only loaded
+# when that page is routed to, so the first render of Home stays cheap
+PAGES = {
+    "home": ("streamlit_pages.home", "home_page"),
+    "job_search": ("streamlit_pages.job_search", "job_search_page"),  # Career Research
+    "info_page": ("streamlit_pages.info_page", "info_page"),  # Legacy info page (alternate research interface)
+    "Specific_Jobs": ("streamlit_pages.specific_jobs", "specific_jobs_page"),
+    "Resume_Prep": ("streamlit_pages.resume_prep", "resume_prep_page"),
+}
 
 # Configure the main app
 st.set_page_config(
@@ -99,19 +106,10 @@ with st.sidebar:
 
 # Page routing function
 def route_to_page():
-    """Route to the appropriate page based on URL parameter"""
-    if current_page == "job_search":
-        # Career Research restored
-        job_search_page()
-    elif current_page == "info_page":
-        # Legacy info page (alternate research interface)
-        info_page()
-    elif current_page == "Specific_Jobs":
-        specific_jobs_page()
-    elif current_page == "Resume_Prep":
-        resume_prep_page()
-    else:  # Default to home
-        home_page()
+    """Route to the appropriate page based on URL parameter, importing it on demand"""
+    module_name, function_name = PAGES.get(current_page, PAGES["home"])  # Default to home
+    page = getattr(importlib.import_module(module_name), function_name)
+    page()
 
 # Add some shared styling and header
 st.markdown("""
@@ -0,0 +1,195 @@
+"""
+Batch Search - Headless multi-title LinkedIn search runner
+Runs LinkedInSearchCrew.search_jobs for a list of (title, location, filters)
+across a process pool. Every search gets its own session directory, all
+workers share one LLM/Serper rate budget, and a summary manifest is written
+at the end
+
+Usage (from the repository root):
+    python src/batch_search.py searches.json --workers 8
+    python src/batch_search.py searches.csv
+    python src/batch_search.py --titles "Data Analyst;Nurse;Software Engineer" --location "Austin, TX"
+
+searches.json is a list of objects:
+    [{"job_title": "Data Analyst", "location": "Austin, TX", "job_type": "Full-time"}, ...]
+CSV files use the same keys as column headers.
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from utils.json_manager import SearchResultsManager
+
+BATCH_DIR = "src/outputs/batch"
+FILTER_KEYS = ("company", "job_type", "remote_option", "date_posted", "work_authorization")
+
+
+def load_searches(path: str) -> List[Dict]:
+    """
+    Read search specs from a JSON list or a CSV file.
+
+    Returns:
+        List of dicts with job_title, location and filter keys
+
+    Raises:
+        ValueError: If an entry has no job_title
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, newline='', encoding='utf-8') as f:
+            searches = [dict(row) for row in csv.DictReader(f)]
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            searches = json.load(f)
+
+    for index, search in enumerate(searches):
+        if not (search.get("job_title") or "").strip():
+            raise ValueError(f"Search #{index + 1} in {path} has no job_title")
+    return searches
+
+
+def run_search(search: Dict, use_cache: bool = False) -> Dict:
+    """
+    Run one search in a pool worker.
+
+    Args:
+        search: job_title, optional location and filter keys
+        use_cache: Reuse a cached crew run instead of refreshing it
+
+    Returns:
+        Manifest entry with status, session and timing (errors are captured)
+    """
+    from Crew.linkedin_search_crew import LinkedInSearchCrew
+    from utils.llm_client import create_llm
+    from utils.search_session import SearchSession
+
+    filters = {key: search[key] for key in FILTER_KEYS if search.get(key)}
+    entry = {
+        "job_title": search["job_title"],
+        "location": search.get("location", ""),
+        "filters": filters,
+        "pid": os.getpid(),
+    }
+    start = time.time()
+    session = SearchSession.create(search_params={
+        "job_title": entry["job_title"], "location": entry["location"], **filters
+    })
+    entry.update(session_id=session.session_id, output_dir=session.output_dir)
+
+    try:
+        llm = create_llm(model="gpt-4o-mini", temperature=0.7)
+        LinkedInSearchCrew(llm=llm, session=session).search_jobs(
+            entry["job_title"], entry["location"], use_cache=use_cache, **filters
+        )
+        entry["status"] = "completed"
+    except Exception as e:
+        entry.update(status="failed", error=f"{type(e).__name__}: {e}")
+    entry["duration_s"] = round(time.time() - start, 3)
+    return entry
+
+
+def run_batch(searches: List[Dict], workers: Optional[int] = None, use_cache: bool = False,
+              rate_limit_dir: Optional[str] = None) -> Dict:
+    """
+    Run searches across a process pool and write the batch manifest.
+
+    All workers share the token buckets in ``rate_limit_dir`` (see
+    utils.rate_limiter), so adding workers raises throughput until the
+    provider budgets are the bottleneck.
+
+    Args:
+        searches: Search specs (see load_searches)
+        workers: Pool size (defaults to the CPU count, capped at the batch size)
+        use_cache: Reuse cached crew runs instead of refreshing them
+        rate_limit_dir: Shared rate-limit state directory (defaults to
+                        RATE_LIMIT_STATE_DIR, then a directory for this batch)
+
+    Returns:
+        The manifest dict (also saved under src/outputs/batch/)
+    """
+    batch_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+    workers = max(1, min(workers or os.cpu_count() or 1, len(searches)))
+
+    # Children inherit the environment, so every worker uses the same buckets
+    rate_limit_dir = rate_limit_dir or os.getenv("RATE_LIMIT_STATE_DIR") or os.path.join(
+        BATCH_DIR, batch_id, "rate_limits")
+    os.environ["RATE_LIMIT_STATE_DIR"] = os.path.abspath(rate_limit_dir)
+
+    print(f"🗂️ Batch {batch_id}: {len(searches)} searches on {workers} worker process(es)")
+    started_at = datetime.now().isoformat()
+    start = time.time()
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = {pool.submit(run_search, search, use_cache): search for search in searches}
+        for future in as_completed(futures):
+            try:
+                entry = future.result()
+            except Exception as e:  # worker process died
+                search = futures[future]
+                entry = {"job_title": search["job_title"], "location": search.get("location", ""),
+                         "status": "failed", "error": f"{type(e).__name__}: {e}"}
+            results.append(entry)
+            icon = "✅" if entry["status"] == "completed" else "❌"
+            print(f"{icon} [{len(results)}/{len(searches)}] {entry['job_title']}"
+                  f"{' in ' + entry['location'] if entry.get('location') else ''}"
+                  f" ({entry.get('duration_s', 0):.1f}s){' - ' + entry['error'] if entry.get('error') else ''}")
+
+    wall_time = time.time() - start
+    completed = sum(1 for entry in results if entry["status"] == "completed")
+    manifest = {
+        "batch_id": batch_id,
+        "started_at": started_at,
+        "finished_at": datetime.now().isoformat(),
+        "workers": workers,
+        "use_cache": use_cache,
+        "rate_limit_state_dir": os.environ["RATE_LIMIT_STATE_DIR"],
+        "wall_time_s": round(wall_time, 3),
+        "searches_per_minute": round(len(results) / wall_time * 60, 2) if wall_time else None,
+        "totals": {"searches": len(results), "completed": completed, "failed": len(results) - completed},
+        "searches": sorted(results, key=lambda entry: (entry["job_title"], entry.get("location", ""))),
+    }
+
+    os.makedirs(BATCH_DIR, exist_ok=True)
+    manifest_path = os.path.join(BATCH_DIR, f"batch_{batch_id}.json")
+    SearchResultsManager._write_json_atomic(manifest_path, manifest)
+    print(f"📋 {completed}/{len(results)} searches completed in {wall_time:.1f}s "
+          f"({manifest['searches_per_minute']}/min). Manifest: {manifest_path}")
+    return manifest
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="Run many LinkedIn searches across a process pool")
+    parser.add_argument("searches", nargs="?", help="JSON or CSV file of searches")
+    parser.add_argument("--titles", help="Semicolon-separated job titles (alternative to a file)")
+    parser.add_argument("--location", default="", help="Location for --titles searches")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--use-cache", action="store_true", help="Reuse cached runs instead of refreshing them")
+    parser.add_argument("--rate-limit-dir", default=None, help="Shared rate-limit state directory")
+    args = parser.parse_args()
+
+    if args.searches:
+        searches = load_searches(args.searches)
+    elif args.titles:
+        searches = [{"job_title": title.strip(), "location": args.location}
+                    for title in args.titles.split(";") if title.strip()]
+    else:
+        parser.error("Give a searches file or --titles")
+
+    manifest = run_batch(searches, workers=args.workers, use_cache=args.use_cache,
+                         rate_limit_dir=args.rate_limit_dir)
+    sys.exit(0 if manifest["totals"]["failed"] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
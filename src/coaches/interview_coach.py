@@ -2,15 +2,22 @@
 Interview Coach - Multi-Category Resume-Aware Interview Guide
 Generates questions across multiple categories (General / Industry / Competency / Admissions / Government / Veterans)
 and outputs personalized sample answers based on the candidate's resume + job description.
+Each category is a separate prompt sharing the job/resume prefix; categories are generated
+concurrently (INTERVIEW_CONCURRENCY, default 4) and assembled in order.
 """
 
+import contextvars
 import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from crewai import LLM
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from utils.crew_metrics import track_llm_calls
+from utils.llm_client import create_llm, call_llm, OrderedStream
+from utils.skill_matcher import required_skills
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 JOB_DATA_PATH = BASE_DIR / "outputs" / "lead_research_analyst" / "research_data.json"
@@ -34,16 +41,70 @@ def load_updated_resume():
         return f.read()
 
 
-def build_prompt(job_data, resume_text):
-    """Generate prompt to produce multi-category interview prep."""
+# One independent prompt per guide section: (heading, requested content)
+CATEGORIES = [
+    ("1. General Interview Questions",
+     "(These cover 80% of standard interview questions.)\n"
+     "Provide:\n- **10 questions**\n- 1-sentence **Answering Framework**\n- **Personalized Sample Answer**"),
+    ("2. Industry-Specific Questions",
+     "(Tailored to the exact job title + industry.)\n"
+     "Provide:\n- **8 questions**\n- Framework + Personalized Sample Answer"),
+    ("3. Competency / Skillset Questions",
+     "(Assess soft skills + technical competencies.)\n"
+     "Provide:\n- **8 questions**\n- Use STAR where appropriate\n- Framework + Personalized Sample Answer"),
+    ("4. Admissions-Style Questions",
+     "(If the candidate might apply for grad programs, fellowships, or research roles.)\n"
+     "Provide:\n- **6 questions**\n- Framework + Personalized Sample Answer"),
+    ("5. Government / Policy Questions",
+     "(If the job touches public data, compliance, ethics, policy, privacy, or regulation.)\n"
+     "Provide:\n- **5 questions**\n- Framework + Personalized Sample Answer"),
+    ("6. Veterans / Career Transition Questions",
+     "(General career transition questions that apply to ANYONE switching fields.)\n"
+     "Provide:\n- **5 questions**\n- Framework + Personalized Sample Answer"),
+    ("Questions to Ask the Interviewer",
+     "Provide **8 thoughtful, high-quality questions** tailored to the job and resume."),
+]
+
+# Sections generated at the same time, and attempts per section
+MAX_CONCURRENCY = int(os.getenv("INTERVIEW_CONCURRENCY", "4"))
+MAX_ATTEMPTS = 3
+
+
+# Static system message, identical for every candidate and section, so it
+# heads every prompt and the provider can cache it
+COACH_INSTRUCTIONS = """
+You are a highly experienced Interview Coach preparing an interview prep guide for a candidate.
+All answers must be personalized to the candidate's resume and aligned with the job,
+both given in the user message. Write only the section of the guide you are asked for.
+
+📌 FORMAT REQUIREMENTS
+Return clean Markdown, starting with the section heading:
+
+## <Section heading>
+### Question 1
+**Framework:**
+**Answer:** (personalized using resume)
+
+Do NOT shorten. Make answers realistic, polished, and job-aligned.
+"""
+
+
+def build_context(job_data, resume_text):
+    """
+    Job and resume data shared by every section.
+
+    It follows the static system message and precedes the section request,
+    so the concurrent section calls share one cacheable prompt prefix.
+    """
     job_title = job_data.get("job_title", "Data Scientist")
     job_description = job_data.get("job_description", "")
-    skills = ", ".join(job_data.get("required_skills", []))
+    skills = ", ".join(required_skills(job_data))
 
     return f"""
-You are a highly experienced Interview Coach. Prepare a full interview prep guide for a candidate applying for **{job_title}**.
-
 =============================
+📌 TARGET ROLE
+{job_title}
+
 📌 JOB DESCRIPTION
 {job_description}
 
@@ -53,84 +114,77 @@ You are a highly experienced Interview Coach. Prepare a full interview prep guid
 📌 UPDATED RESUME
 {resume_text}
 =============================
-
-Generate a **comprehensive interview guide**, with all answers personalized to this resume.
-
-The guide must include **six categories**:
-
----
-
-# 1. GENERAL INTERVIEW QUESTIONS  
-(These cover 80% of standard interview questions.)  
-Provide:  
-- **10 questions**  
-- 1-sentence **Answering Framework**  
-- **Personalized Sample Answer**  
-
----
-
-# 2. INDUSTRY-SPECIFIC QUESTIONS  
-(Tailored to the exact job title + industry.)  
-Provide:  
-- **8 questions**  
-- Framework + Personalized Sample Answer  
-
----
-
-# 3. COMPETENCY / SKILLSET QUESTIONS  
-(Assess soft skills + technical competencies.)  
-Provide:  
-- **8 questions**  
-- Use STAR where appropriate  
-- Framework + Personalized Sample Answer  
-
----
-
-# 4. ADMISSIONS-STYLE QUESTIONS  
-(If the candidate might apply for grad programs, fellowships, or research roles.)  
-Provide:  
-- **6 questions**  
-- Framework + Personalized Sample Answer  
-
----
-
-# 5. GOVERNMENT / POLICY QUESTIONS  
-(If the job touches public data, compliance, ethics, policy, privacy, or regulation.)  
-Provide:  
-- **5 questions**  
-- Framework + Personalized Sample Answer  
-
----
-
-# 6. VETERANS / CAREER TRANSITION QUESTIONS  
-(General career transition questions that apply to ANYONE switching fields.)  
-Provide:  
-- **5 questions**  
-- Framework + Personalized Sample Answer  
-
----
-
-# Final Section: QUESTIONS TO ASK THE INTERVIEWER  
-Provide **8 thoughtful, high-quality questions** tailored to the job and resume.
-
----
-
-📌 FORMAT REQUIREMENTS  
-Return the final output in clean Markdown:
-
-## Category Name
-### Question 1
-**Framework:**  
-**Answer:** (personalized using resume)
-
-Do NOT shorten. Make answers realistic, polished, and job-aligned.
 """
 
-def run_llm(prompt):
-    """Run LLM through CrewAI."""
-    llm = LLM(model="gpt-4o-mini", temperature=0.7)
-    print("🤖 Generating categorized interview guide...")
-    return llm.call(prompt)
+
+def build_category_prompt(context, heading, instructions):
+    """Chat messages for one section of the guide (the section request comes last)."""
+    return [
+        {"role": "system", "content": COACH_INSTRUCTIONS},
+        {"role": "user", "content": f"""{context}
+Write only this section of the interview guide:
+
+# {heading}
+{instructions}
+"""},
+    ]
+
+
+def generate_category(index, messages, stream):
+    """Generate one section, retrying only this section on failure."""
+    heading = CATEGORIES[index][0]
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        stream.restart(index)
+        try:
+            # Unchanged resume + research data reuse the cached section
+            llm = create_llm(model="gpt-4o-mini", temperature=0.7, cache_sampled=True,
+                             stream=stream.on_token is not None)
+            on_token = (lambda chunk: stream.chunk(index, chunk)) if stream.on_token else None
+            return call_llm(llm, messages, on_token), None
+        except Exception as e:
+            print(f"⚠️ '{heading}' failed (attempt {attempt}/{MAX_ATTEMPTS}): {e}")
+            if attempt < MAX_ATTEMPTS:
+                time.sleep(2 ** attempt)
+            error = e
+    return f"## {heading}\n\n_⚠️ This section could not be generated: {error}_", heading
+
+
+def run_llm(job_data, resume_text, on_token=None):
+    """
+    Generate all sections concurrently and assemble them in order.
+
+    Args:
+        job_data: Job research data
+        resume_text: Updated resume
+        on_token: Optional callback receiving the guide text in order as it
+                  is generated, always on the calling thread (a section retried after streaming part of
+                  its answer can leave that partial text in the stream; the
+                  returned guide is always complete)
+
+    Returns:
+        (markdown guide, list of section headings that failed every attempt)
+    """
+    context = build_context(job_data, resume_text)
+    stream = OrderedStream(len(CATEGORIES), on_token)
+    sections = [None] * len(CATEGORIES)
+    failed = []
+    print(f"🤖 Generating {len(CATEGORIES)} interview guide sections ({MAX_CONCURRENCY} at a time)...")
+
+    with ThreadPoolExecutor(max_workers=max(1, MAX_CONCURRENCY)) as pool:
+        futures = {
+            # Each worker runs in a copy of this context so its LLMs count toward the coach's metrics
+            pool.submit(contextvars.copy_context().run, generate_category, index,
+                        build_category_prompt(context, heading, instructions), stream): index
+            for index, (heading, instructions) in enumerate(CATEGORIES)
+        }
+        for future in stream.as_completed(futures):
+            index = futures[future]
+            sections[index], failed_heading = future.result()
+            if failed_heading:
+                failed.append(failed_heading)
+            stream.finish(index, sections[index])
+
+    return "\n\n".join(sections), failed
 
 
 def write_output(content):
@@ -140,18 +194,24 @@ def write_output(content):
     return str(OUT_PATH)
 
 
-def run_interview_coach():
-    """Main workflow."""
+def run_interview_coach(on_token=None):
+    """
+    Main workflow.
+
+    Args:
+        on_token: Optional callback receiving the guide text chunk by chunk
+    """
     job_data = load_job_data()
     resume_text = load_updated_resume()
-    prompt = build_prompt(job_data, resume_text)
-
-    result = run_llm(prompt)
+    with track_llm_calls("interview_coach"):
+        result, failed = run_llm(job_data, resume_text, on_token)
     path = write_output(result)
 
     return {
         "guide_path": str(path),
-        "message": "✅ Multi-category interview guide created!",
+        "message": "✅ Multi-category interview guide created!"
+                   if not failed else f"⚠️ Interview guide created without: {', '.join(failed)}",
+        "failed_sections": failed,
         "preview": result[:700] + "..."
     }
 
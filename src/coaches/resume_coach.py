@@ -5,14 +5,15 @@ Supports .pdf and .txt resume files
 
 import json
 import os
-import re
+import sys
 from pathlib import Path
-from crewai import LLM
-from dotenv import load_dotenv
-import PyPDF2  # PDF support
 
-# Load environment variables
-load_dotenv()
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from utils.crew_metrics import track_llm_calls
+from utils.llm_client import create_llm, call_llm
+from utils.pdf_extract import extract_pdf_text, file_hash
+from utils.skill_matcher import SkillMatcher, TokenIndex, required_skills
+from coaches.resume_sections import rewrite_sections
 
 # Paths
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -25,29 +26,8 @@ OUT_DIR.mkdir(exist_ok=True)
 # PDF Text Extraction
 # --------------------------
 def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extracts text from a PDF file safely."""
-    text = ""
-    try:
-        with open(pdf_path, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            for page in reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted + "\n"
-    except Exception as e:
-        raise RuntimeError(f"❌ Failed to read PDF file: {e}")
-    return text
-
-
-# --------------------------
-# Utility Functions
-# --------------------------
-def normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip()).lower()
-
-
-def contains(word: str, text: str) -> bool:
-    return normalize(word) in normalize(text)
+    """Extracts text from a PDF file (cached by file content)."""
+    return extract_pdf_text(pdf_path)
 
 
 # --------------------------
@@ -61,6 +41,16 @@ def load_job_data():
         return json.load(f)
 
 
+def resume_run_key(resume_bytes: bytes) -> str:
+    """
+    Identify a resume coach run by its inputs: the uploaded file content
+    and the job research data. Same key -> same rewrite.
+    """
+    research_path = DATA_DIR / "research_data.json"
+    research = research_path.read_bytes() if research_path.exists() else b""
+    return f"{file_hash(resume_bytes)[:16]}-{file_hash(research)[:16]}"
+
+
 # --------------------------
 # Load Resume (PDF / TXT)
 # --------------------------
@@ -89,27 +79,33 @@ def load_resume_text(uploaded_resume_path=None):
 # Missing Skills Detection
 # --------------------------
 def find_missing_skills(job_data, resume_text):
-    return [
-        s for s in job_data.get("required_skills", [])
-        if not contains(s, resume_text)
-    ]
+    # One token index of the resume; skills and synonyms are set lookups
+    return SkillMatcher(required_skills(job_data)).missing(TokenIndex(resume_text))
 
 
 # --------------------------
 # LLM Prompt Construction
 # --------------------------
 def build_improvement_prompt(job_data, resume_text, missing_skills):
+    """
+    Full-rewrite prompt. The static instructions come first and the per-user
+    data last (job, then resume) so the provider can cache the shared prefix.
+    """
     job_title = job_data.get("job_title", "the target role")
     job_description = job_data.get("job_description", "")
-    skills = ", ".join(job_data.get("required_skills", []))
+    skills = ", ".join(required_skills(job_data))
 
     prompt = f"""
-You are an expert resume editor. The user is applying for **{job_title}**.
+You are an expert resume editor. Rewrite the user's resume for the job below to:
+1. Add missing but relevant skills naturally.
+2. Quantify achievements (numbers, metrics).
+3. Improve clarity, structure, and professional tone.
+4. Keep the resume honest — do not invent fake experience.
+5. Return the improved resume in clean markdown format.
 
-Here is their current resume:
----
-{resume_text}
----
+Only output the rewritten resume — no explanation.
+
+Target role: **{job_title}**
 
 Job Description:
 {job_description}
@@ -117,14 +113,10 @@ Job Description:
 Key required skills: {skills}
 Missing skills: {', '.join(missing_skills) if missing_skills else 'None'}
 
-Rewrite the resume to:
-1. Add missing but relevant skills naturally.
-2. Quantify achievements (numbers, metrics).
-3. Improve clarity, structure, and professional tone.
-4. Keep the resume honest — do not invent fake experience.
-5. Return the improved resume in clean markdown format.
-
-Only output the rewritten resume — no explanation.
+Here is their current resume:
+---
+{resume_text}
+---
 """
     return prompt
 
@@ -142,24 +134,38 @@ def write_updated_resume(text):
 # --------------------------
 # Main Entry Point
 # --------------------------
-def run_resume_coach(uploaded_resume_path=None):
-    """Full pipeline for resume improvement"""
+def run_resume_coach(uploaded_resume_path=None, on_token=None):
+    """
+    Full pipeline for resume improvement
+
+    Args:
+        uploaded_resume_path: Resume file (defaults to data/user_resume.txt)
+        on_token: Optional callback receiving the rewritten resume chunk by chunk
+    """
 
     job_data = load_job_data()
     resume_text = load_resume_text(uploaded_resume_path)
     missing_skills = find_missing_skills(job_data, resume_text)
 
-    prompt = build_improvement_prompt(job_data, resume_text, missing_skills)
+    with track_llm_calls("resume_coach"):
+        # Rewrite only the sections with missing skills or weak metrics
+        improved_resume, report = rewrite_sections(job_data, resume_text, missing_skills, on_token)
+
+        if improved_resume is None:
+            # No recognisable sections: fall back to a full rewrite
+            prompt = build_improvement_prompt(job_data, resume_text, missing_skills)
 
-    # Use CrewAI's LLM
-    llm = LLM(model="gpt-4o-mini", temperature=0.7)
-    print("🤖 Improving resume with AI...")
-    improved_resume = llm.call(prompt)
+            # Use CrewAI's LLM (same resume + job data -> same rewrite, so sampled outputs are cached)
+            llm = create_llm(model="gpt-4o-mini", temperature=0.7, cache_sampled=True, stream=on_token is not None)
+            print("🤖 Improving resume with AI...")
+            improved_resume = call_llm(llm, prompt, on_token)
 
     path = write_updated_resume(improved_resume)
 
     return {
         "missing_skills": missing_skills,
+        "rewritten_sections": [section["kind"] for section in report["sections"] if section["rewritten"]],
+        "failed_sections": [section["kind"] for section in report["sections"] if section.get("failed")],
         "updated_resume_path": str(path),
         "preview": improved_resume[:800] + "..."
     }
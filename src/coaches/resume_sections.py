@@ -0,0 +1,220 @@
+"""
+Resume Sections - Split a resume into sections and rewrite only the ones that need it
+Sections (summary, skills, experience, projects, ...) are found by their headings
+and fingerprinted with a content hash. Only the skills section (when skills are
+missing) and experience/project sections whose bullets lack metrics are sent to
+the LLM; everything else is kept verbatim and the resume is merged back together.
+"""
+
+import contextvars
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.llm_client import create_llm, call_llm, OrderedStream
+
+# Section kind -> heading variants (matched case-insensitively on their own line,
+# or in capitals inside text flattened by PDF extraction)
+SECTION_HEADINGS = {
+    "summary": ["PROFESSIONAL SUMMARY", "SUMMARY", "PROFILE", "OBJECTIVE", "ABOUT ME"],
+    "skills": ["TECHNICAL SKILLS", "SKILLS & INTERESTS", "SKILLS AND INTERESTS", "SKILLS", "CORE COMPETENCIES"],
+    "experience": ["PROFESSIONAL EXPERIENCE", "WORK EXPERIENCE", "EXPERIENCE", "EMPLOYMENT HISTORY", "EMPLOYMENT"],
+    "projects": ["ACADEMIC PROJECTS", "PROJECTS"],
+    "education": ["EDUCATION"],
+    "certifications": ["CERTIFICATIONS", "CERTIFICATES"],
+}
+METRIC_KINDS = ("experience", "projects")
+
+# A bullet is quantified when it has a percentage, an amount or a number that is not a year
+METRIC_RE = re.compile(r"[%$€£]|\b(?!(?:19|20)\d{2}\b)\d+(?:[.,]\d+)?\b")
+# Bullets start a line with -, *, • or sit inline after the "l" glyph PDF extraction leaves
+BULLET_RE = re.compile(r"(?m)^\s*(?:[-*•▪●]|l(?=\s))\s+|\s(?:[•▪●]|l)\s+")
+# Share of unquantified bullets that flags a section for a metrics rewrite
+WEAK_METRICS_THRESHOLD = 0.5
+MAX_CONCURRENCY = 4
+
+
+def _heading_patterns():
+    variants = sorted(
+        ((variant, kind) for kind, names in SECTION_HEADINGS.items() for variant in names),
+        key=lambda item: -len(item[0])
+    )
+    alternation = "|".join(re.escape(variant) for variant, _ in variants)
+    line_re = re.compile(rf"(?im)^[ \t#*]*({alternation})[ \t*]*:?[ \t*]*$")
+    inline_re = re.compile(rf"(?<![A-Za-z&])({alternation})(?![A-Za-z])")
+    return line_re, inline_re, {variant.upper(): kind for variant, kind in variants}
+
+
+LINE_HEADING_RE, INLINE_HEADING_RE, HEADING_KINDS = _heading_patterns()
+
+
+def section_hash(text: str) -> str:
+    """Content hash of a section body, insensitive to whitespace changes"""
+    return hashlib.sha256(re.sub(r"\s+", " ", text.strip()).encode("utf-8")).hexdigest()[:12]
+
+
+def parse_sections(resume_text: str):
+    """
+    Split a resume into sections.
+
+    Headings on their own line are preferred; text flattened to a single
+    line (typical for PDF extraction) falls back to capitalised headings.
+
+    Returns:
+        List of {"kind", "heading", "heading_text", "body", "hash"}, where
+        heading_text is the heading as written (e.g. "## Skills:"); text
+        before the first heading is a "header" section (name, contact details)
+    """
+    matches = list(LINE_HEADING_RE.finditer(resume_text))
+    if len(matches) < 2:
+        matches = list(INLINE_HEADING_RE.finditer(resume_text))
+
+    sections = []
+    header = resume_text[:matches[0].start()] if matches else resume_text
+    if header.strip():
+        sections.append({"kind": "header", "heading": "", "heading_text": "", "body": header.strip()})
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(resume_text)
+        heading = match.group(1)
+        sections.append({
+            "kind": HEADING_KINDS[heading.upper()],
+            "heading": heading.strip(),
+            "heading_text": match.group(0).strip(),
+            "body": resume_text[match.end():end].strip(),
+        })
+    for section in sections:
+        section["hash"] = section_hash(section["body"])
+    return sections
+
+
+def split_bullets(body: str):
+    """Bullet points of a section body (lines starting with -, *, • or the PDF 'l' glyph)"""
+    return [bullet.strip() for bullet in BULLET_RE.split(body)[1:] if bullet.strip()]
+
+
+def has_weak_metrics(section) -> bool:
+    """Whether most bullets of an experience/project section have no numbers"""
+    if section["kind"] not in METRIC_KINDS:
+        return False
+    bullets = split_bullets(section["body"])
+    if not bullets:
+        return False
+    unquantified = sum(1 for bullet in bullets if not METRIC_RE.search(bullet))
+    return unquantified / len(bullets) >= WEAK_METRICS_THRESHOLD
+
+
+def plan_rewrites(sections, missing_skills):
+    """
+    Decide which sections to rewrite and why.
+
+    Missing skills go to the skills section (or the summary if there is no
+    skills section); experience and project sections are rewritten when
+    their bullets lack metrics.
+
+    Returns:
+        {section index: reason} with reason "skills" or "metrics"
+    """
+    plan = {}
+    if missing_skills:
+        for kind in ("skills", "summary"):
+            index = next((i for i, section in enumerate(sections) if section["kind"] == kind), None)
+            if index is not None:
+                plan[index] = "skills"
+                break
+    for index, section in enumerate(sections):
+        if index not in plan and has_weak_metrics(section):
+            plan[index] = "metrics"
+    return plan
+
+
+def build_section_prompt(job_data, section, reason, missing_skills):
+    """Prompt that rewrites one section body only (static instructions first, section data last)"""
+    job_title = job_data.get("job_title", "the target role")
+    if reason == "skills":
+        task = ("Add the missing skills listed below naturally, only where the candidate's background "
+                "supports them. Keep every existing skill.")
+    else:
+        task = ("Quantify achievements with realistic numbers and metrics where the content supports it, "
+                "and start each bullet with a strong action verb.")
+    missing = f"\nMissing skills: {', '.join(missing_skills)}" if reason == "skills" else ""
+
+    return f"""
+You are an expert resume editor. Rewrite only the resume section below.
+
+{task}
+Improve clarity and professional tone. Keep it honest — do not invent fake experience.
+Keep the same entries in the same order, as markdown bullets.
+
+Only output the rewritten section body — no heading, no explanation.
+
+Target role: **{job_title}**{missing}
+Section: {section['heading'] or section['kind']}
+---
+{section['body']}
+---
+"""
+
+
+def format_section(section, body):
+    """Section heading exactly as the resume wrote it, followed by the body"""
+    return f"{section['heading_text']}\n\n{body.strip()}" if section["heading_text"] else body.strip()
+
+
+def rewrite_sections(job_data, resume_text, missing_skills, on_token=None):
+    """
+    Rewrite the sections that need it and merge the resume back together.
+
+    Args:
+        job_data: Job research data
+        resume_text: Current resume
+        missing_skills: Required skills not found in the resume
+        on_token: Optional callback receiving the merged resume in order as
+                  sections are ready, always on the calling thread
+
+    Returns:
+        (merged resume, report) where report lists every section with its
+        hash and whether it was rewritten, or (None, report) when the resume
+        has no recognisable sections. A section whose rewrite fails keeps its
+        original body and is marked "failed" in the report.
+    """
+    sections = parse_sections(resume_text)
+    plan = plan_rewrites(sections, missing_skills)
+    report = {
+        "sections": [
+            {"kind": section["kind"], "hash": section["hash"], "rewritten": plan.get(index)}
+            for index, section in enumerate(sections)
+        ],
+    }
+    if sum(1 for section in sections if section["kind"] != "header") < 2:
+        return None, report
+
+    stream = OrderedStream(len(sections), on_token)
+    merged = [None] * len(sections)
+    print(f"🤖 Rewriting {len(plan)} of {len(sections)} resume sections...")
+
+    def rewrite(index):
+        section = sections[index]
+        # Same section + same missing skills -> cached rewrite
+        llm = create_llm(model="gpt-4o-mini", temperature=0.7, cache_sampled=True)
+        return call_llm(llm, build_section_prompt(job_data, section, plan[index], missing_skills))
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as pool:
+        # Each worker runs in a copy of this context so its LLMs count toward the coach's metrics
+        futures = {pool.submit(contextvars.copy_context().run, rewrite, index): index for index in plan}
+        for index, section in enumerate(sections):
+            if index not in plan:
+                merged[index] = format_section(section, section["body"])
+                stream.finish(index, merged[index])
+        for future in stream.as_completed(futures):
+            index = futures[future]
+            try:
+                body = future.result()
+            except Exception as e:
+                # One failed section keeps its original text instead of aborting the rewrite
+                print(f"⚠️ Rewriting '{sections[index]['heading']}' failed, keeping the original: {e}")
+                body = sections[index]["body"]
+                report["sections"][index].update(rewritten=None, failed=True)
+            merged[index] = format_section(sections[index], body)
+            stream.finish(index, merged[index])
+
+    return "\n\n".join(merged), report
@@ -0,0 +1 @@
+# Offline development tools: local API stand-ins and benchmarks
@@ -0,0 +1,210 @@
+"""
+End-to-End Benchmark - Run the crews against the local LLM and Serper stubs
+Reports total and per-stage (per-task) wall time for LinkedInSearchCrew.search_jobs
+and JobResearchCrew, so framework overhead and scheduling regressions can be
+measured reproducibly without network access
+
+Usage:
+    python src/devtools/benchmark_e2e.py --latency-ms 500 --runs 3
+    python src/devtools/benchmark_e2e.py --crews linkedin --output bench.json
+
+Runs happen in a scratch working directory, so src/outputs is never touched.
+Crew and LLM caches are disabled unless --with-cache is given.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from devtools.llm_stub_server import LLMStubConfig, LLMStubServer
+from devtools.serper_stub_server import StubConfig, StubServer
+
+
+LINKEDIN_FILTERS = {
+    "company": "",
+    "job_type": "Any",
+    "remote_option": "Any",
+    "date_posted": "Any",
+    "work_authorization": "Any",
+}
+
+
+class StageTimer:
+    """Collect per-task start/end times from the CrewAI event bus"""
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.lock = threading.Lock()
+
+    def _record(self, event, field: str):
+        name = getattr(event, "task_name", None) or "unknown_task"
+        stamp = event.timestamp.timestamp() if getattr(event, "timestamp", None) else time.time()
+        with self.lock:
+            self.stages.setdefault(name, {})[field] = stamp
+
+    def register(self):
+        """Attach handlers for task start/completion events"""
+        from crewai.events import crewai_event_bus, TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent
+
+        crewai_event_bus.on(TaskStartedEvent)(lambda source, event: self._record(event, "start"))
+        crewai_event_bus.on(TaskCompletedEvent)(lambda source, event: self._record(event, "end"))
+        crewai_event_bus.on(TaskFailedEvent)(lambda source, event: self._record(event, "end"))
+
+    def reset(self):
+        with self.lock:
+            self.stages = {}
+
+    def report(self, run_start: float) -> List[Dict]:
+        """Stages ordered by start time, with offsets relative to the run start"""
+        from crewai.events import crewai_event_bus
+
+        crewai_event_bus.flush()
+        with self.lock:
+            stages = dict(self.stages)
+        rows = []
+        for name, times in stages.items():
+            start, end = times.get("start"), times.get("end")
+            rows.append({
+                "stage": name,
+                "start_s": round(start - run_start, 3) if start else None,
+                "duration_s": round(end - start, 3) if start and end else None,
+            })
+        return sorted(rows, key=lambda row: row["start_s"] if row["start_s"] is not None else float("inf"))
+
+
+def run_linkedin(llm, job_title: str, location: str):
+    """One LinkedInSearchCrew.search_jobs run"""
+    from Crew.linkedin_search_crew import LinkedInSearchCrew
+
+    return LinkedInSearchCrew(llm=llm).search_jobs(job_title, location, **LINKEDIN_FILTERS)
+
+
+def run_research(llm, job_title: str, location: str, execution_mode: str = None):
+    """One JobResearchCrew run (mode from RESEARCH_CREW_MODE unless given)"""
+    from Crew.research_crew import JobResearchCrew
+
+    return JobResearchCrew(llm=llm, execution_mode=execution_mode).run(job_title)
+
+
+CREW_RUNNERS = {
+    "linkedin": run_linkedin,
+    "research": run_research,
+    "research_hierarchical": lambda llm, title, location: run_research(llm, title, location, "hierarchical"),
+    "research_flat": lambda llm, title, location: run_research(llm, title, location, "flat"),
+}
+
+
+def print_report(results: Dict):
+    """Print a per-crew timing table"""
+    print("\n📊 End-to-end benchmark")
+    print(f"   LLM latency: {results['config']['latency_ms']} ms "
+          f"+ {results['config']['ms_per_token']} ms/token, runs: {results['config']['runs']}")
+    for crew_name, crew in results["crews"].items():
+        print(f"\n🧩 {crew_name}: median {crew['median_s']:.2f}s "
+              f"(min {crew['min_s']:.2f}s, max {crew['max_s']:.2f}s), "
+              f"{crew['llm_requests_per_run']:.1f} LLM requests/run")
+        print(f"   {'stage':<36} {'start':>8} {'duration':>10}")
+        for stage in crew["stages_last_run"]:
+            start = f"{stage['start_s']:.2f}s" if stage["start_s"] is not None else "-"
+            duration = f"{stage['duration_s']:.2f}s" if stage["duration_s"] is not None else "-"
+            print(f"   {stage['stage']:<36} {start:>8} {duration:>10}")
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="Offline end-to-end crew benchmark")
+    parser.add_argument("--crews", default="linkedin,research_hierarchical,research_flat",
+                        help="Comma-separated: linkedin, research, research_hierarchical, research_flat")
+    parser.add_argument("--runs", type=int, default=1, help="Runs per crew")
+    parser.add_argument("--job-title", default="Data Analyst")
+    parser.add_argument("--location", default="Austin, TX")
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="Stub LLM latency per request")
+    parser.add_argument("--ms-per-token", type=float, default=0.0, help="Stub LLM latency per completion token")
+    parser.add_argument("--serper-latency-ms", type=float, default=100.0, help="Stub Serper latency per request")
+    parser.add_argument("--workdir", default=None, help="Scratch working directory (default: temp dir)")
+    parser.add_argument("--with-cache", action="store_true", help="Keep crew and LLM caches enabled")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    llm_server = LLMStubServer(LLMStubConfig(latency_ms=args.latency_ms, ms_per_token=args.ms_per_token)).start()
+    serper_server = StubServer(StubConfig(latency_ms=args.serper_latency_ms)).start()
+
+    # Point every client at the stubs before any crew module is imported
+    os.environ.update({
+        "OPENAI_BASE_URL": llm_server.base_url,
+        "OPENAI_API_KEY": "stub",
+        "SERPER_API_KEY": "stub",
+        "SERPER_BASE_URL": serper_server.base_url,
+        "HTTP_REPLAY_MODE": "off",
+        "CREWAI_TRACING_ENABLED": "false",
+        "OTEL_SDK_DISABLED": "true",
+    })
+    if not args.with_cache:
+        os.environ.update({"CREW_CACHE": "off", "LLM_CACHE": "off"})
+
+    output_path = os.path.abspath(args.output) if args.output else None
+    workdir = args.workdir or tempfile.mkdtemp(prefix="crew-bench-")
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+    print(f"🧪 LLM stub: {llm_server.base_url} | Serper stub: {serper_server.base_url} | workdir: {workdir}")
+
+    from utils.llm_client import create_llm
+
+    timer = StageTimer()
+    timer.register()
+    llm = create_llm(model="gpt-4o-mini")
+
+    results = {
+        "config": {
+            "latency_ms": args.latency_ms,
+            "ms_per_token": args.ms_per_token,
+            "serper_latency_ms": args.serper_latency_ms,
+            "runs": args.runs,
+            "job_title": args.job_title,
+            "location": args.location,
+        },
+        "crews": {},
+    }
+
+    try:
+        for crew_name in [name.strip() for name in args.crews.split(",") if name.strip()]:
+            runner = CREW_RUNNERS[crew_name]
+            durations = []
+            requests_before = llm_server.config.request_count
+            stages = []
+            for run in range(args.runs):
+                timer.reset()
+                run_start = time.time()
+                runner(llm, args.job_title, args.location)
+                durations.append(time.time() - run_start)
+                stages = timer.report(run_start)
+                print(f"✅ {crew_name} run {run + 1}/{args.runs}: {durations[-1]:.2f}s")
+
+            results["crews"][crew_name] = {
+                "runs_s": [round(d, 3) for d in durations],
+                "median_s": statistics.median(durations),
+                "min_s": min(durations),
+                "max_s": max(durations),
+                "llm_requests_per_run": (llm_server.config.request_count - requests_before) / args.runs,
+                "stages_last_run": stages,
+            }
+    finally:
+        llm_server.stop()
+        serper_server.stop()
+
+    print_report(results)
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results saved to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
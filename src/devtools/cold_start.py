@@ -0,0 +1,83 @@
+"""
+Cold Start - Time the first render of each Streamlit page in a fresh interpreter
+Runs src/app.py headless through streamlit.testing.AppTest with ?page=<name>
+and reports the render time and which heavy dependencies were imported
+
+Usage:
+    python src/devtools/cold_start.py
+    python src/devtools/cold_start.py --pages home,Specific_Jobs --runs 5 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_PAGES = ["home", "job_search", "Specific_Jobs", "Resume_Prep"]
+HEAVY_MODULES = ["crewai", "plotly", "pandas", "PyPDF2", "sklearn"]
+
+# Executed in a child interpreter so every measurement starts cold
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file("app.py", default_timeout=120)
+app.query_params["page"] = {page!r}
+app.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed_s": elapsed,
+    "exceptions": len(app.exception),
+    "heavy_modules": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure_page(page: str) -> dict:
+    """One cold first render of a page"""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(page=page, heavy=HEAVY_MODULES)],
+        cwd=SRC_DIR, capture_output=True, text=True, timeout=300,
+        env={**os.environ, "CREWAI_TRACING_ENABLED": "false", "OTEL_SDK_DISABLED": "true"},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Render of '{page}' failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="Cold-start time per Streamlit page")
+    parser.add_argument("--pages", default=",".join(DEFAULT_PAGES), help="Comma-separated ?page= values")
+    parser.add_argument("--runs", type=int, default=3, help="Cold renders per page")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON instead of a table")
+    args = parser.parse_args()
+
+    report = {}
+    for page in [name.strip() for name in args.pages.split(",") if name.strip()]:
+        runs = [measure_page(page) for _ in range(args.runs)]
+        report[page] = {
+            "median_s": round(statistics.median(run["elapsed_s"] for run in runs), 3),
+            "min_s": round(min(run["elapsed_s"] for run in runs), 3),
+            "exceptions": runs[-1]["exceptions"],
+            "heavy_modules": runs[-1]["heavy_modules"],
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"\n🚀 Cold start (first render, {args.runs} runs per page)")
+    print(f"   {'page':<16} {'median':>8} {'min':>8}  heavy modules loaded")
+    for page, stats in report.items():
+        heavy = ", ".join(stats["heavy_modules"]) or "-"
+        errors = f"  ⚠️ {stats['exceptions']} exception(s)" if stats["exceptions"] else ""
+        print(f"   {page:<16} {stats['median_s']:>7.2f}s {stats['min_s']:>7.2f}s  {heavy}{errors}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+"""
+LLM Stub Server - Deterministic OpenAI-compatible stand-in for offline benchmarks
+Answers /v1/chat/completions with canned, schema-valid outputs for every task
+in config/*_tasks.yaml, with configurable latency and token counts, so crews,
+coaches and the AI-instruction feature can run without a live OpenAI endpoint
+
+Usage:
+    python src/devtools/llm_stub_server.py --port 8766 --latency-ms 400 --ms-per-token 2
+    export OPENAI_BASE_URL=http://127.0.0.1:8766/v1
+    export OPENAI_API_KEY=stub
+
+Tasks are recognised from the "Current Task:" section of the prompt; their
+answers come from devtools/llm_canned/<task_name>.json with ${job_title} and
+${location} filled in from the prompt. Agents answer directly without using
+their tools; the only tool call the stub makes is a hierarchical manager's
+delegation to its coworker, so manager round trips show up in benchmarks.
+Usage reports the prompt prefix shared with earlier requests as cached tokens,
+like provider prefix caching, so prompt layouts can be compared offline.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import random
+import re
+import string
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(SRC_DIR)
+
+CONFIG_DIR = os.path.join(SRC_DIR, "config")
+CANNED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "llm_canned")
+
+# Marker of the prompt sent by process_ai_instruction in the Specific Jobs page
+AI_INSTRUCTION_MARKER = "Generate Python code to process the job_postings list"
+AI_INSTRUCTION_CODE = (
+    "filtered_jobs = [job for job in job_postings]\n"
+    "display_message = f\"Stub processed {len(filtered_jobs)} jobs\""
+)
+
+DELEGATE_TOOL = "delegate_work_to_coworker"
+
+# Prefix caching as OpenAI does it: prompts of at least 1024 tokens, cached in
+# 128-token blocks, matched against recently seen prompts
+PREFIX_CACHE_MIN_TOKENS = 1024
+PREFIX_CACHE_BLOCK = 128
+PREFIX_CACHE_SIZE = 256
+
+DEFAULT_TEXT_RESPONSE = (
+    "# Stub Response\n\n"
+    "This answer was generated by the local LLM stub server.\n\n"
+    "- Replace OPENAI_BASE_URL to talk to a real model.\n"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)"""
+    return max(1, len(text) // 4)
+
+
+def load_task_signatures(config_dir: str = CONFIG_DIR) -> List[Tuple[str, str]]:
+    """
+    Build (task_name, signature) pairs from config/*_tasks.yaml.
+
+    The signature is the static start of the task description (up to the first
+    placeholder), which appears verbatim in the prompt CrewAI sends.
+    """
+    signatures = []
+    for path in sorted(glob.glob(os.path.join(config_dir, "*_tasks.yaml"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            tasks = yaml.safe_load(f) or {}
+        for name, task in tasks.items():
+            description = " ".join(str(task.get("description", "")).split())
+            signature = description.split("{", 1)[0][:80].strip()
+            if signature:
+                signatures.append((name, signature))
+    return signatures
+
+
+def message_text(messages: List[Dict]) -> str:
+    """Flatten chat messages (string or content-part lists) into one string"""
+    parts = []
+    for message in messages:
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        parts.append(str(content))
+    return "\n".join(parts)
+
+
+def extract_inputs(text: str) -> Dict[str, str]:
+    """Pull job_title and location out of a task prompt"""
+    patterns = {
+        "job_title": [r"Job Title:\s*([^\n(]+?)\s*(?:\(| - |\n|$)", r'"job_title":\s*"([^"]+)"',
+                      r"job market for ([^.\n]+)\."],
+        "location": [r"Location:\s*([^\n(]*?)\s*(?:\(| - |\n|$)", r'"location":\s*"([^"]*)"'],
+    }
+    inputs = {"job_title": "Data Analyst", "location": ""}
+    for field, candidates in patterns.items():
+        for pattern in candidates:
+            match = re.search(pattern, text)
+            if match and match.group(1).strip():
+                inputs[field] = match.group(1).strip()
+                break
+    return inputs
+
+
+class LLMStubConfig:
+    """Latency, token and canned-output settings for the LLM stub"""
+
+    def __init__(self, latency_ms: float = 0.0, ms_per_token: float = 0.0, jitter_ms: float = 0.0,
+                 prompt_tokens: Optional[int] = None, completion_tokens: Optional[int] = None,
+                 seed: int = 0, canned_dir: str = CANNED_DIR, config_dir: str = CONFIG_DIR,
+                 react_format: bool = True, delegate: bool = True, prefix_cache: bool = True):
+        self.latency_ms = latency_ms
+        self.ms_per_token = ms_per_token
+        self.jitter_ms = jitter_ms
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.seed = seed
+        self.canned_dir = canned_dir
+        self.react_format = react_format
+        self.delegate = delegate
+        self.prefix_cache = prefix_cache
+        self.recent_prompts: List[str] = []
+        self.signatures = load_task_signatures(config_dir)
+        self.request_count = 0
+        self.task_counts: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def match_task(self, text: str) -> Optional[str]:
+        """Name of the YAML task a prompt belongs to, or None"""
+        current = text.rsplit("Current Task:", 1)[-1]
+        current = " ".join(current.split())
+        for name, signature in self.signatures:
+            if signature in current:
+                return name
+        return None
+
+    def canned_output(self, task_name: str, inputs: Dict[str, str]) -> str:
+        """Canned JSON answer for a task with inputs substituted"""
+        path = os.path.join(self.canned_dir, f"{task_name}.json")
+        if not os.path.exists(path):
+            return json.dumps({"task": task_name, "stub": True, **inputs}, indent=2)
+        with open(path, 'r', encoding='utf-8') as f:
+            template = string.Template(f.read())
+        # Escape values so they stay valid inside JSON strings
+        escaped = {key: json.dumps(value)[1:-1] for key, value in inputs.items()}
+        return template.safe_substitute(escaped)
+
+    def respond(self, messages: List[Dict], native_tools: bool = False) -> Tuple[str, Optional[str]]:
+        """
+        Build the answer text for a chat request; returns (content, task_name).
+
+        Agents without native tool calling parse a ReAct "Final Answer:" from
+        the text, so that prefix is only added when the request has no tools.
+        """
+        text = message_text(messages)
+        task_name = self.match_task(text)
+        with self.lock:
+            self.request_count += 1
+            if task_name:
+                self.task_counts[task_name] = self.task_counts.get(task_name, 0) + 1
+
+        if task_name:
+            answer = self.canned_output(task_name, extract_inputs(text))
+            if self.react_format and not native_tools:
+                answer = f"Thought: I now know the final answer\nFinal Answer: {answer}"
+            return answer, task_name
+        if AI_INSTRUCTION_MARKER in text:
+            return f"```python\n{AI_INSTRUCTION_CODE}\n```", None
+        return DEFAULT_TEXT_RESPONSE, None
+
+    def delegation_call(self, messages: List[Dict], tools: List[Dict]) -> Optional[Dict]:
+        """
+        Tool call delegating the current task to the coworker, or None.
+
+        A manager delegates once per task: after the tool result comes back
+        (a "tool" message) it gives its final answer.
+        """
+        if not self.delegate or any(message.get("role") == "tool" for message in messages):
+            return None
+        tool = next((t for t in tools if t.get("function", {}).get("name") == DELEGATE_TOOL), None)
+        if tool is None:
+            return None
+
+        text = message_text(messages)
+        if not self.match_task(text):
+            return None
+        coworker = re.search(r"coworkers?:\s*([^\n]+)", tool["function"].get("description", ""))
+        current = text.rsplit("Current Task:", 1)[-1].split("This is the expected criteria", 1)[0].strip()
+        return {
+            "id": f"call_{uuid.uuid4().hex[:12]}",
+            "type": "function",
+            "function": {
+                "name": DELEGATE_TOOL,
+                "arguments": json.dumps({
+                    "task": current,
+                    "context": "Delegated by the manager",
+                    "coworker": coworker.group(1).split(",")[0].strip() if coworker else "",
+                }),
+            },
+        }
+
+    def cached_tokens(self, text: str) -> int:
+        """
+        Simulate provider prefix caching: prompts of 1024+ tokens get the part
+        they share with an earlier prompt reported as cached, in 128-token steps.
+        """
+        if not self.prefix_cache:
+            return 0
+        with self.lock:
+            shared = max((len(os.path.commonprefix([text, seen])) for seen in self.recent_prompts), default=0)
+            self.recent_prompts = (self.recent_prompts + [text])[-PREFIX_CACHE_SIZE:]
+        shared_tokens = shared // 4
+        if shared_tokens < PREFIX_CACHE_MIN_TOKENS:
+            return 0
+        return shared_tokens // PREFIX_CACHE_BLOCK * PREFIX_CACHE_BLOCK
+
+    def delay_seconds(self, key: str, completion_tokens: int) -> float:
+        """Deterministic latency for a request"""
+        delay_ms = self.latency_ms + self.ms_per_token * completion_tokens
+        if self.jitter_ms:
+            digest = hashlib.sha256(f"{self.seed}:{key}".encode("utf-8")).hexdigest()
+            delay_ms += random.Random(int(digest[:16], 16)).uniform(0, self.jitter_ms)
+        return delay_ms / 1000
+
+
+def make_handler(config: LLMStubConfig):
+    """Create a request handler class bound to a stub configuration"""
+
+    class LLMStubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/models"):
+                return self._send(200, {"object": "list", "data": [{"id": "gpt-4o-mini", "object": "model"}]})
+            return self._send(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                return self._send(400, {"error": {"message": "Invalid JSON body"}})
+
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                return self._send(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+            messages = body.get("messages", [])
+            tool_call = None if body.get("stream") else config.delegation_call(messages, body.get("tools") or [])
+            if tool_call:
+                with config.lock:
+                    config.request_count += 1
+                content = tool_call["function"]["arguments"]
+            else:
+                content, _ = config.respond(messages, native_tools=bool(body.get("tools")))
+            prompt_text = message_text(messages)
+            prompt_tokens = config.prompt_tokens or estimate_tokens(prompt_text)
+            completion_tokens = config.completion_tokens or estimate_tokens(content)
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": min(prompt_tokens, config.cached_tokens(prompt_text))},
+            }
+
+            model = body.get("model", "gpt-4o-mini")
+            completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+            if body.get("stream"):
+                # First token after the base latency, then ms_per_token per token
+                time.sleep(config.delay_seconds(content, 0))
+                include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+                return self._stream(completion_id, model, content, usage if include_usage else None)
+
+            time.sleep(config.delay_seconds(content, completion_tokens))
+
+            return self._send(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": (
+                        {"role": "assistant", "content": None, "tool_calls": [tool_call]} if tool_call
+                        else {"role": "assistant", "content": content}
+                    ),
+                    "finish_reason": "tool_calls" if tool_call else "stop",
+                }],
+                "usage": usage,
+            })
+
+        def _stream(self, completion_id: str, model: str, content: str, usage: Optional[Dict]):
+            """Send the answer as server-sent events, like the OpenAI streaming API"""
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+
+            def chunk(delta: Dict, finish_reason=None, chunk_usage=None):
+                payload = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}] if delta is not None else [],
+                }
+                if chunk_usage:
+                    payload["usage"] = chunk_usage
+                self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+            chunk({"role": "assistant", "content": ""})
+            for start in range(0, len(content), 24):
+                piece = content[start:start + 24]
+                if config.ms_per_token:
+                    time.sleep(config.ms_per_token * estimate_tokens(piece) / 1000)
+                chunk({"content": piece})
+            chunk({}, finish_reason="stop")
+            if usage:
+                chunk(None, chunk_usage=usage)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+            self.close_connection = True
+
+        def _send(self, status: int, payload: Dict):
+            encoded = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def log_message(self, format, *args):
+            pass  # Keep benchmark output clean
+
+    return LLMStubHandler
+
+
+class LLMStubServer:
+    """Run the LLM stub in a background thread (for tests and benchmarks)"""
+
+    def __init__(self, config: Optional[LLMStubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or LLMStubConfig()
+        self.httpd = ThreadingHTTPServer((host, port), make_handler(self.config))
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI-style base URL (use as OPENAI_BASE_URL)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "LLMStubServer":
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible LLM stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed latency added to every response")
+    parser.add_argument("--ms-per-token", type=float, default=0.0, help="Extra latency per completion token")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random latency (seeded)")
+    parser.add_argument("--prompt-tokens", type=int, default=None, help="Fixed prompt token count in usage")
+    parser.add_argument("--completion-tokens", type=int, default=None, help="Fixed completion token count in usage")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latency jitter")
+    parser.add_argument("--plain", action="store_true", help="Return task JSON without the 'Final Answer:' prefix")
+    parser.add_argument("--no-delegate", action="store_true", help="Managers answer directly instead of delegating")
+    parser.add_argument("--no-prefix-cache", action="store_true", help="Always report 0 cached prompt tokens")
+    args = parser.parse_args()
+
+    config = LLMStubConfig(
+        latency_ms=args.latency_ms,
+        ms_per_token=args.ms_per_token,
+        jitter_ms=args.jitter_ms,
+        prompt_tokens=args.prompt_tokens,
+        completion_tokens=args.completion_tokens,
+        seed=args.seed,
+        react_format=not args.plain,
+        delegate=not args.no_delegate,
+        prefix_cache=not args.no_prefix_cache,
+    )
+    server = LLMStubServer(config, args.host, args.port)
+    print(f"🧪 LLM stub server on {server.base_url} ({len(config.signatures)} tasks recognised)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
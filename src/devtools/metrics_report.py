@@ -0,0 +1,63 @@
+"""
+Metrics Report - Aggregate crew metrics from the append-only metrics log
+Shows, per crew and task, mean wall time, LLM time, tokens, the share of
+prompt tokens served from the provider's prompt cache, cost, tool calls and
+retries, to decide where optimisation effort goes
+
+Usage:
+    python src/devtools/metrics_report.py
+    python src/devtools/metrics_report.py --crew linkedin_search --last 20 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.crew_metrics import load_metrics_log, summarize_runs
+
+
+def print_summary(summary: dict):
+    """Print one table per crew, slowest task first"""
+    if not summary:
+        print("📭 No crew runs recorded yet")
+        return
+
+    for crew_name, crew in summary.items():
+        print(f"\n🧩 {crew_name}: {crew['runs']} runs, mean {crew['mean_wall_s']}s, "
+              f"total cost ${crew['total_cost_usd']:.4f}")
+        print(f"   {'task':<36} {'wall':>8} {'llm':>8} {'calls':>6} {'tokens in/out':>16} {'cached':>7} {'cost':>9} {'tools':>6} {'retry':>6}")
+        tasks = sorted(crew["tasks"].items(), key=lambda item: item[1]["mean_wall_s"], reverse=True)
+        for task_name, stats in tasks:
+            tokens = f"{stats['mean_prompt_tokens']:.0f}/{stats['mean_completion_tokens']:.0f}"
+            cached = stats.get("mean_cached_tokens", 0) / stats["mean_prompt_tokens"] if stats["mean_prompt_tokens"] else 0
+            print(f"   {task_name:<36} {stats['mean_wall_s']:>7.2f}s {stats['mean_llm_time_s']:>7.2f}s "
+                  f"{stats['mean_llm_calls']:>6.1f} {tokens:>16} {cached:>7.0%} ${stats['mean_cost_usd']:>8.4f} "
+                  f"{stats['mean_tool_calls']:>6.1f} {stats['mean_retries']:>6.1f}")
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="Aggregate crew metrics")
+    parser.add_argument("--log", default=None, help="Metrics log path (default: src/outputs/metrics/metrics.log)")
+    parser.add_argument("--crew", default=None, help="Only include this crew")
+    parser.add_argument("--last", type=int, default=None, help="Only include the last N runs")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    runs = load_metrics_log(args.log)
+    if args.crew:
+        runs = [run for run in runs if run.get("crew") == args.crew]
+    if args.last:
+        runs = runs[-args.last:]
+
+    summary = summarize_runs(runs)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
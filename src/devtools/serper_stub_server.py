@@ -0,0 +1,212 @@
+"""
+Serper Stub Server - Local HTTP stand-in for Serper and O*NET
+Serves recorded fixtures from utils.http_replay with configurable latency
+and error injection, so searches can be benchmarked offline
+
+Usage:
+    python src/devtools/serper_stub_server.py --port 8765 --latency-ms 150 --error-rate 0.05
+    export SERPER_BASE_URL=http://127.0.0.1:8765
+    export ONET_BASE_URL=http://127.0.0.1:8765/ws
+
+Requests without a fixture get a deterministic synthetic LinkedIn search
+response (POST /search) or a 404 (anything else).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_replay import fixture_dir, fixture_key, load_fixture
+
+
+class StubConfig:
+    """Latency and error-injection settings for the stub server"""
+
+    def __init__(self, fixtures: Optional[str] = None, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 429, seed: int = 0, synthesize: bool = True):
+        self.fixtures = fixtures or fixture_dir()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.seed = seed
+        self.synthesize = synthesize
+        self.request_counts: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def rng_for(self, key: str) -> random.Random:
+        """Deterministic RNG per (seed, request key, repeat count)"""
+        with self.lock:
+            count = self.request_counts.get(key, 0)
+            self.request_counts[key] = count + 1
+        digest = hashlib.sha256(f"{self.seed}:{key}:{count}".encode("utf-8")).hexdigest()
+        return random.Random(int(digest[:16], 16))
+
+
+def synthesize_search(query: str, num: int = 10) -> Dict:
+    """
+    Build a deterministic Serper-style response for a LinkedIn job query.
+
+    Companies are read from the query's OR clause (or the word after the
+    quoted job title), so batched and per-company queries both get results
+    that the LinkedIn search tool can attribute and parse.
+    """
+    title_match = re.search(r'"([^"]+)"', query)
+    job_title = title_match.group(1) if title_match else "Software Engineer"
+    or_clause = re.search(r'\(([^)]*)\)', query)
+    if or_clause:
+        companies = re.findall(r'"([^"]+)"', or_clause.group(1))
+    else:
+        rest = query[title_match.end():].split() if title_match else []
+        companies = rest[:1] or ["Acme"]
+
+    rng = random.Random(int(hashlib.sha256(query.encode("utf-8")).hexdigest()[:16], 16))
+    title_slug = re.sub(r"[^a-z0-9]+", "-", job_title.lower()).strip("-")
+    organic = []
+    for company in companies:
+        company_slug = re.sub(r"[^a-z0-9]+", "-", company.lower()).strip("-")
+        for _ in range(rng.randint(0, 4)):
+            if len(organic) >= num:
+                break
+            job_id = rng.randint(3_000_000_000, 3_999_999_999)
+            days = rng.randint(1, 28)
+            organic.append({
+                "title": f"{company} hiring {job_title} in San Francisco, CA | LinkedIn",
+                "link": f"https://www.linkedin.com/jobs/view/{title_slug}-at-{company_slug}-{job_id}",
+                "snippet": (f"Posted {days} days ago. {rng.choice(['Full-time', 'Contract', 'Part-time'])} · "
+                            f"{rng.choice(['Remote', 'Hybrid', 'On-site'])} · "
+                            f"${rng.randint(80, 150)},000/yr - ${rng.randint(151, 220)},000/yr · "
+                            f"{rng.randint(10, 300)} applicants"),
+                "position": len(organic) + 1,
+            })
+
+    return {"searchParameters": {"q": query, "num": num, "type": "search"}, "organic": organic}
+
+
+def make_handler(config: StubConfig):
+    """Create a request handler class bound to a stub configuration"""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def _respond(self, method: str):
+            parts = urlsplit(self.path)
+            params = dict(parse_qsl(parts.query))
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw_body) if raw_body else None
+            except json.JSONDecodeError:
+                body = raw_body.decode("utf-8", errors="ignore")
+
+            key = fixture_key(method, parts.path, params or None, body)
+            rng = config.rng_for(key)
+
+            delay_ms = config.latency_ms + (rng.uniform(0, config.jitter_ms) if config.jitter_ms else 0)
+            if delay_ms:
+                time.sleep(delay_ms / 1000)
+
+            if config.error_rate and rng.random() < config.error_rate:
+                return self._send(config.error_status, {"message": "Injected error", "statusCode": config.error_status})
+
+            fixture = load_fixture(key, config.fixtures)
+            if fixture is not None:
+                response = fixture["response"]
+                return self._send(response["status_code"], response["body"])
+
+            if config.synthesize and method == "POST" and parts.path.rstrip("/").endswith("/search") \
+                    and isinstance(body, dict):
+                return self._send(200, synthesize_search(body.get("q", ""), int(body.get("num", 10))))
+
+            return self._send(404, {"message": f"No fixture for {method} {parts.path}", "key": key})
+
+        def _send(self, status: int, payload):
+            data = payload if isinstance(payload, str) else json.dumps(payload)
+            encoded = data.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def do_GET(self):
+            self._respond("GET")
+
+        def do_POST(self):
+            self._respond("POST")
+
+        def log_message(self, format, *args):
+            pass  # Keep benchmark output clean
+
+    return StubHandler
+
+
+class StubServer:
+    """Run the stub server in a background thread (for tests and benchmarks)"""
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StubConfig()
+        self.httpd = ThreadingHTTPServer((host, port), make_handler(self.config))
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="Local Serper / O*NET stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=None, help="Fixture directory (default: HTTP_FIXTURE_DIR)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed latency added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random latency (seeded)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail (0-1)")
+    parser.add_argument("--error-status", type=int, default=429, help="HTTP status for injected errors")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latency jitter and error injection")
+    parser.add_argument("--no-synthesize", action="store_true", help="Return 404 when no fixture matches")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        fixtures=args.fixtures,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+        synthesize=not args.no_synthesize,
+    )
+    server = StubServer(config, args.host, args.port)
+    print(f"🧪 Serper stub server on {server.base_url} (fixtures: {config.fixtures})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
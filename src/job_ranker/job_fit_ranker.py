@@ -17,6 +17,8 @@ from sklearn.metrics.pairwise import cosine_similarity
 import json
 import re
 
+from utils.skill_matcher import SkillMatcher, TokenIndex
+
 
 class JobFitRanker:
     """
@@ -61,6 +63,9 @@ class JobFitRanker:
         self.use_openai_embeddings = use_openai_embeddings
         self.embedding_model = embedding_model
         self.critical_keywords = [kw.lower() for kw in (critical_keywords or [])]
+        # Whole-word, synonym-aware matching ("ml" also finds "machine learning")
+        self.critical_matcher = SkillMatcher(self.critical_keywords)
+        self._resume_index = (None, None)
         self.keyword_boost_weight = keyword_boost_weight
         
         # Initialize TF-IDF vectorizer
@@ -186,17 +191,11 @@ class JobFitRanker:
         if not self.critical_keywords:
             return 0.0
         
-        resume_lower = resume_text.lower()
-        job_lower = job_description.lower()
-        
         # Count how many critical keywords appear in BOTH resume and job description
-        matched_keywords = 0
+        in_resume = set(self.critical_matcher.find(self._index_resume(resume_text)))
+        matched_keywords = len(in_resume.intersection(self.critical_matcher.find(job_description)))
         total_keywords = len(self.critical_keywords)
         
-        for keyword in self.critical_keywords:
-            if keyword in resume_lower and keyword in job_lower:
-                matched_keywords += 1
-        
         # Return proportional boost
         if total_keywords > 0:
             match_ratio = matched_keywords / total_keywords
@@ -204,6 +203,12 @@ class JobFitRanker:
         
         return 0.0
     
+    def _index_resume(self, resume_text: str) -> TokenIndex:
+        """Token index of the resume, built once and reused while ranking many jobs"""
+        if self._resume_index[0] != resume_text:
+            self._resume_index = (resume_text, TokenIndex(resume_text))
+        return self._resume_index[1]
+    
     def compute_job_fit_score(
         self,
         resume_text: str,
@@ -359,14 +364,10 @@ class JobFitRanker:
         missing_keywords = set(job_keywords) - set(resume_keywords)
         
         # Find matched critical keywords
-        matched_critical = [
-            kw for kw in self.critical_keywords
-            if kw in resume_text.lower() and kw in job_description.lower()
-        ]
-        missing_critical = [
-            kw for kw in self.critical_keywords
-            if kw in job_description.lower() and kw not in resume_text.lower()
-        ]
+        in_resume = set(self.critical_matcher.find(self._index_resume(resume_text)))
+        in_job = self.critical_matcher.find(job_description)
+        matched_critical = [kw for kw in in_job if kw in in_resume]
+        missing_critical = [kw for kw in in_job if kw not in in_resume]
         
         return {
             "score_breakdown": components,
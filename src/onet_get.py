@@ -1,25 +1,36 @@
 import os
-import requests
-from dotenv import load_dotenv
 import json
 
-load_dotenv()
+from utils.http_replay import http_request, onet_base_url
+from utils.lazy_registry import load_env
 
-USERNAME = os.getenv("ONET_USERNAME")
-PASSWORD = os.getenv("ONET_PASSWORD")
-
-BASE_URL = "https://services.onetcenter.org/ws"
 keyword = "Data Scientist"
 
-def search_top_job (keyword: str, start: int = 1, limit: int = 1):
-    url = f"{BASE_URL}/online/search"
+
+def onet_url(path: str) -> str:
+    """O*NET endpoint URL (.env loaded on first use)"""
+    load_env()
+    return f"{onet_base_url()}{path}"
+
+
+def onet_auth():
+    """O*NET credentials from the environment"""
+    load_env()
+    return (os.getenv("ONET_USERNAME"), os.getenv("ONET_PASSWORD"))
+
+
+ONET_SNAPSHOT_PATH = "src/data/onet/onet_snapshot.json"
+
+
+def search_top_job (keyword: str, start: int = 1, limit: int = 1, output_path: str = ONET_SNAPSHOT_PATH):
+    url = onet_url("/online/search")
     params = {
         "keyword": keyword,
         "start": start,
         "end": start + limit - 1   
     }
     headers = {"Accept": "application/json"}
-    response = requests.get(url, params=params, headers=headers, auth=(USERNAME, PASSWORD)) # type: ignore[arg-type]
+    response = http_request("GET", url, provider="onet", params=params, headers=headers, auth=onet_auth()) # type: ignore[arg-type]
     response.raise_for_status()
     data = response.json()
     
@@ -31,7 +42,7 @@ def search_top_job (keyword: str, start: int = 1, limit: int = 1):
             print("Found Job, relevance: " + str(relevance))
             soc_code = top_job["code"]
             job_data = get_occupation_data(soc_code)
-            with open("src/data/onet/onet_snapshot.json", "w") as f:
+            with open(output_path, "w") as f:
                 json.dump(job_data, f, indent=2)
             
         else: 
@@ -43,9 +54,9 @@ def search_top_job (keyword: str, start: int = 1, limit: int = 1):
         
 
 def get_occupation_data(code):
-    url = f"{BASE_URL}/online/occupations/{code}"
+    url = onet_url(f"/online/occupations/{code}")
     params = {"details": "all"}
     headers = {"Accept": "application/json"}
-    response = requests.get(url, params=params, auth=(USERNAME, PASSWORD), headers=headers) # type: ignore[arg-type]
+    response = http_request("GET", url, provider="onet", params=params, auth=onet_auth(), headers=headers) # type: ignore[arg-type]
     response.raise_for_status()
     return response.json()
\ No newline at end of file
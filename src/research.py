@@ -1,8 +1,8 @@
 from Crew.research_crew import JobResearchCrew
-from crewai import LLM
+from utils.llm_client import create_llm
 
 
-llm = LLM(
+llm = create_llm(
     model="gpt-4.1-mini"
 )
 
@@ -10,8 +10,7 @@ job_research_crew = JobResearchCrew(llm=llm)
 
 job_title = "Data Analyst"
 def run():
-    crew = JobResearchCrew(llm=llm).crew()
-    result = crew.kickoff(inputs={"job_title": job_title})
+    result = JobResearchCrew(llm=llm).run(job_title)
     #real input come from dashboard
     print(result)
 
@@ -1,19 +1,71 @@
 import streamlit as st
 import json
-from Crew.research_crew import JobResearchCrew
-from crewai import LLM
+import time
+from utils.llm_client import create_llm
+from utils.lazy_registry import registry, LazyImport
 from onet_get import search_top_job
+from utils.job_queue import job_queue, ensure_workers, queue_enabled, ACTIVE_STATUSES, COMPLETED, CANCELLED
+from utils.search_session import SearchSession
 
-llm = LLM(
+# The crew module imports crewai, so it is loaded when research first runs
+JobResearchCrew = LazyImport("Crew.research_crew", "JobResearchCrew")
+
+registry.register("research_llm", lambda: create_llm(
     model="gpt-4o-mini",   # limit output length
     max_completion_tokens = 1000,
-    )
+    ))
 
 def run(job_title):
-    """Run the CrewAI pipeline with the given job title"""
-    crew = JobResearchCrew(llm=llm).crew()
-    result = crew.kickoff(inputs={"job_title": job_title})
-    return result
+    """
+    Run the CrewAI pipeline with the given job title
+
+    Returns:
+        Output directory of this run's research session
+    """
+    crew = JobResearchCrew(llm=registry.get("research_llm"))
+    search_top_job(job_title, output_path=crew.session.path("onet_snapshot.json"))
+    crew.run(job_title)
+    return crew.session.output_dir
+
+
+@st.fragment(run_every=2)
+def poll_research_job(job_id):
+    """Poll the background research job without rerunning the whole page"""
+    job = job_queue.get(job_id)
+    if job is None or job["status"] not in ACTIVE_STATUSES:
+        st.rerun()  # Render the final state outside the fragment
+    
+    elapsed = time.time() - (job["started_at"] or job["created_at"])
+    st.progress(job["progress"], text=f"⏳ {job['message']} ({elapsed:.0f}s)")
+    if st.button("Cancel research", key=f"cancel_{job_id}", disabled=job["cancel_requested"]):
+        job_queue.cancel(job_id)
+        st.rerun()
+
+
+def research_job_finished():
+    """
+    Show the state of this session's research job
+
+    Returns:
+        Output directory of the job's research session once it completed, else None
+    """
+    job_id = st.session_state.get("research_job_id")
+    job = job_queue.get(job_id) if job_id else None
+    if job is None:
+        return None
+    
+    if job["status"] in ACTIVE_STATUSES:
+        poll_research_job(job_id)
+        return None
+    if job["status"] == COMPLETED:
+        st.success("✅ Crew finished running!")
+        session = SearchSession.load((job["result"] or {}).get("session_id", ""), base_dir=JobResearchCrew.SESSIONS_DIR)
+        return session.output_dir if session else None
+    if job["status"] == CANCELLED:
+        st.info("Research was cancelled.")
+    else:
+        st.error(f"Error running crew: {(job['error'] or 'Unknown error').splitlines()[0]}")
+    return None
 
 
 def info_page():
@@ -22,20 +74,27 @@ def info_page():
     st.title("Job Market Research Dashboard")
     
     job_title = st.text_input("Enter a job title or description:", "")
-    run_completed = False
+    results_dir = None
     
     if st.button("Run Research Crew"):
-        st.write("⏳ Running the crew, please wait...")
-        try:
-            search_top_job(job_title)
-            run(job_title)
-            st.success("✅ Crew finished running!")
-            run_completed = True
-        except Exception as e:
-            st.error(f"Error running crew: {e}")
-
-    if run_completed:
-        json_path = "src/outputs/content/job_market_summary.json"
+        if queue_enabled():
+            # Run in a background worker so the page stays responsive
+            st.session_state["research_job_id"] = job_queue.submit("job_research", {"job_title": job_title})
+            ensure_workers()
+        else:
+            st.write("⏳ Running the crew, please wait...")
+            try:
+                results_dir = run(job_title)
+                st.success("✅ Crew finished running!")
+            except Exception as e:
+                st.error(f"Error running crew: {e}")
+    
+    if queue_enabled():
+        results_dir = research_job_finished()
+
+    if results_dir:
+        # Read this run's own summary, not the shared latest-research copy
+        json_path = f"{results_dir}/job_market_summary.json"
         try:
             with open(json_path, "r") as f:
                 data = json.load(f)
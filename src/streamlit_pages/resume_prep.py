@@ -4,6 +4,7 @@ Resume Preparation Page - AI-Powered Resume & Interview Coach (PDF + TXT Support
 
 import streamlit as st
 import sys
+import time
 from pathlib import Path
 
 # === Add project root to import path ===
@@ -11,19 +12,100 @@ BASE_DIR = Path(__file__).resolve().parents[2]
 sys.path.append(str(BASE_DIR / "src" / "coaches"))
 
 # === Import your two coach modules ===
-from resume_coach import run_resume_coach
+from resume_coach import run_resume_coach, resume_run_key
 from interview_coach import run_interview_coach
-
-import PyPDF2
-
-
-def extract_pdf_text(pdf_file):
-    """Extract text from uploaded PDF using PyPDF2."""
-    reader = PyPDF2.PdfReader(pdf_file)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() + "\n"
-    return text
+from utils.pdf_extract import extract_pdf_text
+
+# Resume coach runs kept per session, keyed by resume_run_key
+MAX_RESUME_RUNS = 8
+
+
+def write_if_changed(path, text):
+    """Write a text file only when its content differs"""
+    path = Path(path)
+    if not path.exists() or path.read_text(encoding="utf-8") != text:
+        path.write_text(text, encoding="utf-8")
+
+
+def coach_uploaded_resume(uploaded_file, data_dir):
+    """
+    Extract, save and rewrite an uploaded resume, once per distinct input.
+
+    Streamlit reruns the page on every interaction while the file stays
+    attached; runs are memoized in session state by the upload's content
+    hash plus the research data hash, so a rerun with the same inputs
+    reuses the stored result instead of calling the LLM again.
+
+    Returns:
+        {"result", "resume_text", "updated_text"} or None if the run failed
+    """
+    resume_path = data_dir / "user_resume.txt"
+    run_key = resume_run_key(uploaded_file.getvalue())
+    runs = st.session_state.setdefault("resume_coach_runs", {})
+
+    if run_key in runs:
+        run = runs[run_key]
+        # Another upload may have replaced the files the other coaches read
+        write_if_changed(resume_path, run["resume_text"])
+        write_if_changed(run["result"]["updated_resume_path"], run["updated_text"])
+        return run
+
+    # --- Handle TXT Upload ---
+    if uploaded_file.type == "text/plain":
+        content = uploaded_file.getvalue().decode("utf-8", errors="ignore")
+
+    # --- Handle PDF Upload ---
+    elif uploaded_file.type == "application/pdf":
+        content = extract_pdf_text(uploaded_file)
+
+    else:
+        st.error("❌ Unsupported file format")
+        return None
+
+    # Save content to TXT so resume_coach can read it
+    with open(resume_path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+    # Run Resume Coach, showing the rewrite as it is generated
+    status = st.empty()
+    status.caption(" Analyzing your resume...")
+    live_output = st.empty()
+    renderer = StreamRenderer(live_output)
+    try:
+        result = run_resume_coach(resume_path, on_token=renderer)
+    except Exception as e:
+        st.error(f" Error: {e}")
+        result = None
+    status.empty()
+    live_output.empty()
+    if not result:
+        return None
+
+    updated_path = Path(result["updated_resume_path"])
+    updated_text = updated_path.read_text(encoding="utf-8") if updated_path.exists() else ""
+    if len(runs) >= MAX_RESUME_RUNS:
+        runs.pop(next(iter(runs)))
+    runs[run_key] = {"result": result, "resume_text": content, "updated_text": updated_text}
+    return runs[run_key]
+
+
+class StreamRenderer:
+    """on_token callback that renders streamed LLM text into a placeholder"""
+
+    def __init__(self, placeholder, interval=0.15):
+        self.placeholder = placeholder
+        self.interval = interval  # seconds between re-renders
+        self.text = ""
+        self._rendered_at = 0.0
+
+    def __call__(self, chunk):
+        self.text += chunk
+        if time.monotonic() - self._rendered_at >= self.interval:
+            self.flush()
+
+    def flush(self):
+        self.placeholder.markdown(self.text + " ▌")
+        self._rendered_at = time.monotonic()
 
 
 def resume_prep_page():
@@ -44,58 +126,28 @@ def resume_prep_page():
         uploaded_file = st.file_uploader("Upload your resume", type=["txt", "pdf"])
 
         if uploaded_file:
-            # Step 1⃣ Save resume to /data folder
+            # Step 1⃣ Save resume to /data folder and run the coach (memoized per upload)
             data_dir = BASE_DIR / "data"
             data_dir.mkdir(exist_ok=True)
+            run = coach_uploaded_resume(uploaded_file, data_dir)
 
-            resume_path = data_dir / "user_resume.txt"
-
-            # --- Handle TXT Upload ---
-            if uploaded_file.type == "text/plain":
-                content = uploaded_file.read().decode("utf-8", errors="ignore")
-
-            # --- Handle PDF Upload ---
-            elif uploaded_file.type == "application/pdf":
-                content = extract_pdf_text(uploaded_file)
-
-            else:
-                st.error("❌ Unsupported file format")
-                return
-
-            # Save content to TXT so resume_coach can read it
-            with open(resume_path, "w", encoding="utf-8") as f:
-                f.write(content)
-
-            st.success(f" Resume uploaded: {uploaded_file.name}")
-
-            # Step 2⃣ Run Resume Coach
-            with st.spinner(" Analyzing your resume..."):
-                try:
-                    result = run_resume_coach(resume_path)
-                except Exception as e:
-                    st.error(f" Error: {e}")
-                    result = None
-
-            if result:
+            # Step 2⃣ Show the suggestions and the rewritten resume
+            if run:
+                st.success(f" Resume uploaded: {uploaded_file.name}")
                 st.markdown("###  Resume Improvement Suggestions")
-                st.json(result)
-
-                updated_path = Path(result["updated_resume_path"])
-            if updated_path.exists():
-                with open(updated_path, "r", encoding="utf-8") as f:
-                    updated_text = f.read()
+                st.json(run["result"])
 
-                st.text_area(" Updated Resume Draft", updated_text, height=400)
+                if run["updated_text"]:
+                    st.text_area(" Updated Resume Draft", run["updated_text"], height=400)
 
-                with open(updated_path, "rb") as f:
                     st.download_button(
                         label=" Download Updated Resume",
-                        data=f,
+                        data=run["updated_text"],
                         file_name="resume_updated.txt",
                         mime="text/plain"
                     )
-            else:
-                st.warning(" Could not find generated resume file.")
+                else:
+                    st.warning(" Could not find generated resume file.")
         else:
             st.info(" Upload a `.txt` resume to start AI analysis.")
 
@@ -107,15 +159,23 @@ def resume_prep_page():
         st.markdown("Generate personalized interview questions and tips based on your target job role.")
 
         if st.button(" Generate Interview Guide", use_container_width=True):
-            with st.spinner(" Generating interview questions..."):
-                try:
-                    result = run_interview_coach()
-                except Exception as e:
-                    st.error(f" Error: {e}")
-                    result = None
+            # Questions appear as they are generated instead of after the whole guide
+            status = st.empty()
+            status.caption(" Generating interview questions...")
+            live_output = st.empty()
+            renderer = StreamRenderer(live_output)
+            try:
+                result = run_interview_coach(on_token=renderer)
+            except Exception as e:
+                st.error(f" Error: {e}")
+                result = None
+            status.empty()
+            live_output.empty()
 
             if result:
                 st.success(" Interview Guide Created Successfully!")
+                if result.get("failed_sections"):
+                    st.warning(result["message"])
 
                 guide_path = Path(result["guide_path"])
         
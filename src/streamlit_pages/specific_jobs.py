@@ -7,9 +7,8 @@ import streamlit as st
 import sys
 import os
 import json
+import time
 from datetime import datetime
-from dotenv import load_dotenv
-from pathlib import Path
 from io import BytesIO
 import pandas as pd
 
@@ -20,21 +19,28 @@ try:
 except ImportError:
     PLOTLY_AVAILABLE = False
 
-# Load environment variables
-env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
-
-# Import CrewAI components
+# Import CrewAI components (crew and tool modules load on first use)
 try:
-    from crewai import LLM
+    import importlib.util
     sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-    from Crew.linkedin_search_crew import LinkedInSearchCrew
+    from utils.lazy_registry import LazyImport, load_env
+    from utils.llm_client import create_llm
+    from utils.rate_limiter import acquire
+    from utils.llm_cache import get_or_call
+    for _module in ("crewai", "crewai_tools"):
+        if importlib.util.find_spec(_module) is None:
+            raise ImportError(f"No module named '{_module}'")
+    LinkedInSearchCrew = LazyImport("Crew.linkedin_search_crew", "LinkedInSearchCrew")
     CREWAI_AVAILABLE = True
     IMPORT_ERROR = None
 except (ImportError, Exception) as e:
     CREWAI_AVAILABLE = False
     IMPORT_ERROR = str(e)
 
+from utils.search_session import SearchSession
+from utils.crew_cache import cached_crew_output
+from utils.job_queue import job_queue, ensure_workers, queue_enabled, ACTIVE_STATUSES, COMPLETED, CANCELLED
+
 
 # ----------------------------------------------------------------------------
 # Helpers: JSON safe loading and salary parsing
@@ -201,7 +207,12 @@ def get_latest_session_folder():
     if not os.path.exists(linkedin_output_dir):
         return None
     
-    # Get all subdirectories (session folders)
+    # Prefer completed sessions with a manifest
+    latest = SearchSession.latest(linkedin_output_dir, status="completed")
+    if latest:
+        return latest.output_dir
+    
+    # Fallback: folders created before session manifests existed
     try:
         session_folders = [
             f for f in os.listdir(linkedin_output_dir)
@@ -264,6 +275,7 @@ def check_system_status():
     if not CREWAI_AVAILABLE:
         return False, f"CrewAI not available: {IMPORT_ERROR}"
     
+    load_env()
     if not os.getenv("OPENAI_API_KEY"):
         return False, "OpenAI API key not configured"
     
@@ -408,6 +420,10 @@ def render_advanced_search():
                 # Execute search
                 st.markdown("---")
                 execute_linkedin_search(job_title, location, search_params)
+    
+    # Background search submitted in this or an earlier run
+    if st.session_state.get('linkedin_job_id'):
+        render_linkedin_job(st.session_state['linkedin_job_id'])
 
 
 # ============================================================================
@@ -501,6 +517,26 @@ def execute_linkedin_search(job_title, location="", search_params=None):
     st.markdown("###  AI Search in Progress")
     st.markdown("")
     
+    # Each search writes to its own session directory
+    session = SearchSession.create(search_params={
+        "job_title": job_title,
+        "location": location,
+        **(search_params or {})
+    })
+    st.session_state['linkedin_session_id'] = session.session_id
+    
+    if queue_enabled():
+        # Run the crew in a background worker; render_linkedin_job polls it
+        # and shows the postings its LinkedIn tool finds as they arrive
+        st.session_state['linkedin_job_id'] = job_queue.submit("linkedin_search", {
+            "job_title": job_title,
+            "location": location,
+            "session_id": session.session_id,
+            "search_params": search_params or {},
+        }, owner=session.session_id)
+        ensure_workers()
+        return
+    
     progress_bar = st.progress(0)
     status_text = st.empty()
     
@@ -509,8 +545,8 @@ def execute_linkedin_search(job_title, location="", search_params=None):
         status_text.text(" Initializing AI agents...")
         progress_bar.progress(20)
         
-        llm = LLM(model="gpt-4o-mini", temperature=0.7)
-        linkedin_crew = LinkedInSearchCrew(llm=llm)
+        llm = create_llm(model="gpt-4o-mini", temperature=0.7)
+        linkedin_crew = LinkedInSearchCrew(llm=llm, session=session)
         
         # Start search
         status_text.text(f" Searching LinkedIn for '{job_title}'...")
@@ -542,7 +578,7 @@ def execute_linkedin_search(job_title, location="", search_params=None):
         
         # Display results
         st.markdown("---")
-        display_search_results(job_title, location, result)
+        display_search_results(job_title, location, result, session.output_dir)
         
     except Exception as e:
         progress_bar.empty()
@@ -558,12 +594,107 @@ def execute_linkedin_search(job_title, location="", search_params=None):
         display_troubleshooting_tips()
 
 
+def render_linkedin_job(job_id):
+    """Show a background search: live progress while active, results once done"""
+    job = job_queue.get(job_id)
+    if job is None:
+        st.session_state.pop('linkedin_job_id', None)
+        return
+    
+    params = job["params"]
+    if job["status"] in ACTIVE_STATUSES:
+        st.markdown("###  AI Search in Progress")
+        poll_linkedin_job(job_id)
+    elif job["status"] == COMPLETED:
+        st.markdown("---")
+        result = cached_crew_output(job["result"].get("raw", ""))
+        session_dir = SearchSession.load(job["result"]["session_id"]).output_dir if job["result"].get("session_id") else None
+        display_search_results(params["job_title"], params.get("location", ""), result, session_dir)
+    elif job["status"] == CANCELLED:
+        st.info(f" Search for '{params['job_title']}' was cancelled.")
+    else:
+        st.error(f" **Search Error:** {(job['error'] or 'Unknown error').splitlines()[0]}")
+        with st.expander(" View Error Details"):
+            st.code(job["error"] or "", language="python")
+        display_troubleshooting_tips()
+
+
+@st.fragment(run_every=1)
+def poll_linkedin_job(job_id):
+    """Poll the job queue every second without rerunning the whole page"""
+    job = job_queue.get(job_id)
+    if job is None or job["status"] not in ACTIVE_STATUSES:
+        st.rerun()  # Render the final state outside the fragment
+    
+    elapsed = time.time() - (job["started_at"] or job["created_at"])
+    st.progress(job["progress"], text=f"{job['message']} ({elapsed:.0f}s)")
+    
+    # Postings the crew's LinkedIn tool has found so far
+    session = SearchSession.load(job["params"]["session_id"]) if job["params"].get("session_id") else None
+    postings = read_live_postings(session.output_dir) if session else []
+    if postings:
+        st.caption(f" {len(postings)} postings found so far")
+        for number, posting in enumerate(postings, 1):
+            st.markdown(
+                f"**{number}. [{posting['job_title']}]({posting['application_url']})** "
+                f"— {posting['company_name']}"
+            )
+    
+    # Tokens of the task currently generating, streamed by the worker
+    output = job_queue.get_output(job_id)
+    if output and output["text"]:
+        st.caption(f" Live output: {output['task_name'] or 'agent'}")
+        st.code(output["text"][-3000:], language="json")
+    
+    with st.expander(" Agent activity"):
+        for event in job_queue.events(job_id)[-10:]:
+            st.caption(f"{datetime.fromtimestamp(event['created_at']).strftime('%H:%M:%S')}  {event['message']}")
+    
+    if st.button(" Cancel search", key=f"cancel_{job_id}", disabled=job["cancel_requested"]):
+        job_queue.cancel(job_id)
+        st.rerun()
+
+
+def read_live_postings(session_dir):
+    """
+    Postings in the LinkedIn tool's job_postings.jsonl sidecar.
+    
+    The tool appends one posting per line while its search runs (and
+    starts the file over on each call), so the whole file is read on every
+    poll; a line still being written is skipped.
+    """
+    postings = []
+    try:
+        with open(os.path.join(session_dir, "job_postings.jsonl"), 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    postings.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except OSError:
+        return []
+    return postings
+
+
 # ============================================================================
 # RESULTS DISPLAY
 # ============================================================================
 
-def display_search_results(job_title, location, result):
+def resolve_session_dir(session_dir=None):
+    """Session directory to display: explicit, current search, latest, or legacy folder"""
+    if session_dir:
+        return session_dir
+    
+    session_id = st.session_state.get('linkedin_session_id')
+    session = SearchSession.load(session_id) if session_id else None
+    if session is None:
+        session = SearchSession.latest(status="completed")
+    return session.output_dir if session else "src/outputs/linkedin"
+
+
+def display_search_results(job_title, location, result, session_dir=None):
     """Display formatted search results in organized tabs"""
+    session_dir = resolve_session_dir(session_dir)
     
     st.success(f" **Search Complete:** {job_title}" + (f" in {location}" if location else ""))
     
@@ -576,13 +707,13 @@ def display_search_results(job_title, location, result):
     ])
     
     with tabs[0]:
-        display_job_postings_section(result)  # Pass runtime result
+        display_job_postings_section(result, session_dir)  # Pass runtime result
     
     with tabs[1]:
-        display_market_trends_section()
+        display_market_trends_section(session_dir)
     
     with tabs[2]:
-        display_verification_section()
+        display_verification_section(session_dir)
     
     with tabs[3]:
         st.markdown("###  Complete AI Output")
@@ -593,7 +724,7 @@ def display_search_results(job_title, location, result):
     render_search_metrics()
 
 
-def display_job_postings_section(result=None):
+def display_job_postings_section(result=None, session_dir=None):
     """Load and display job postings from JSON or runtime result
     
     Optimized to show top 50 latest posts with enhanced information:
@@ -617,7 +748,7 @@ def display_job_postings_section(result=None):
                 pass
     
     # Priority 2: Fallback to saved JSON file
-    job_file = "src/outputs/linkedin/job_postings.json"
+    job_file = f"{resolve_session_dir(session_dir)}/job_postings.json"
     if postings is None and os.path.exists(job_file):
         try:
             with open(job_file, 'r', encoding='utf-8') as f:
@@ -844,9 +975,9 @@ def display_job_postings_section(result=None):
             st.divider()
 
 
-def display_market_trends_section():
+def display_market_trends_section(session_dir=None):
     """Load and display market trends from JSON"""
-    trends_file = "src/outputs/linkedin/market_trends.json"
+    trends_file = f"{resolve_session_dir(session_dir)}/market_trends.json"
     
     if not os.path.exists(trends_file):
         st.info(" Market trends will appear here after the search completes")
@@ -912,9 +1043,9 @@ def display_market_trends_section():
         st.error(f" Error loading market trends: {e}")
 
 
-def display_verification_section():
+def display_verification_section(session_dir=None):
     """Load and display verification report from JSON"""
-    verify_file = "src/outputs/linkedin/verification_report.json"
+    verify_file = f"{resolve_session_dir(session_dir)}/verification_report.json"
     
     if not os.path.exists(verify_file):
         st.info(" Verification report will appear here after the search completes")
@@ -1077,17 +1208,24 @@ def process_ai_instruction(instruction: str, job_postings: list):
         
         Return ONLY the Python code, no explanations."""
         
-        with st.spinner(" AI is analyzing your request..."):
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"User instruction: {instruction}\n\nGenerate Python code to process the job_postings list."}
+        ]
+        
+        def generate_code():
+            acquire("openai")
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"User instruction: {instruction}\n\nGenerate Python code to process the job_postings list."}
-                ],
+                messages=messages,
                 temperature=0.3
             )
-            
-            code = response.choices[0].message.content.strip()
+            return response.choices[0].message.content
+        
+        with st.spinner(" AI is analyzing your request..."):
+            # Repeated instructions reuse the generated code from the LLM cache
+            code = get_or_call("gpt-4o-mini", {"temperature": 0.3}, messages, generate_code,
+                               allow_temperature=True).strip()
             # Remove markdown code blocks if present
             if code.startswith("```python"):
                 code = code[9:]
@@ -0,0 +1,345 @@
+"""
+Crew Cache - Whole-crew result memoization keyed by normalized inputs
+Stores each crew run's output files and final answer, restores them
+instantly for repeated searches and refreshes stale entries in the background
+
+Freshness is tracked per artifact: job postings expire after a few hours,
+market trends and research summaries last much longer. An entry with an
+expired artifact is still served (stale-while-revalidate) until it is older
+than ``MAX_STALE_SECONDS``, while a background run refreshes it.
+
+Set CREW_CACHE=off to disable caching.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+
+HOUR = 3600
+
+# Per-artifact time-to-live in seconds (override with CREW_CACHE_TTL_<ARTIFACT>, e.g. CREW_CACHE_TTL_JOB_POSTINGS=600)
+DEFAULT_TTLS = {
+    "job_postings": 6 * HOUR,
+    "verification_report": 6 * HOUR,
+    "user_search_params": 7 * 24 * HOUR,
+    "market_trends": 24 * HOUR,
+    "research_data": 7 * 24 * HOUR,
+    "verification_score": 7 * 24 * HOUR,
+    "job_market_summary": 7 * 24 * HOUR,
+}
+FALLBACK_TTL = 6 * HOUR
+
+# How long past its TTL an artifact may still be served while refreshing
+MAX_STALE_SECONDS = 24 * HOUR
+
+# Title tokens that mean the same thing in a job search
+TITLE_SYNONYMS = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "jnr": "junior",
+    "mgr": "manager",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "swe": "software engineer",
+    "sde": "software engineer",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "ds": "data scientist",
+    "ux": "user experience",
+    "qa": "quality assurance",
+}
+
+LOCATION_ALIASES = {
+    "sf": "san francisco, ca",
+    "sfo": "san francisco, ca",
+    "nyc": "new york, ny",
+    "ny": "new york, ny",
+    "la": "los angeles, ca",
+    "dc": "washington, dc",
+    "remote only": "remote",
+    "anywhere": "",
+    "any": "",
+}
+
+# Inputs that never change the result
+IGNORED_INPUTS = {"search_timestamp"}
+EMPTY_VALUES = (None, "", "Any", "any", [], {})
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase, strip punctuation and expand synonyms ("Sr. ML Eng" -> "senior machine learning engineer")"""
+    tokens = re.findall(r"[a-z0-9+#]+", (title or "").lower())
+    return " ".join(TITLE_SYNONYMS.get(token, token) for token in tokens)
+
+
+def normalize_location(location: str) -> str:
+    """
+    Lowercase, tidy comma spacing, drop a trailing country and resolve common
+    aliases ("Portland,OR, USA" -> "portland, or"). The state is kept:
+    "Portland, OR" and "Portland, ME" are different searches.
+    """
+    value = re.sub(r"\s+", " ", (location or "").lower()).strip(" ,")
+    value = re.sub(r"\s*,\s*", ", ", value)
+    value = re.sub(r",\s*(usa|us|united states)$", "", value)
+    return LOCATION_ALIASES.get(value, value)
+
+
+def normalize_inputs(inputs: Dict) -> Dict:
+    """
+    Canonical form of crew inputs for cache keys.
+
+    Titles and locations are normalized, empty filters ("Any", "") are
+    dropped and string filters are lowercased.
+    """
+    normalized = {}
+    for key, value in inputs.items():
+        if key in IGNORED_INPUTS or value in EMPTY_VALUES:
+            continue
+        if key == "job_title":
+            value = normalize_title(value)
+        elif key == "location":
+            value = normalize_location(value)
+        elif isinstance(value, str):
+            value = re.sub(r"\s+", " ", value.lower()).strip()
+        if value in EMPTY_VALUES:
+            continue
+        normalized[key] = value
+    return normalized
+
+
+def cache_key(crew_name: str, inputs: Dict) -> str:
+    """Stable key for a crew and its normalized inputs"""
+    canonical = json.dumps({"crew": crew_name, "inputs": normalize_inputs(inputs)}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:20]
+
+
+def artifact_ttl(artifact: str) -> float:
+    """TTL for an artifact file name (e.g. "job_postings.json")"""
+    name = os.path.splitext(os.path.basename(artifact))[0]
+    override = os.getenv(f"CREW_CACHE_TTL_{name.upper()}")
+    if override:
+        try:
+            return float(override)
+        except ValueError:
+            print(f"⚠️ Ignoring invalid CREW_CACHE_TTL_{name.upper()}={override!r}")
+    return DEFAULT_TTLS.get(name, FALLBACK_TTL)
+
+
+def cache_enabled() -> bool:
+    """Whether the crew cache is turned on (CREW_CACHE env var)"""
+    return os.getenv("CREW_CACHE", "on").lower() not in ("off", "0", "false", "no")
+
+
+class CacheLookup:
+    """Result of a cache lookup"""
+
+    def __init__(self, key: str, entry: Dict, entry_dir: str, stale_artifacts: list):
+        self.key = key
+        self.entry = entry
+        self.entry_dir = entry_dir
+        self.stale_artifacts = stale_artifacts
+
+    @property
+    def is_stale(self) -> bool:
+        return bool(self.stale_artifacts)
+
+    @property
+    def result(self) -> str:
+        return self.entry.get("result", "")
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.entry.get("created_at", time.time())
+
+    def restore(self, destinations: Dict[str, str]) -> Dict[str, str]:
+        """
+        Copy cached artifacts to their destination paths.
+
+        Args:
+            destinations: Mapping of artifact name -> destination path
+
+        Returns:
+            Mapping of artifact name -> restored path (missing artifacts are skipped)
+        """
+        return copy_artifacts(self.entry_dir, destinations)
+
+
+def copy_artifacts(source_dir: str, destinations: Dict[str, str]) -> Dict[str, str]:
+    """
+    Atomically copy ``<source_dir>/<name>`` to each destination path.
+
+    Returns:
+        Mapping of artifact name -> copied path (missing artifacts are skipped)
+    """
+    copied = {}
+    for name, dest in destinations.items():
+        source = os.path.join(source_dir, name)
+        if not os.path.exists(source):
+            continue
+        if os.path.dirname(dest):
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+        tmp_path = f"{dest}.{uuid.uuid4().hex[:6]}.tmp"
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, dest)
+        copied[name] = dest
+    return copied
+
+
+class CrewResultCache:
+    """File-backed cache of whole-crew results with per-artifact TTLs"""
+
+    CACHE_DIR = "src/outputs/cache/crews"
+
+    def __init__(self, cache_dir: Optional[str] = None, max_stale: float = MAX_STALE_SECONDS):
+        self.cache_dir = cache_dir or os.getenv("CREW_CACHE_DIR", self.CACHE_DIR)
+        self.max_stale = max_stale
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0}
+
+    def _entry_dir(self, crew_name: str, key: str) -> str:
+        return os.path.join(self.cache_dir, crew_name, key)
+
+    def get(self, crew_name: str, inputs: Dict) -> Optional[CacheLookup]:
+        """
+        Look up a cached crew result.
+
+        Returns:
+            CacheLookup (possibly stale) or None on a miss or when any artifact
+            is past its TTL plus the stale window
+        """
+        if not cache_enabled():
+            return None
+
+        key = cache_key(crew_name, inputs)
+        entry_dir = self._entry_dir(crew_name, key)
+        try:
+            with open(os.path.join(entry_dir, "entry.json"), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._count("misses")
+            return None
+
+        now = time.time()
+        stale = []
+        for name, saved_at in entry.get("artifacts", {}).items():
+            age = now - saved_at
+            ttl = artifact_ttl(name)
+            if age > ttl + self.max_stale or not os.path.exists(os.path.join(entry_dir, name)):
+                self._count("misses")
+                return None
+            if age > ttl:
+                stale.append(name)
+
+        self._count("stale_hits" if stale else "hits")
+        return CacheLookup(key, entry, entry_dir, stale)
+
+    def put(self, crew_name: str, inputs: Dict, artifacts: Dict[str, str], result: str = "") -> Optional[str]:
+        """
+        Store a crew run.
+
+        Args:
+            crew_name: Cache namespace (e.g. "linkedin_search")
+            inputs: Crew inputs (normalized for the key)
+            artifacts: Mapping of artifact name -> path of the file the crew wrote
+            result: Final crew answer (raw text)
+
+        Returns:
+            The entry directory, or None when caching is disabled or nothing was saved
+        """
+        if not cache_enabled():
+            return None
+
+        key = cache_key(crew_name, inputs)
+        entry_dir = self._entry_dir(crew_name, key)
+        tmp_dir = f"{entry_dir}.{uuid.uuid4().hex[:6]}.tmp"
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        now = time.time()
+        saved = {}
+        for name, path in artifacts.items():
+            if path and os.path.exists(path):
+                shutil.copyfile(path, os.path.join(tmp_dir, name))
+                saved[name] = now
+
+        if not saved and not result:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return None
+
+        entry = {
+            "key": key,
+            "crew": crew_name,
+            "inputs": normalize_inputs(inputs),
+            "created_at": now,
+            "created_at_iso": datetime.now().isoformat(),
+            "artifacts": saved,
+            "result": result,
+        }
+        with open(os.path.join(tmp_dir, "entry.json"), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2, ensure_ascii=False, default=str)
+
+        # Swap the directory in so readers never see a half-written entry
+        old_dir = f"{entry_dir}.{uuid.uuid4().hex[:6]}.old"
+        if os.path.exists(entry_dir):
+            os.replace(entry_dir, old_dir)
+        os.replace(tmp_dir, entry_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+        return entry_dir
+
+    def refresh_in_background(self, key: str, refresh: Callable[[], None]) -> bool:
+        """
+        Run ``refresh`` in a daemon thread unless a refresh for ``key`` is already running.
+
+        Returns:
+            True if a refresh was started
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.stats["refreshes"] += 1
+
+        def _run():
+            try:
+                refresh()
+            except Exception as e:
+                print(f"⚠️ Background cache refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_run, name=f"crew-cache-refresh-{key}", daemon=True).start()
+        return True
+
+    def invalidate(self, crew_name: str, inputs: Dict) -> bool:
+        """Remove a cached entry; returns True if one existed"""
+        entry_dir = self._entry_dir(crew_name, cache_key(crew_name, inputs))
+        if not os.path.exists(entry_dir):
+            return False
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        return True
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+
+def cached_crew_output(raw: str):
+    """Wrap a cached final answer in a CrewOutput so callers can use .raw as usual"""
+    from crewai.crews.crew_output import CrewOutput
+
+    return CrewOutput(raw=raw or "")
+
+
+# Global cache instance
+crew_cache = CrewResultCache()
@@ -0,0 +1,135 @@
+"""
+Crew Jobs - Job queue handlers that run the crews in a worker process
+Each handler takes the job params and a JobContext, reports real progress
+from CrewAI task events and returns a JSON-serializable result
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+from utils.job_queue import JobContext
+
+
+@contextmanager
+def crew_progress(context: JobContext, start: float = 0.1, end: float = 0.95):
+    """
+    Report task start/completion events as job progress.
+
+    Progress moves from ``start`` to ``end`` as tasks complete; the total is
+    taken from the crew the running task belongs to.
+    """
+    from crewai.events import crewai_event_bus, TaskCompletedEvent, TaskStartedEvent
+
+    completed = set()
+
+    def task_label(event) -> str:
+        return getattr(event, "task_name", None) or "task"
+
+    def total_tasks(event) -> int:
+        crew = getattr(getattr(getattr(event, "task", None), "agent", None), "crew", None)
+        return max(len(getattr(crew, "tasks", None) or []), len(completed) + 1)
+
+    def on_started(source, event):
+        done = len(completed) / total_tasks(event)
+        context.progress(start + (end - start) * done, f"Running {task_label(event)}")
+
+    def on_completed(source, event):
+        completed.add(task_label(event))
+        context.progress(start + (end - start) * len(completed) / total_tasks(event),
+                         f"Finished {task_label(event)}")
+
+    crewai_event_bus.on(TaskStartedEvent)(on_started)
+    crewai_event_bus.on(TaskCompletedEvent)(on_completed)
+    try:
+        yield
+    finally:
+        crewai_event_bus.flush()
+        crewai_event_bus.off(TaskStartedEvent, on_started)
+        crewai_event_bus.off(TaskCompletedEvent, on_completed)
+
+
+@contextmanager
+def stream_task_output(context: JobContext, interval: float = 0.5):
+    """
+    Publish each task's answer as it is generated (LLM created with stream=True).
+
+    Chunks are grouped per LLM call, so the page always shows the call in
+    progress (ultimately the final task's answer); writes are throttled to
+    one every ``interval`` seconds.
+    """
+    from crewai.events import crewai_event_bus, LLMStreamChunkEvent, TaskCompletedEvent
+
+    current = {"call_id": None, "task": "", "text": "", "written_at": 0.0}
+
+    def on_chunk(source, event):
+        if event.tool_call or not event.chunk:
+            return
+        if event.call_id != current["call_id"]:
+            current.update(call_id=event.call_id, task=getattr(event, "task_name", None) or "", text="")
+        current["text"] += event.chunk
+        if time.monotonic() - current["written_at"] >= interval:
+            context.output(current["task"], current["text"])
+            current["written_at"] = time.monotonic()
+
+    def on_completed(source, event):
+        if current["text"]:
+            context.output(current["task"], current["text"])
+
+    crewai_event_bus.on(LLMStreamChunkEvent)(on_chunk)
+    crewai_event_bus.on(TaskCompletedEvent)(on_completed)
+    try:
+        yield
+    finally:
+        crewai_event_bus.flush()
+        crewai_event_bus.off(LLMStreamChunkEvent, on_chunk)
+        crewai_event_bus.off(TaskCompletedEvent, on_completed)
+
+
+def run_linkedin_search(params: Dict, context: JobContext) -> Dict:
+    """
+    Run LinkedInSearchCrew.search_jobs for a page-created search session.
+
+    Params: job_title, location, session_id, search_params
+    """
+    from Crew.linkedin_search_crew import LinkedInSearchCrew
+    from utils.llm_client import create_llm
+    from utils.search_session import SearchSession
+
+    session = SearchSession.load(params["session_id"]) if params.get("session_id") else None
+    context.progress(0.05, "Initializing AI agents")
+    llm = create_llm(model="gpt-4o-mini", temperature=0.7, stream=True)
+    linkedin_crew = LinkedInSearchCrew(llm=llm, session=session)
+
+    with crew_progress(context), stream_task_output(context):
+        result = linkedin_crew.search_jobs(
+            job_title=params["job_title"],
+            location=params.get("location", ""),
+            **(params.get("search_params") or {})
+        )
+    return {"session_id": linkedin_crew.session.session_id, "raw": result.raw}
+
+
+def run_job_research(params: Dict, context: JobContext) -> Dict:
+    """
+    Run the O*NET lookup and JobResearchCrew for a job title.
+
+    Params: job_title
+
+    Each job writes into its own research session, whose ID is returned so
+    the page shows this job's results even when other jobs run alongside.
+    """
+    from Crew.research_crew import JobResearchCrew
+    from onet_get import search_top_job
+    from utils.llm_client import create_llm
+    from utils.search_session import SearchSession
+
+    session = SearchSession.create(base_dir=JobResearchCrew.SESSIONS_DIR)
+    context.progress(0.05, "Looking up O*NET occupation")
+    search_top_job(params["job_title"], output_path=session.path("onet_snapshot.json"))
+    context.check_cancelled()
+
+    llm = create_llm(model="gpt-4o-mini", max_completion_tokens=1000)
+    with crew_progress(context):
+        result = JobResearchCrew(llm=llm, session=session).run(params["job_title"])
+    return {"session_id": session.session_id, "raw": result.raw}
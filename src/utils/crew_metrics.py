@@ -0,0 +1,449 @@
+"""
+Crew Metrics - Per-task token, latency, tool and cost instrumentation
+Listens to CrewAI task, LLM and tool events during a crew run and records,
+for each task: wall time, LLM calls and latency, prompt/completion/cached
+tokens, estimated cost, tool calls and retries
+
+Each run is written to a metrics.json (in the session directory when there is
+one) and appended to src/outputs/metrics/metrics.log (JSON lines), which
+devtools/metrics_report.py aggregates.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from utils.llm_cache import get_cache_stats
+from utils.rate_limiter import get_wait_stats
+
+
+METRICS_DIR = "src/outputs/metrics"
+METRICS_LOG = "metrics.log"
+
+# LLM-only collectors open in the current context; create_llm registers new LLMs with them
+_llm_collectors: contextvars.ContextVar = contextvars.ContextVar("llm_collectors", default=())
+
+# USD per 1M tokens: (input, cached input, output)
+MODEL_PRICES = {
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+}
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> float:
+    """Estimated USD cost of a call; unknown models cost 0"""
+    name = (model or "").split("/")[-1]
+    # Longest prefix wins so "gpt-4o-mini-2024-07-18" maps to gpt-4o-mini, not gpt-4o
+    matches = [key for key in MODEL_PRICES if name.startswith(key)]
+    if not matches:
+        return 0.0
+    input_price, cached_price, output_price = MODEL_PRICES[max(matches, key=len)]
+    uncached = max(0, prompt_tokens - cached_tokens)
+    return (uncached * input_price + cached_tokens * cached_price + completion_tokens * output_price) / 1_000_000
+
+
+def _usage_value(usage, *names) -> int:
+    """Read a token count from a usage dict/object under any of the given names"""
+    if usage is None:
+        return 0
+    for name in names:
+        value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+        if isinstance(value, (int, float)):
+            return int(value)
+    return 0
+
+
+def _cached_tokens(usage) -> int:
+    """Cached prompt tokens from OpenAI-style usage (prompt_tokens_details.cached_tokens)"""
+    if usage is None:
+        return 0
+    details = usage.get("prompt_tokens_details") if isinstance(usage, dict) else getattr(usage, "prompt_tokens_details", None)
+    return _usage_value(details, "cached_tokens") or _usage_value(usage, "cached_tokens", "cached_prompt_tokens")
+
+
+class TaskMetrics:
+    """Counters for one task"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.agent = None
+        self.start = None
+        self.end = None
+        self.status = "pending"
+        self.llm_calls = 0
+        self.llm_time_s = 0.0
+        self.llm_failures = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+        self.cost_usd = 0.0
+        self.tool_calls: Dict[str, int] = {}
+        self.tool_errors = 0
+        self.tool_retries = 0
+        self.task_failures = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "task": self.name,
+            "agent": self.agent,
+            "status": self.status,
+            "wall_s": round(self.end - self.start, 3) if self.start and self.end else None,
+            "llm_calls": self.llm_calls,
+            "llm_time_s": round(self.llm_time_s, 3),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "tool_calls": dict(self.tool_calls),
+            "tool_call_count": sum(self.tool_calls.values()),
+            "tool_errors": self.tool_errors,
+            "retries": self.llm_failures + self.tool_retries + self.task_failures,
+        }
+
+
+class CrewMetricsCollector:
+    """
+    Collect metrics for one crew run from the CrewAI event bus.
+
+    Events are filtered by the crew's task IDs, so several crews can be
+    tracked at the same time (e.g. batch searches in threads). Without a crew,
+    calls made outside any crew task by the LLMs registered with ``add_llm``
+    (the coaches) are recorded as a single task named after the run.
+    """
+
+    def __init__(self, crew, crew_name: str, output_dir: Optional[str] = None, metrics_dir: str = None):
+        self.crew_name = crew_name
+        self.output_dir = output_dir
+        self.metrics_dir = metrics_dir or os.getenv("CREW_METRICS_DIR", METRICS_DIR)
+        self.run_id = uuid.uuid4().hex[:8]
+        self.llm_only = crew is None
+        if self.llm_only:
+            self.task_ids = {}
+            self.tasks: Dict[str, TaskMetrics] = {crew_name: TaskMetrics(crew_name)}
+        else:
+            self.task_ids = {str(task.id): (getattr(task, "name", None) or task.description[:40]) for task in crew.tasks}
+            self.tasks = {name: TaskMetrics(name) for name in self.task_ids.values()}
+        # id -> LLM; holding the objects keeps their ids unique for the run
+        self.llms: Dict[int, object] = {}
+        self.llm_starts: Dict[str, float] = {}
+        self.lock = threading.Lock()
+        self.handlers = []
+        self.start = None
+        self.end = None
+        self.status = "running"
+        self._cache_before = {}
+        self._wait_before = {}
+
+    # ------------------------------------------------------------------
+    # Event handling
+    # ------------------------------------------------------------------
+    def add_llm(self, llm):
+        """Count the calls of ``llm`` toward this run (LLM-only runs)"""
+        with self.lock:
+            self.llms[id(llm)] = llm
+
+    def _task_for(self, source, event) -> Optional[TaskMetrics]:
+        task_id = getattr(event, "task_id", None)
+        if task_id is None and getattr(event, "task", None) is not None:
+            task_id = str(event.task.id)
+        if self.llm_only:
+            # LLM events are emitted by the LLM instance itself
+            return self.tasks[self.crew_name] if task_id is None and id(source) in self.llms else None
+        name = self.task_ids.get(str(task_id)) if task_id is not None else None
+        return self.tasks.get(name) if name else None
+
+    @staticmethod
+    def _stamp(event) -> float:
+        timestamp = getattr(event, "timestamp", None)
+        return timestamp.timestamp() if timestamp else time.time()
+
+    def _on_task_started(self, source, event):
+        metrics = self._task_for(source, event)
+        if metrics:
+            with self.lock:
+                metrics.start = metrics.start or self._stamp(event)
+                task_agent = getattr(getattr(event, "task", None), "agent", None)
+                role = getattr(event, "agent_role", None) or getattr(task_agent, "role", None)
+                metrics.agent = metrics.agent or (role.strip() if role else None)
+                metrics.status = "running"
+
+    def _on_task_completed(self, source, event):
+        metrics = self._task_for(source, event)
+        if metrics:
+            with self.lock:
+                metrics.end = self._stamp(event)
+                metrics.status = "completed"
+
+    def _on_task_failed(self, source, event):
+        metrics = self._task_for(source, event)
+        if metrics:
+            with self.lock:
+                metrics.end = self._stamp(event)
+                metrics.task_failures += 1
+                metrics.status = "failed"
+
+    def _on_llm_started(self, source, event):
+        if self._task_for(source, event):
+            with self.lock:
+                self.llm_starts[getattr(event, "call_id", None) or event.event_id] = self._stamp(event)
+
+    def _on_llm_completed(self, source, event):
+        metrics = self._task_for(source, event)
+        if not metrics:
+            return
+        usage = getattr(event, "usage", None)
+        prompt = _usage_value(usage, "prompt_tokens", "input_tokens")
+        completion = _usage_value(usage, "completion_tokens", "output_tokens")
+        cached = _cached_tokens(usage)
+        with self.lock:
+            started = self.llm_starts.pop(getattr(event, "call_id", None) or event.event_id, None)
+            metrics.llm_calls += 1
+            if started:
+                metrics.llm_time_s += self._stamp(event) - started
+            metrics.prompt_tokens += prompt
+            metrics.completion_tokens += completion
+            metrics.cached_tokens += cached
+            metrics.cost_usd += estimate_cost(getattr(event, "model", ""), prompt, completion, cached)
+
+    def _on_llm_failed(self, source, event):
+        metrics = self._task_for(source, event)
+        if metrics:
+            with self.lock:
+                metrics.llm_failures += 1
+
+    def _on_tool_finished(self, source, event):
+        metrics = self._task_for(source, event)
+        if metrics:
+            with self.lock:
+                tool = getattr(event, "tool_name", None) or "unknown"
+                metrics.tool_calls[tool] = metrics.tool_calls.get(tool, 0) + 1
+                metrics.tool_retries += max(0, (getattr(event, "run_attempts", 1) or 1) - 1)
+
+    def _on_tool_error(self, source, event):
+        metrics = self._task_for(source, event)
+        if metrics:
+            with self.lock:
+                metrics.tool_errors += 1
+
+    def attach(self):
+        """Register event handlers (no-op when the CrewAI event bus is unavailable)"""
+        try:
+            from crewai.events import (
+                crewai_event_bus, LLMCallCompletedEvent, LLMCallFailedEvent, LLMCallStartedEvent,
+                TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent,
+                ToolUsageErrorEvent, ToolUsageFinishedEvent,
+            )
+        except ImportError:
+            print("⚠️ CrewAI event bus unavailable; crew metrics disabled")
+            return
+
+        self.handlers = [
+            (TaskStartedEvent, self._on_task_started),
+            (TaskCompletedEvent, self._on_task_completed),
+            (TaskFailedEvent, self._on_task_failed),
+            (LLMCallStartedEvent, self._on_llm_started),
+            (LLMCallCompletedEvent, self._on_llm_completed),
+            (LLMCallFailedEvent, self._on_llm_failed),
+            (ToolUsageFinishedEvent, self._on_tool_finished),
+            (ToolUsageErrorEvent, self._on_tool_error),
+        ]
+        for event_type, handler in self.handlers:
+            crewai_event_bus.on(event_type)(handler)
+
+        self.start = time.time()
+        if self.llm_only:
+            self.tasks[self.crew_name].start = self.start
+            self.tasks[self.crew_name].status = "running"
+        self._cache_before = get_cache_stats()
+        self._wait_before = get_wait_stats()
+
+    def detach(self, status: str = "completed"):
+        """Flush pending events and unregister handlers"""
+        self.end = time.time()
+        self.status = status
+        if self.llm_only:
+            self.tasks[self.crew_name].end = self.end
+            self.tasks[self.crew_name].status = status
+        if not self.handlers:
+            return
+        from crewai.events import crewai_event_bus
+
+        crewai_event_bus.flush()
+        for event_type, handler in self.handlers:
+            crewai_event_bus.off(event_type, handler)
+        self.handlers = []
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict:
+        """Run summary with per-task metrics"""
+        tasks = [metrics.to_dict() for metrics in self.tasks.values()]
+        cache_after = get_cache_stats()
+        wait_after = get_wait_stats()
+        return {
+            "run_id": self.run_id,
+            "crew": self.crew_name,
+            "status": self.status,
+            "timestamp": datetime.now().isoformat(),
+            "output_dir": self.output_dir,
+            "wall_s": round(self.end - self.start, 3) if self.start and self.end else None,
+            "totals": {
+                "llm_calls": sum(task["llm_calls"] for task in tasks),
+                "prompt_tokens": sum(task["prompt_tokens"] for task in tasks),
+                "completion_tokens": sum(task["completion_tokens"] for task in tasks),
+                "cached_tokens": sum(task["cached_tokens"] for task in tasks),
+                "cost_usd": round(sum(task["cost_usd"] for task in tasks), 6),
+                "tool_calls": sum(task["tool_call_count"] for task in tasks),
+                "retries": sum(task["retries"] for task in tasks),
+                "llm_cache_hits": cache_after.get("hits", 0) - self._cache_before.get("hits", 0),
+                "rate_limit_wait_s": round(sum(
+                    stats["total_wait_s"] - self._wait_before.get(provider, {}).get("total_wait_s", 0.0)
+                    for provider, stats in wait_after.items()
+                ), 3),
+            },
+            "tasks": tasks,
+        }
+
+    def save(self) -> Dict:
+        """Write metrics.json and append the run to the metrics log"""
+        data = self.to_dict()
+        os.makedirs(self.metrics_dir, exist_ok=True)
+
+        if self.output_dir:
+            metrics_path = os.path.join(self.output_dir, "metrics.json")
+        else:
+            metrics_path = os.path.join(self.metrics_dir, f"{self.crew_name}_{self.run_id}.json")
+        try:
+            with open(metrics_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Single O_APPEND write per run so concurrent crews never interleave lines
+            line = (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+            fd = os.open(os.path.join(self.metrics_dir, METRICS_LOG), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            print(f"⚠️ Warning: Could not save crew metrics: {e}")
+        return data
+
+
+@contextmanager
+def track_crew(crew, crew_name: str, output_dir: Optional[str] = None):
+    """
+    Record metrics for a crew run.
+
+    Usage:
+        crew = self.crew()
+        with track_crew(crew, "linkedin_search", session.output_dir):
+            result = crew.kickoff(inputs=inputs)
+    """
+    collector = CrewMetricsCollector(crew, crew_name, output_dir)
+    collector.attach()
+    status = "completed"
+    try:
+        yield collector
+    except BaseException:
+        status = "failed"
+        raise
+    finally:
+        collector.detach(status)
+        summary = collector.save()
+        totals = summary["totals"]
+        print(f"📈 {crew_name}: {summary['wall_s']}s, {totals['llm_calls']} LLM calls, "
+              f"{totals['prompt_tokens'] + totals['completion_tokens']} tokens "
+              f"({totals['cached_tokens']} cached), ${totals['cost_usd']:.4f}")
+
+
+@contextmanager
+def track_llm_calls(name: str, output_dir: Optional[str] = None):
+    """
+    Record metrics for LLM calls made outside a crew (e.g. the coaches).
+
+    Usage:
+        with track_llm_calls("resume_coach"):
+            llm = create_llm(model="gpt-4o-mini")
+            text = call_llm(llm, prompt)
+
+    Only LLMs created with create_llm inside the block are counted, so runs
+    that overlap in other threads keep separate totals. Worker threads must
+    run in a copy of the caller's context (contextvars.copy_context().run).
+    """
+    with track_crew(None, name, output_dir) as collector:
+        token = _llm_collectors.set(_llm_collectors.get() + (collector,))
+        try:
+            yield collector
+        finally:
+            _llm_collectors.reset(token)
+
+
+def register_llm(llm):
+    """Attach a new LLM to the LLM-only runs tracked in the current context"""
+    for collector in _llm_collectors.get():
+        collector.add_llm(llm)
+
+
+def load_metrics_log(path: Optional[str] = None) -> List[Dict]:
+    """Read every run from the append-only metrics log"""
+    path = path or os.path.join(os.getenv("CREW_METRICS_DIR", METRICS_DIR), METRICS_LOG)
+    if not os.path.exists(path):
+        return []
+    runs = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                runs.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return runs
+
+
+def summarize_runs(runs: List[Dict]) -> Dict:
+    """
+    Aggregate runs by crew and task.
+
+    Returns:
+        Dict of crew -> {runs, mean_wall_s, total_cost_usd, tasks: {task -> averages}}
+    """
+    summary = {}
+    for run in runs:
+        crew = summary.setdefault(run["crew"], {"runs": 0, "wall_s": [], "cost_usd": 0.0, "tasks": {}})
+        crew["runs"] += 1
+        if run.get("wall_s") is not None:
+            crew["wall_s"].append(run["wall_s"])
+        crew["cost_usd"] += run.get("totals", {}).get("cost_usd", 0.0)
+        for task in run.get("tasks", []):
+            stats = crew["tasks"].setdefault(task["task"], {
+                "runs": 0, "wall_s": 0.0, "llm_time_s": 0.0, "llm_calls": 0, "prompt_tokens": 0,
+                "completion_tokens": 0, "cached_tokens": 0, "cost_usd": 0.0, "tool_calls": 0, "retries": 0,
+            })
+            stats["runs"] += 1
+            stats["wall_s"] += task.get("wall_s") or 0.0
+            for field in ("llm_time_s", "llm_calls", "prompt_tokens", "completion_tokens", "cached_tokens",
+                          "cost_usd", "retries"):
+                stats[field] += task.get(field, 0) or 0
+            stats["tool_calls"] += task.get("tool_call_count", 0)
+
+    for crew in summary.values():
+        walls = crew.pop("wall_s")
+        crew["mean_wall_s"] = round(sum(walls) / len(walls), 3) if walls else None
+        crew["total_cost_usd"] = round(crew.pop("cost_usd"), 6)
+        for stats in crew["tasks"].values():
+            runs = stats["runs"]
+            for field in list(stats):
+                if field != "runs":
+                    stats[f"mean_{field}"] = round(stats.pop(field) / runs, 4)
+    return summary
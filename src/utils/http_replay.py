@@ -0,0 +1,156 @@
+"""
+HTTP Replay - Record/replay layer for outbound Serper and O*NET requests
+Captures real responses to a fixture directory and serves them back offline,
+so searches can run without live keys or network access
+
+Modes (HTTP_REPLAY_MODE env var):
+- off     (default) send requests normally
+- record  send requests and save each response as a fixture
+- replay  never touch the network; answer from fixtures only
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from utils.rate_limiter import acquire
+
+
+MODE_ENV = "HTTP_REPLAY_MODE"
+FIXTURE_DIR_ENV = "HTTP_FIXTURE_DIR"
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   "data", "fixtures", "http")
+
+# Base URLs can be pointed at the local stand-in server (devtools/serper_stub_server.py)
+SERPER_BASE_URL_ENV = "SERPER_BASE_URL"
+ONET_BASE_URL_ENV = "ONET_BASE_URL"
+
+
+class FixtureNotFoundError(RuntimeError):
+    """Raised in replay mode when no fixture matches a request"""
+
+
+class ReplayResponse:
+    """Minimal stand-in for requests.Response built from a fixture"""
+
+    def __init__(self, status_code: int, body: str, headers: Optional[Dict] = None):
+        self.status_code = status_code
+        self.text = body
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error from replayed response", response=self)
+
+
+def serper_url(endpoint: str = "search") -> str:
+    """Build a Serper endpoint URL, honouring SERPER_BASE_URL"""
+    base = os.getenv(SERPER_BASE_URL_ENV, "https://google.serper.dev")
+    return f"{base.rstrip('/')}/{endpoint}"
+
+
+def onet_base_url() -> str:
+    """O*NET web services base URL, honouring ONET_BASE_URL"""
+    return os.getenv(ONET_BASE_URL_ENV, "https://services.onetcenter.org/ws").rstrip("/")
+
+
+def replay_mode() -> str:
+    """Current replay mode: off, record or replay"""
+    return os.getenv(MODE_ENV, "off").lower()
+
+
+def fixture_dir() -> str:
+    """Directory where fixtures are read from and recorded to"""
+    return os.getenv(FIXTURE_DIR_ENV, DEFAULT_FIXTURE_DIR)
+
+
+def fixture_key(method: str, path: str, params: Optional[Dict] = None, body=None) -> str:
+    """
+    Build a host-independent key for a request.
+
+    The host is left out so fixtures recorded against the real API also match
+    requests sent to the local stand-in server. Credentials never enter the key.
+    """
+    canonical = json.dumps({
+        "method": method.upper(),
+        "path": "/" + path.strip("/"),
+        "params": {k: str(v) for k, v in sorted((params or {}).items())},
+        "body": body,
+    }, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:24]
+
+
+def fixture_path(key: str, directory: Optional[str] = None) -> str:
+    """Path of the fixture file for a key"""
+    return os.path.join(directory or fixture_dir(), f"{key}.json")
+
+
+def load_fixture(key: str, directory: Optional[str] = None) -> Optional[Dict]:
+    """Load a recorded fixture, or None if it does not exist"""
+    path = fixture_path(key, directory)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_fixture(key: str, request_info: Dict, response, directory: Optional[str] = None) -> str:
+    """Save a response as a fixture and return its path"""
+    path = fixture_path(key, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fixture = {
+        "request": request_info,
+        "response": {
+            "status_code": response.status_code,
+            "headers": {"Content-Type": response.headers.get("Content-Type", "application/json")},
+            "body": response.text,
+        },
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(fixture, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def http_request(method: str, url: str, provider: Optional[str] = None, params: Optional[Dict] = None,
+                 json_body=None, **kwargs):
+    """
+    Send an HTTP request through the rate limiter and the record/replay layer.
+
+    Args:
+        method: HTTP method
+        url: Full request URL
+        provider: Rate-limit provider name (e.g. "serper", "onet"); None skips limiting
+        params: Query string parameters
+        json_body: JSON request body
+        **kwargs: Passed to requests.request (headers, auth, timeout, ...)
+
+    Returns:
+        requests.Response, or ReplayResponse in replay mode
+    """
+    path = urlsplit(url).path
+    key = fixture_key(method, path, params, json_body)
+    mode = replay_mode()
+
+    if mode == "replay":
+        fixture = load_fixture(key)
+        if fixture is None:
+            raise FixtureNotFoundError(f"No fixture {key} for {method.upper()} {path} (params={params}, body={json_body})")
+        response = fixture["response"]
+        return ReplayResponse(response["status_code"], response["body"], response.get("headers"))
+
+    if provider:
+        acquire(provider)
+    response = requests.request(method, url, params=params, json=json_body, **kwargs)
+
+    if mode == "record":
+        request_info = {"method": method.upper(), "path": path, "params": params, "body": json_body}
+        save_fixture(key, request_info, response)
+
+    return response
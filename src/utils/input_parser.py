@@ -0,0 +1,332 @@
+"""
+Input Parser - Rule-based fast path for dashboard input processing
+Turns "Data Scientist" plus a location into the structured search parameters
+the input-processing agents produce, without an LLM call. Titles are matched
+against a dictionary of O*NET sample reported job titles (data/onet/sample_titles.json
+plus the current O*NET snapshot); seniority prefixes, plurals and small typos
+are handled. Inputs the parser is not confident about go to the LLM as before,
+and the share of inputs handled locally is logged
+
+Usage:
+    from utils.input_parser import parse_dashboard_input, get_parser_stats
+
+    parsed = parse_dashboard_input("Sr. Data Scientist in Austin, TX")
+    if parsed is None:
+        ...  # low confidence: run the LLM task
+"""
+
+import difflib
+import json
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from utils.skill_matcher import ONET_SNAPSHOT_PATH, SRC_DIR, acronym_pairs, normalize
+
+SAMPLE_TITLES_PATH = os.path.join(SRC_DIR, "data", "onet", "sample_titles.json")
+
+# Below this confidence the input goes to the LLM
+MIN_CONFIDENCE = float(os.getenv("INPUT_PARSER_MIN_CONFIDENCE", "0.85"))
+
+# Normalized seniority words -> how they are written in the job title
+SENIORITY = {
+    "senior": "Senior", "sr": "Senior", "junior": "Junior", "jr": "Junior",
+    "lead": "Lead", "principal": "Principal", "staff": "Staff", "chief": "Chief",
+    "entry level": "Entry Level", "associate": "Associate", "intern": "Intern",
+}
+
+# Filter values the LinkedIn input-processing task accepts (config/linkedin_tasks.yaml)
+FILTER_VALUES = {
+    "job_type": ["Full-time", "Part-time", "Internship", "Contract", "Temporary", "Any"],
+    "remote_option": ["Remote", "Hybrid", "On-site", "Any"],
+    "date_posted": ["Past 24 hours", "Past week", "Past month", "Any time"],
+    "work_authorization": ["OPT", "CPT", "US Visa Sponsorship", "Any"],
+}
+
+US_STATES = {
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "DC", "FL", "GA", "HI", "ID", "IL", "IN", "IA",
+    "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM",
+    "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA",
+    "WV", "WI", "WY",
+}
+
+# Cities accepted as a location without a state ("Nurse near Boston")
+KNOWN_CITIES = {
+    "new york", "new york city", "nyc", "los angeles", "chicago", "houston", "phoenix", "philadelphia",
+    "san antonio", "san diego", "dallas", "austin", "san jose", "san francisco", "seattle", "denver",
+    "boston", "washington", "washington dc", "atlanta", "miami", "minneapolis", "portland", "detroit",
+    "nashville", "charlotte", "pittsburgh", "raleigh", "salt lake city", "las vegas", "baltimore",
+    "bay area", "silicon valley",
+}
+
+# Locations that are not places
+REMOTE_LOCATIONS = {"remote", "hybrid", "anywhere", "united states", "usa", "us"}
+
+# "Data Scientist in Austin, TX", "Nurse near Boston", "Analyst @ Remote", "Data Analyst - Remote"
+LOCATION_SEPARATOR_RE = re.compile(r"\s+(?:in|near|@|-)\s+", re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def load_title_dictionary(sample_path: str = SAMPLE_TITLES_PATH,
+                          snapshot_path: str = ONET_SNAPSHOT_PATH) -> Dict[str, Dict]:
+    """
+    Normalized job title -> {"title", "code", "occupation"} from the O*NET
+    sample titles file and the sample titles of the current O*NET snapshot.
+    """
+    occupations = []
+    for path in (sample_path, snapshot_path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        if "occupations" in data:
+            occupations += data["occupations"]
+        elif data.get("title"):
+            occupations.append({
+                "code": data.get("code", ""),
+                "title": data["title"],
+                "sample_titles": (data.get("sample_of_reported_job_titles") or {}).get("title", []),
+            })
+
+    titles = {}
+    for occupation in occupations:
+        for sample in occupation.get("sample_titles", []):
+            # "IT Manager (Information Technology Manager)" -> "IT Manager" and its expansion
+            outer = re.sub(r"\s*\(.*\)\s*$", "", sample).strip()
+            names = [outer] + [outer.replace(short, long.title()) for short, long in acronym_pairs(sample)]
+            for name in names:
+                titles.setdefault(normalize(name), {
+                    "title": name, "code": occupation.get("code", ""), "occupation": occupation.get("title", ""),
+                })
+    return titles
+
+
+def _singular(text: str) -> str:
+    """'data scientists' -> 'data scientist' (last word only)"""
+    if text.endswith("ies"):
+        return text[:-3] + "y"
+    if text.endswith("s") and not text.endswith("ss"):
+        return text[:-1]
+    return text
+
+
+def match_title(text: str) -> Tuple[Optional[Dict], float]:
+    """
+    Find a job title in the dictionary.
+
+    Returns:
+        (entry with the job title as it should be searched, confidence 0-1),
+        or (None, 0.0) when nothing is close
+    """
+    titles = load_title_dictionary()
+    normalized = normalize(text)
+    if not normalized:
+        return None, 0.0
+
+    seniority, base = "", normalized
+    for prefix in sorted(SENIORITY, key=len, reverse=True):
+        if normalized.startswith(prefix + " "):
+            seniority, base = SENIORITY[prefix], normalized[len(prefix) + 1:]
+            break
+
+    candidates = [(normalized, "", 1.0), (base, seniority, 0.95),
+                  (_singular(normalized), "", 0.9), (_singular(base), seniority, 0.9)]
+    for key, prefix, confidence in candidates:
+        if key in titles:
+            entry = titles[key]
+            return {**entry, "title": f"{prefix} {entry['title']}".strip()}, confidence
+
+    close = difflib.get_close_matches(base, titles, n=1, cutoff=0.8)
+    if close:
+        entry = titles[close[0]]
+        ratio = difflib.SequenceMatcher(None, base, close[0]).ratio()
+        return {**entry, "title": f"{seniority} {entry['title']}".strip()}, round(ratio * 0.95, 3)
+    return None, 0.0
+
+
+def normalize_location(location: str) -> str:
+    """'austin,tx' -> 'Austin, TX'; 'remote' -> 'Remote'"""
+    parts = [part.strip() for part in re.split(r",", location or "") if part.strip()]
+    if len(parts) == 1:
+        words = parts[0].split()
+        if len(words) > 1 and words[-1].upper() in US_STATES:
+            parts = [" ".join(words[:-1]), words[-1]]
+    return ", ".join(part.upper() if part.upper() in US_STATES else part.title() for part in parts)
+
+
+def looks_like_location(text: str) -> bool:
+    """True for "Austin, TX", "austin tx", "Remote" or a known city; False for "Test" """
+    words = (text or "").replace(",", " ").split()
+    if not words:
+        return False
+    return words[-1].upper() in US_STATES or normalize(text) in REMOTE_LOCATIONS | KNOWN_CITIES
+
+
+def split_location(user_input: str) -> Tuple[str, str]:
+    """
+    Split "Data Scientist in Austin, TX" into ("Data Scientist", "Austin, TX").
+
+    The text after "in", "near", "@", "-" or a comma is only taken as the
+    location when it looks like one, so "Software Engineer in Test" stays
+    a single job title.
+    """
+    text = " ".join((user_input or "").split())
+    # Last separator first: "Software Engineer in Test in Austin, TX"
+    for separator in reversed(list(LOCATION_SEPARATOR_RE.finditer(text))):
+        if looks_like_location(text[separator.end():]):
+            return text[:separator.start()], text[separator.end():]
+    # "Data Scientist, Austin, TX" / "Nurse, Remote"
+    title, _, rest = text.partition(",")
+    if looks_like_location(rest):
+        return title.strip(), rest.strip()
+    return text, ""
+
+
+def _filter_value(field: str, value: Optional[str]) -> Optional[str]:
+    """Accepted spelling of a filter value, "Any" for empty ones, None if unknown"""
+    if not value or value.strip().lower() in ("any", "any time", "all", "none"):
+        return FILTER_VALUES[field][-1]
+    lookup = {normalize(allowed): allowed for allowed in FILTER_VALUES[field]}
+    return lookup.get(normalize(value))
+
+
+class InputParser:
+    """Rule-based dashboard input parser with fast-path hit statistics"""
+
+    def __init__(self, min_confidence: float = MIN_CONFIDENCE):
+        self.min_confidence = min_confidence
+        self.stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def _record(self, text: str, hit: bool, confidence: float):
+        with self._lock:
+            self.stats["hits" if hit else "misses"] += 1
+            hits, total = self.stats["hits"], self.stats["hits"] + self.stats["misses"]
+        rate = f"fast path {hits}/{total} ({hits / total:.0%})"
+        if hit:
+            print(f"⚡ Parsed '{text}' locally (confidence {confidence:.2f}; {rate})")
+        else:
+            print(f"🤖 Low confidence ({confidence:.2f}) for '{text}', using the LLM ({rate})")
+
+    def parse(self, user_input: str, location: Optional[str] = None) -> Optional[Dict]:
+        """
+        Parse free-text dashboard input (tasks.yaml dashboard_input_processing_task).
+
+        Args:
+            user_input: Job title, optionally with a location ("Nurse in Boston, MA")
+            location: Location from a separate field (wins over one in the text)
+
+        Returns:
+            Dict with request_type, job_title, location, keywords,
+            routing_recommendation, processed_query, onet_code and
+            confidence, or None when the LLM should process the input
+        """
+        title_text, found_location = split_location(user_input)
+        entry, confidence = match_title(title_text)
+        hit = entry is not None and confidence >= self.min_confidence
+        self._record(user_input, hit, confidence)
+        if not hit:
+            return None
+
+        location = normalize_location(location or found_location)
+        return {
+            "request_type": "location_search" if location else "job_research",
+            "job_title": entry["title"],
+            "location": location,
+            "keywords": normalize(entry["title"]).split(),
+            "routing_recommendation": "linkedin_scraper" if location else "lead_research_analyst",
+            "processed_query": f"{entry['title']} {location}".strip(),
+            "onet_code": entry["code"],
+            "confidence": confidence,
+        }
+
+    def parse_search(self, inputs: Dict) -> Optional[Dict]:
+        """
+        Parse LinkedIn search inputs (linkedin_tasks.yaml dashboard_input_processing_task).
+
+        Args:
+            inputs: Crew inputs with job_title, location and the search filters
+
+        Returns:
+            The task's JSON output as a dict, or None when a title or filter
+            is not recognised confidently
+        """
+        entry, confidence = match_title(inputs.get("job_title", ""))
+        filters = {field: _filter_value(field, inputs.get(field)) for field in FILTER_VALUES}
+        if None in filters.values():
+            confidence = 0.0  # an unrecognised filter value needs the LLM
+        hit = entry is not None and confidence >= self.min_confidence
+        self._record(inputs.get("job_title", ""), hit, confidence)
+        if not hit:
+            return None
+
+        location = normalize_location(inputs.get("location", ""))
+        company = (inputs.get("company") or "").strip()
+        return {
+            "request_type": "linkedin_job_search",
+            "search_parameters": {
+                "job_title": entry["title"],
+                "location": location,
+                "company": "" if company.lower() in ("", "any", "all") else company,
+                **filters,
+            },
+            "routing_recommendation": "linkedin_scraper",
+            "processed_query": f"site:linkedin.com/jobs {entry['title']} {location}".strip(),
+            "validation_status": "valid",
+            "validation_errors": [],
+        }
+
+    def get_stats(self) -> Dict:
+        """Fast-path hits, misses and hit rate for this process"""
+        with self._lock:
+            total = self.stats["hits"] + self.stats["misses"]
+            return {**self.stats, "hit_rate": round(self.stats["hits"] / total, 3) if total else 0.0}
+
+
+def complete_task_locally(task, data: Dict, agent_role: str = "") -> str:
+    """
+    Give a CrewAI task an output without running it, so tasks that list it
+    as context receive ``data``; the task's output file is written as well.
+
+    Returns:
+        The raw JSON output
+    """
+    from crewai.tasks.task_output import TaskOutput
+
+    raw = json.dumps(data, indent=2, ensure_ascii=False)
+    task.output = TaskOutput(
+        description=task.description,
+        name=getattr(task, "name", None),
+        expected_output=task.expected_output,
+        raw=raw,
+        json_dict=data,
+        agent=agent_role or getattr(task.agent, "role", "") or "",
+    )
+    if task.output_file:
+        os.makedirs(os.path.dirname(task.output_file) or ".", exist_ok=True)
+        with open(task.output_file, "w", encoding="utf-8") as f:
+            f.write(raw)
+    return raw
+
+
+# Global parser instance
+input_parser = InputParser()
+
+
+# Convenience functions for direct use
+def parse_dashboard_input(user_input: str, location: Optional[str] = None) -> Optional[Dict]:
+    """Parse free-text dashboard input, None when the LLM should handle it"""
+    return input_parser.parse(user_input, location)
+
+
+def parse_search_inputs(inputs: Dict) -> Optional[Dict]:
+    """Parse LinkedIn search inputs, None when the LLM should handle them"""
+    return input_parser.parse_search(inputs)
+
+
+def get_parser_stats() -> Dict:
+    """Get fast-path statistics from the global input parser"""
+    return input_parser.get_stats()
@@ -0,0 +1,504 @@
+"""
+Job Queue - SQLite-backed background queue for crew runs
+Streamlit pages submit a job and poll its status instead of calling kickoff
+on the script thread; separate worker processes claim queued jobs and run
+each one in a child process, so a rerun or closed tab never loses a run and
+a running job can be cancelled by terminating its child
+
+Job lifecycle: queued -> running -> completed | failed | cancelled
+
+Usage:
+    from utils.job_queue import job_queue, ensure_workers
+
+    job_id = job_queue.submit("linkedin_search", {"job_title": "Data Analyst"})
+    ensure_workers()
+    job_queue.get(job_id)["status"]
+
+Run workers by hand (otherwise ensure_workers starts them on demand):
+    python src/utils/job_queue.py --workers 2
+
+Environment variables:
+- JOB_QUEUE=on|off        run crews through the queue (default on)
+- JOB_QUEUE_PATH          SQLite file (default src/outputs/jobs/job_queue.sqlite3)
+- JOB_WORKERS             worker processes kept alive by ensure_workers (default 2)
+"""
+
+import importlib
+import json
+import multiprocessing
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+DEFAULT_QUEUE_PATH = os.path.join(SRC_DIR, "outputs", "jobs", "job_queue.sqlite3")
+DEFAULT_WORKERS = 2
+
+QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED = "queued", "running", "completed", "failed", "cancelled"
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+FINAL_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+# Seconds without a heartbeat before a worker (and its running job) is considered dead
+HEARTBEAT_TIMEOUT = 30.0
+POLL_INTERVAL = 1.0
+
+# Job kind -> "module:function" handler, imported only inside the worker
+JOB_HANDLERS = {
+    "linkedin_search": "utils.crew_jobs:run_linkedin_search",
+    "job_research": "utils.crew_jobs:run_job_research",
+}
+
+
+def queue_enabled() -> bool:
+    """Whether pages should run crews through the queue (JOB_QUEUE env var)"""
+    return os.getenv("JOB_QUEUE", "on").lower() not in ("off", "0", "false", "no")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested"""
+
+
+class JobContext:
+    """Handed to job handlers for progress reporting and cancellation checks"""
+
+    def __init__(self, queue: "JobQueue", job_id: str):
+        self.queue = queue
+        self.job_id = job_id
+
+    def progress(self, fraction: float, message: str = ""):
+        """Record progress (0..1) and an event message"""
+        self.queue.add_event(self.job_id, message, progress=fraction)
+
+    def output(self, task_name: str, text: str):
+        """Publish the partial output of the task that is currently generating"""
+        self.queue.set_output(self.job_id, task_name, text)
+
+    def check_cancelled(self):
+        """Raise JobCancelled if the job was cancelled"""
+        if self.queue.cancel_requested(self.job_id):
+            raise JobCancelled(self.job_id)
+
+
+class JobQueue:
+    """Jobs, their progress events and worker heartbeats in one SQLite file"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("JOB_QUEUE_PATH", DEFAULT_QUEUE_PATH)
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _connection(self, immediate: bool = False):
+        """Open the queue database, creating the tables on first use"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            if not self._initialized:
+                with self._lock:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript("""
+                        CREATE TABLE IF NOT EXISTS jobs (
+                            id TEXT PRIMARY KEY,
+                            kind TEXT NOT NULL,
+                            params TEXT,
+                            status TEXT NOT NULL,
+                            progress REAL DEFAULT 0,
+                            message TEXT DEFAULT '',
+                            result TEXT,
+                            error TEXT,
+                            owner TEXT,
+                            worker_id TEXT,
+                            cancel_requested INTEGER DEFAULT 0,
+                            created_at REAL,
+                            started_at REAL,
+                            finished_at REAL,
+                            heartbeat_at REAL
+                        );
+                        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at);
+                        CREATE TABLE IF NOT EXISTS job_events (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            job_id TEXT NOT NULL,
+                            created_at REAL,
+                            progress REAL,
+                            message TEXT
+                        );
+                        CREATE INDEX IF NOT EXISTS idx_job_events_job ON job_events(job_id, id);
+                        CREATE TABLE IF NOT EXISTS job_output (
+                            job_id TEXT PRIMARY KEY,
+                            task_name TEXT,
+                            text TEXT,
+                            updated_at REAL
+                        );
+                        CREATE TABLE IF NOT EXISTS workers (
+                            worker_id TEXT PRIMARY KEY,
+                            pid INTEGER,
+                            heartbeat_at REAL
+                        );
+                    """)
+                    self._initialized = True
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_job(row) -> Optional[Dict]:
+        if row is None:
+            return None
+        job = dict(row)
+        job["params"] = json.loads(job["params"]) if job["params"] else {}
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        return job
+
+    # ------------------------------------------------------------------
+    # Pages: submit, poll, cancel
+    # ------------------------------------------------------------------
+    def submit(self, kind: str, params: Optional[Dict] = None, owner: Optional[str] = None) -> str:
+        """
+        Queue a job.
+
+        Args:
+            kind: Key of JOB_HANDLERS, e.g. "linkedin_search"
+            params: JSON-serializable handler parameters
+            owner: Optional tag (e.g. a session ID) for listing a user's jobs
+
+        Returns:
+            The new job ID
+
+        Raises:
+            ValueError: If no handler is registered for kind
+        """
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job kind '{kind}', expected one of {sorted(JOB_HANDLERS)}")
+        job_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, params, status, message, owner, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(params or {}, default=str), QUEUED, "Waiting for a worker", owner, now)
+            )
+            conn.execute(
+                "INSERT INTO job_events (job_id, created_at, progress, message) VALUES (?, ?, ?, ?)",
+                (job_id, now, 0.0, "Queued")
+            )
+        print(f"📥 Queued {kind} job {job_id}")
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Current state of a job, or None if unknown"""
+        with self._connection() as conn:
+            return self._row_to_job(conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+
+    def list_jobs(self, kind: str = None, status: str = None, owner: str = None, limit: int = 20) -> List[Dict]:
+        """Most recent jobs first, optionally filtered"""
+        clauses, args = [], []
+        for column, value in (("kind", kind), ("status", status), ("owner", owner)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                args.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM jobs {where} ORDER BY created_at DESC LIMIT ?", (*args, limit)
+            ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def events(self, job_id: str, after_id: int = 0) -> List[Dict]:
+        """Progress events of a job, oldest first, newer than after_id"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM job_events WHERE job_id = ? AND id > ? ORDER BY id", (job_id, after_id)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_output(self, job_id: str) -> Optional[Dict]:
+        """Latest streamed task output of a job ({task_name, text, updated_at}), or None"""
+        with self._connection() as conn:
+            row = conn.execute("SELECT * FROM job_output WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job: queued jobs are cancelled at once, running jobs are
+        flagged and their worker terminates them.
+
+        Returns:
+            True if the job was still active
+        """
+        now = time.time()
+        with self._connection(immediate=True) as conn:
+            row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or row["status"] not in ACTIVE_STATUSES:
+                return False
+            if row["status"] == QUEUED:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, message = ?, finished_at = ? WHERE id = ?",
+                    (CANCELLED, "Cancelled before start", now, job_id)
+                )
+            else:
+                conn.execute("UPDATE jobs SET cancel_requested = 1, message = ? WHERE id = ?",
+                             ("Cancelling...", job_id))
+            conn.execute(
+                "INSERT INTO job_events (job_id, created_at, progress, message) VALUES (?, ?, NULL, ?)",
+                (job_id, now, "Cancellation requested")
+            )
+        return True
+
+    # ------------------------------------------------------------------
+    # Workers: claim, report, finish
+    # ------------------------------------------------------------------
+    def claim(self, worker_id: str) -> Optional[Dict]:
+        """Atomically move the oldest queued job to running for this worker"""
+        now = time.time()
+        with self._connection(immediate=True) as conn:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker_id = ?, started_at = ?, heartbeat_at = ?, message = ? "
+                "WHERE id = ?",
+                (RUNNING, worker_id, now, now, "Starting", row["id"])
+            )
+            return self._row_to_job(conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone())
+
+    def add_event(self, job_id: str, message: str, progress: Optional[float] = None):
+        """Append a progress event and update the job's progress/message"""
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO job_events (job_id, created_at, progress, message) VALUES (?, ?, ?, ?)",
+                (job_id, now, progress, message)
+            )
+            if progress is not None:
+                conn.execute(
+                    "UPDATE jobs SET progress = MAX(progress, ?), message = ?, heartbeat_at = ? WHERE id = ?",
+                    (min(max(progress, 0.0), 1.0), message, now, job_id)
+                )
+            else:
+                conn.execute("UPDATE jobs SET message = ?, heartbeat_at = ? WHERE id = ?", (message, now, job_id))
+
+    def set_output(self, job_id: str, task_name: str, text: str):
+        with self._connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO job_output VALUES (?, ?, ?, ?)",
+                         (job_id, task_name, text, time.time()))
+
+    def heartbeat(self, job_id: str):
+        with self._connection() as conn:
+            conn.execute("UPDATE jobs SET heartbeat_at = ? WHERE id = ?", (time.time(), job_id))
+
+    def cancel_requested(self, job_id: str) -> bool:
+        with self._connection() as conn:
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def finish(self, job_id: str, status: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        """Move a running job to a final status (no-op if it already has one)"""
+        if status not in FINAL_STATUSES:
+            raise ValueError(f"'{status}' is not a final job status")
+        now = time.time()
+        message = {COMPLETED: "Completed", FAILED: "Failed", CANCELLED: "Cancelled"}[status]
+        with self._connection(immediate=True) as conn:
+            updated = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, message = ?, "
+                "progress = CASE WHEN ? = ? THEN 1.0 ELSE progress END "
+                "WHERE id = ? AND status IN (?, ?)",
+                (status, json.dumps(result, default=str) if result is not None else None, error, now, message,
+                 status, COMPLETED, job_id, *ACTIVE_STATUSES)
+            ).rowcount
+            if updated:
+                conn.execute(
+                    "INSERT INTO job_events (job_id, created_at, progress, message) VALUES (?, ?, ?, ?)",
+                    (job_id, now, 1.0 if status == COMPLETED else None, message)
+                )
+
+    def recover_stale(self, timeout: float = HEARTBEAT_TIMEOUT) -> int:
+        """Fail running jobs whose worker stopped sending heartbeats"""
+        cutoff = time.time() - timeout
+        with self._connection() as conn:
+            stale = [row["id"] for row in conn.execute(
+                "SELECT id FROM jobs WHERE status = ? AND heartbeat_at < ?", (RUNNING, cutoff)
+            ).fetchall()]
+        for job_id in stale:
+            self.finish(job_id, FAILED, error="Worker stopped responding")
+        return len(stale)
+
+    # ------------------------------------------------------------------
+    # Worker registry
+    # ------------------------------------------------------------------
+    def worker_heartbeat(self, worker_id: str, pid: Optional[int] = None):
+        with self._connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO workers VALUES (?, ?, ?)", (worker_id, pid, time.time()))
+
+    def remove_worker(self, worker_id: str):
+        with self._connection() as conn:
+            conn.execute("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
+
+    def reserve_workers(self, wanted: int, timeout: float = HEARTBEAT_TIMEOUT) -> int:
+        """
+        Count live workers and reserve slots for the missing ones.
+
+        Reservations count as live until they time out, so concurrent
+        Streamlit sessions do not all start their own workers.
+
+        Returns:
+            Number of workers the caller should start
+        """
+        now = time.time()
+        with self._connection(immediate=True) as conn:
+            conn.execute("DELETE FROM workers WHERE heartbeat_at < ?", (now - timeout,))
+            live = conn.execute("SELECT COUNT(*) FROM workers").fetchone()[0]
+            missing = max(wanted - live, 0)
+            for _ in range(missing):
+                conn.execute("INSERT INTO workers VALUES (?, NULL, ?)", (f"reserved-{uuid.uuid4().hex[:8]}", now))
+        return missing
+
+
+def resolve_handler(kind: str) -> Callable:
+    """Import the handler function registered for a job kind"""
+    module_name, function_name = JOB_HANDLERS[kind].split(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _execute_job(queue_path: str, job_id: str):
+    """Child-process entry point: run one job's handler and record the outcome"""
+    queue = JobQueue(queue_path)
+    job = queue.get(job_id)
+    context = JobContext(queue, job_id)
+    try:
+        result = resolve_handler(job["kind"])(job["params"], context)
+        queue.finish(job_id, COMPLETED, result=result)
+    except JobCancelled:
+        queue.finish(job_id, CANCELLED)
+    except Exception as e:
+        print(f"❌ Job {job_id} failed: {e}")
+        queue.finish(job_id, FAILED, error=f"{type(e).__name__}: {e}\n\n{traceback.format_exc()[-4000:]}")
+
+
+def run_worker(queue_path: Optional[str] = None, poll_interval: float = POLL_INTERVAL,
+               max_jobs: Optional[int] = None):
+    """
+    Worker loop: claim queued jobs and run each in a child process.
+
+    The worker keeps heartbeating while the child runs and terminates it
+    when the job is cancelled.
+
+    Args:
+        queue_path: SQLite file (defaults to JOB_QUEUE_PATH)
+        poll_interval: Seconds between queue polls
+        max_jobs: Stop after this many jobs (None = run forever)
+    """
+    queue = JobQueue(queue_path)
+    worker_id = f"worker-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+    mp_context = multiprocessing.get_context("spawn")
+    processed = 0
+    print(f"👷 {worker_id} polling {queue.path}")
+
+    try:
+        while max_jobs is None or processed < max_jobs:
+            queue.worker_heartbeat(worker_id, os.getpid())
+            queue.recover_stale()
+            job = queue.claim(worker_id)
+            if job is None:
+                time.sleep(poll_interval)
+                continue
+
+            print(f"🚀 {worker_id} running {job['kind']} job {job['id']}")
+            child = mp_context.Process(target=_execute_job, args=(queue.path, job["id"]), daemon=True)
+            child.start()
+            while child.is_alive():
+                child.join(poll_interval)
+                queue.heartbeat(job["id"])
+                queue.worker_heartbeat(worker_id, os.getpid())
+                if queue.cancel_requested(job["id"]):
+                    child.terminate()
+                    child.join()
+                    queue.finish(job["id"], CANCELLED)
+                    print(f"🛑 Cancelled job {job['id']}")
+
+            # Child crashed without recording an outcome
+            queue.finish(job["id"], FAILED, error=f"Job process exited with code {child.exitcode}")
+            processed += 1
+    finally:
+        queue.remove_worker(worker_id)
+
+
+def ensure_workers(count: Optional[int] = None, queue_path: Optional[str] = None) -> int:
+    """
+    Start detached worker processes until ``count`` are alive.
+
+    Workers run with the current working directory, which crews use for
+    their relative output paths.
+
+    Returns:
+        Number of workers started
+    """
+    count = count if count is not None else int(os.getenv("JOB_WORKERS", DEFAULT_WORKERS))
+    queue = JobQueue(queue_path) if queue_path else job_queue
+    missing = queue.reserve_workers(count)
+    log_dir = os.path.dirname(queue.path)
+    for _ in range(missing):
+        with open(os.path.join(log_dir, "workers.log"), "a") as log:
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "--queue", queue.path],
+                cwd=os.getcwd(), stdout=log, stderr=subprocess.STDOUT, start_new_session=True,
+            )
+    if missing:
+        print(f"👷 Started {missing} job worker(s)")
+    return missing
+
+
+# Global queue instance
+job_queue = JobQueue()
+
+
+# Convenience functions for direct use
+def submit_job(kind: str, params: Optional[Dict] = None, owner: Optional[str] = None) -> str:
+    """Queue a job on the global queue"""
+    return job_queue.submit(kind, params, owner)
+
+
+def get_job(job_id: str) -> Optional[Dict]:
+    """Get a job from the global queue"""
+    return job_queue.get(job_id)
+
+
+def cancel_job(job_id: str) -> bool:
+    """Cancel a job on the global queue"""
+    return job_queue.cancel(job_id)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run crew job workers")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes to run")
+    parser.add_argument("--queue", default=None, help="SQLite queue file (default: JOB_QUEUE_PATH)")
+    args = parser.parse_args()
+
+    if args.workers == 1:
+        run_worker(args.queue)
+    else:
+        processes = [multiprocessing.Process(target=run_worker, args=(args.queue,)) for _ in range(args.workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
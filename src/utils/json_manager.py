@@ -5,6 +5,7 @@ JSON Manager - Utility functions for handling search result JSON files
 import json
 import os
 import glob
+import uuid
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -14,14 +15,24 @@ class SearchResultsManager:
     
     RESULTS_DIR = "src/outputs/linkedin"
     LATEST_FILE = "latest_search_results.json"
+    SESSION_RESULTS_FILE = "search_results.json"
     
     @classmethod
     def ensure_directory_exists(cls):
         """Ensure the results directory exists"""
         os.makedirs(cls.RESULTS_DIR, exist_ok=True)
     
+    @staticmethod
+    def _write_json_atomic(filepath: str, data: Dict):
+        """Write JSON through a temp file so concurrent readers never see partial data"""
+        tmp_path = f"{filepath}.{uuid.uuid4().hex[:6]}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp_path, filepath)
+    
     @classmethod
-    def save_search_results(cls, search_data: Dict, job_title: str, location: str = None, **kwargs) -> str:
+    def save_search_results(cls, search_data: Dict, job_title: str, location: str = None,
+                            session=None, **kwargs) -> str:
         """
         Save search results to JSON file with timestamp
         
@@ -29,6 +40,7 @@ class SearchResultsManager:
             search_data: The search results from CrewAI
             job_title: Job title searched for
             location: Location searched (optional)
+            session: SearchSession the results belong to (optional)
             **kwargs: Additional search parameters
             
         Returns:
@@ -36,8 +48,10 @@ class SearchResultsManager:
         """
         cls.ensure_directory_exists()
         
+        # Session ID keeps filenames unique when searches finish in the same second
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"search_results_{timestamp}.json"
+        suffix = f"_{session.session_id}" if session else f"_{uuid.uuid4().hex[:8]}"
+        filename = f"search_results_{timestamp}{suffix}.json"
         filepath = os.path.join(cls.RESULTS_DIR, filename)
         
         # Structure the data for saving
@@ -46,7 +60,9 @@ class SearchResultsManager:
                 "job_title": job_title,
                 "location": location or "",
                 "search_timestamp": datetime.now().isoformat(),
-                "search_parameters": kwargs
+                "search_parameters": kwargs,
+                "session_id": session.session_id if session else None,
+                "session_dir": session.output_dir if session else None
             },
             "crew_output": str(search_data),
             "raw_result": search_data
@@ -54,13 +70,16 @@ class SearchResultsManager:
         
         # Save timestamped file
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(structured_data, f, indent=2, ensure_ascii=False, default=str)
+            cls._write_json_atomic(filepath, structured_data)
+            
+            # Keep a copy inside the session directory
+            if session:
+                cls._write_json_atomic(session.path(cls.SESSION_RESULTS_FILE), structured_data)
+                session.update(results_file=filepath)
             
             # Also save as latest file
             latest_filepath = os.path.join(cls.RESULTS_DIR, cls.LATEST_FILE)
-            with open(latest_filepath, 'w', encoding='utf-8') as f:
-                json.dump(structured_data, f, indent=2, ensure_ascii=False, default=str)
+            cls._write_json_atomic(latest_filepath, structured_data)
                 
             return filepath
             
@@ -87,6 +106,29 @@ class SearchResultsManager:
                 return None
         return None
     
+    @classmethod
+    def load_session_results(cls, session) -> Optional[Dict]:
+        """
+        Load the saved search results of a session
+        
+        Args:
+            session: SearchSession or session ID
+            
+        Returns:
+            Dict: Search results or None if not found
+        """
+        from utils.search_session import SearchSession
+        
+        if not isinstance(session, SearchSession):
+            session = SearchSession.load(session)
+        if session is None:
+            return None
+        
+        filepath = session.path(cls.SESSION_RESULTS_FILE)
+        if not os.path.exists(filepath):
+            return None
+        return cls.load_results_by_file(filepath)
+    
     @classmethod
     def get_all_result_files(cls) -> List[str]:
         """
@@ -209,9 +251,9 @@ class SearchResultsManager:
 
 
 # Convenience functions for direct use
-def save_linkedin_search(result, job_title: str, location: str = None, **kwargs) -> str:
+def save_linkedin_search(result, job_title: str, location: str = None, session=None, **kwargs) -> str:
     """Convenience function to save LinkedIn search results"""
-    return SearchResultsManager.save_search_results(result, job_title, location, **kwargs)
+    return SearchResultsManager.save_search_results(result, job_title, location, session=session, **kwargs)
 
 
 def load_latest_linkedin_search() -> Optional[Dict]:
@@ -0,0 +1,149 @@
+"""
+Lazy Registry - Build agents, tools and configs on first use
+Modules register a factory instead of constructing heavy CrewAI objects at
+import time; the object is built the first time it is requested and cached,
+so importing a page or crew module stays cheap until that page is used
+
+Usage:
+    from utils.lazy_registry import registry
+
+    registry.register("research_manager", build_manager)
+    manager = registry.get("research_manager")  # built once, then cached
+"""
+
+import importlib
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+
+ENV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), ".env")
+
+
+@lru_cache(maxsize=None)
+def load_env() -> bool:
+    """
+    Load the project .env once per process (existing variables win).
+
+    Called by the code paths that read API keys, instead of every module
+    calling load_dotenv at import.
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    from dotenv import find_dotenv, load_dotenv
+
+    path = ENV_PATH if os.path.exists(ENV_PATH) else find_dotenv(usecwd=True)
+    return bool(path) and load_dotenv(path)
+
+
+class LazyRegistry:
+    """Named factories whose results are built on first access and cached"""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self.build_times: Dict[str, float] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """
+        Register a zero-argument factory under a name.
+
+        Registering a different factory under an existing name (e.g. when
+        Streamlit reloads a module) replaces it and drops the cached object.
+
+        Args:
+            name: Registry key, e.g. "research_manager"
+            factory: Builds the object; called at most once until reset
+        """
+        with self._lock:
+            if self._factories.get(name) is not factory:
+                self._factories[name] = factory
+                self._instances.pop(name, None)
+
+    def provide(self, name: str):
+        """Decorator form of register"""
+        def decorator(factory: Callable[[], Any]):
+            self.register(name, factory)
+            return factory
+        return decorator
+
+    def get(self, name: str) -> Any:
+        """
+        Return the object for a name, building it on first use.
+
+        Raises:
+            KeyError: If nothing is registered under the name
+        """
+        if name in self._instances:
+            return self._instances[name]
+        with self._lock:
+            if name not in self._instances:
+                if name not in self._factories:
+                    raise KeyError(f"Nothing registered as '{name}'")
+                start = time.perf_counter()
+                self._instances[name] = self._factories[name]()
+                self.build_times[name] = round(time.perf_counter() - start, 4)
+            return self._instances[name]
+
+    def is_built(self, name: str) -> bool:
+        """Whether the object has been constructed yet"""
+        return name in self._instances
+
+    def reset(self, name: Optional[str] = None):
+        """Drop one cached object (or all of them) so the next get rebuilds it"""
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(name, None)
+
+    def names(self) -> List[str]:
+        return sorted(self._factories)
+
+
+class LazyImport:
+    """
+    Stand-in for ``from module import attr`` that imports on first use.
+
+    Attribute access and calls are forwarded, so a lazily imported class
+    can still be instantiated or have its classmethods called.
+    """
+
+    def __init__(self, module: str, attr: str):
+        self._module = module
+        self._attr = attr
+        self._target = None
+
+    def resolve(self) -> Any:
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._attr)
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyImport {self._module}.{self._attr} ({state})>"
+
+
+# Global registry instance
+registry = LazyRegistry()
+
+
+# Convenience functions for direct use
+def register(name: str, factory: Callable[[], Any]):
+    """Register a factory on the global registry"""
+    registry.register(name, factory)
+
+
+def get_component(name: str) -> Any:
+    """Get (building on first use) a component from the global registry"""
+    return registry.get(name)
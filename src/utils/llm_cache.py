@@ -0,0 +1,223 @@
+"""
+LLM Cache - Shared prompt/response cache for LLM calls
+Keys are built from the model, its sampling parameters and a hash of the
+messages; entries live in a small SQLite file with a TTL and LRU eviction,
+so identical prompts from crews, coaches and pages are answered instantly
+
+Calls with temperature > 0 (or the provider default) are only cached when
+the caller explicitly allows it, since their output is meant to vary.
+
+Environment variables:
+- LLM_CACHE=on|off               enable/disable (default on)
+- LLM_CACHE_PATH                 SQLite file (default src/outputs/cache/llm_cache.sqlite3)
+- LLM_CACHE_TTL                  entry lifetime in seconds (default 7 days)
+- LLM_CACHE_MAX_ENTRIES          size bound before LRU eviction (default 2000)
+- LLM_CACHE_ALLOW_TEMPERATURE=1  cache temperature > 0 calls everywhere
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "outputs", "cache", "llm_cache.sqlite3")
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 2000
+
+# LLM attributes that change the response and therefore belong in the key
+KEY_PARAMS = (
+    "temperature", "top_p", "max_tokens", "max_completion_tokens", "stop",
+    "seed", "response_format", "reasoning_effort", "presence_penalty", "frequency_penalty",
+)
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() not in ("off", "0", "false", "no")
+
+
+def messages_hash(messages) -> str:
+    """Hash a prompt string or a list of chat messages"""
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+    canonical = json.dumps(messages, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def llm_params(llm) -> Dict:
+    """Collect the key parameters set on a CrewAI LLM instance"""
+    params = {}
+    for name in KEY_PARAMS:
+        value = getattr(llm, name, None)
+        if value not in (None, [], {}):
+            params[name] = value
+    return params
+
+
+class LLMCache:
+    """SQLite-backed prompt/response cache with TTL, LRU eviction and hit metrics"""
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        self.path = path or os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH)
+        self.ttl = ttl if ttl is not None else float(os.getenv("LLM_CACHE_TTL", DEFAULT_TTL))
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.getenv("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+        self._lock = threading.Lock()
+        self._initialized = False
+        self.stats = {"hits": 0, "misses": 0, "skipped": 0, "evictions": 0, "saved_latency_s": 0.0}
+
+    @property
+    def enabled(self) -> bool:
+        return _env_flag("LLM_CACHE", "on")
+
+    @contextmanager
+    def _connection(self):
+        """Open the cache database, creating the table on first use"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            if not self._initialized:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        key TEXT PRIMARY KEY,
+                        model TEXT,
+                        response TEXT,
+                        latency_s REAL,
+                        created_at REAL,
+                        last_access REAL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(last_access)")
+                self._initialized = True
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(model: str, params: Dict, messages) -> str:
+        """Cache key from the model, sampling parameters and message hash"""
+        canonical = json.dumps({
+            "model": model,
+            "params": params,
+            "messages": messages_hash(messages),
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_cacheable(params: Dict, allow_temperature: bool = False) -> bool:
+        """Deterministic calls are always cacheable; sampled ones only when allowed"""
+        if allow_temperature or _env_flag("LLM_CACHE_ALLOW_TEMPERATURE", "0"):
+            return True
+        temperature = params.get("temperature")
+        return temperature is not None and float(temperature) == 0.0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            with self._connection() as conn:
+                row = conn.execute(
+                    "SELECT response, latency_s, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or now - row[2] > self.ttl:
+                    if row is not None:
+                        conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self.stats["misses"] += 1
+                    return None
+                conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            self.stats["hits"] += 1
+            self.stats["saved_latency_s"] += row[1] or 0.0
+            return row[0]
+
+    def set(self, key: str, model: str, response: str, latency_s: float = 0.0):
+        """Store a response and evict least recently used entries beyond max_entries"""
+        now = time.time()
+        with self._lock:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, response, latency_s, now, now)
+                )
+                count = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+                if count > self.max_entries:
+                    excess = count - self.max_entries
+                    conn.execute(
+                        "DELETE FROM llm_cache WHERE key IN "
+                        "(SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)", (excess,)
+                    )
+                    self.stats["evictions"] += excess
+
+    def get_or_call(self, model: str, params: Dict, messages, call: Callable[[], str],
+                    allow_temperature: bool = False) -> str:
+        """
+        Return the cached response for a prompt, calling the LLM on a miss.
+
+        Args:
+            model: Model name
+            params: Sampling parameters (temperature, max tokens, ...)
+            messages: Prompt string or list of chat messages
+            call: Zero-argument function that performs the real LLM call
+            allow_temperature: Cache even when temperature > 0
+
+        Returns:
+            The (possibly cached) response text
+        """
+        if not self.enabled or not self.is_cacheable(params, allow_temperature):
+            with self._lock:
+                self.stats["skipped"] += 1
+            return call()
+
+        key = self.make_key(model, params, messages)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        start = time.perf_counter()
+        response = call()
+        if isinstance(response, str) and response:
+            self.set(key, model, response, time.perf_counter() - start)
+        return response
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            if os.path.exists(self.path):
+                with self._connection() as conn:
+                    conn.execute("DELETE FROM llm_cache")
+
+    def get_stats(self) -> Dict:
+        """
+        Get hit metrics for this process.
+
+        Returns:
+            Dict with hits, misses, skipped, evictions, hit_rate and saved_latency_s
+        """
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "saved_latency_s": round(self.stats["saved_latency_s"], 3),
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Global cache instance
+llm_cache = LLMCache()
+
+
+# Convenience functions for direct use
+def get_or_call(model: str, params: Dict, messages, call: Callable[[], str], allow_temperature: bool = False) -> str:
+    """Answer a prompt from the global cache, calling the LLM on a miss"""
+    return llm_cache.get_or_call(model, params, messages, call, allow_temperature)
+
+
+def get_cache_stats() -> Dict:
+    """Get hit metrics from the global LLM cache"""
+    return llm_cache.get_stats()
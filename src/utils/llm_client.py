@@ -0,0 +1,244 @@
+"""
+LLM Client - Shared factory for the LLMs used by crews, coaches and pages
+Every LLM call made through these objects is answered from the shared
+prompt cache when possible, and otherwise waits for the provider's budget
+in the process-wide rate limiter first. stream_llm yields an answer
+incrementally for pages that render it as it arrives, and OrderedStream
+merges the streams of concurrent calls back into document order
+"""
+
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Callable, Iterator, List, Optional
+
+from utils.llm_cache import llm_cache, llm_params
+from utils.rate_limiter import acquire
+from utils.crew_metrics import register_llm
+from utils.lazy_registry import load_env
+
+# Call arguments that make a response depend on more than the prompt
+UNCACHEABLE_ARGS = ("tools", "available_functions", "response_model")
+
+
+def provider_for_model(model: str) -> str:
+    """Map a model name such as "groq/llama3" or "gpt-4o-mini" to its rate-limit provider"""
+    if "/" in model:
+        return model.split("/", 1)[0].lower()
+    return "openai"
+
+
+def create_llm(model: str = "gpt-4o-mini", cache_sampled: bool = False, **kwargs):
+    """
+    Create a CrewAI LLM whose calls are cached and rate limited.
+
+    Args:
+        model: Model name passed to crewai.LLM
+        cache_sampled: Also cache calls made with temperature > 0
+        **kwargs: Additional crewai.LLM parameters (temperature, max_completion_tokens, ...)
+
+    Returns:
+        crewai LLM instance
+    """
+    from crewai import LLM
+
+    load_env()
+    llm = instrument_llm(LLM(model=model, **kwargs), cache_sampled=cache_sampled)
+    register_llm(llm)
+    return llm
+
+
+def instrument_llm(llm, cache_sampled: bool = False):
+    """
+    Wrap ``llm.call`` with the prompt cache and the rate limiter.
+
+    Plain prompt calls are looked up in the shared LLM cache first; calls
+    that pass tools or a response model always go to the provider. The
+    wrapper is stored on the instance, so the object keeps its CrewAI type
+    and can be passed to Agents unchanged.
+    """
+    model = str(getattr(llm, "model", ""))
+    provider = provider_for_model(model)
+    call = llm.call
+
+    def rate_limited_call(*args, **kwargs):
+        acquire(provider)
+        return call(*args, **kwargs)
+
+    def instrumented_call(messages, *args, **kwargs):
+        if any(args) or any(kwargs.get(name) for name in UNCACHEABLE_ARGS):
+            return rate_limited_call(messages, *args, **kwargs)
+        return llm_cache.get_or_call(
+            model,
+            llm_params(llm),
+            messages,
+            lambda: rate_limited_call(messages, *args, **kwargs),
+            allow_temperature=cache_sampled
+        )
+
+    object.__setattr__(llm, "call", instrumented_call)
+    return llm
+
+
+def stream_llm(llm, messages) -> Iterator[str]:
+    """
+    Call an LLM and yield its answer incrementally.
+
+    The call goes through ``llm.call`` on a background thread, so it is
+    still cached and rate limited; chunks are collected from CrewAI's
+    LLMStreamChunkEvent for this LLM instance. Create the LLM with
+    ``stream=True`` to get token-level chunks: cache hits and non-streaming
+    LLMs yield the whole answer as one chunk.
+
+    Args:
+        llm: LLM from create_llm
+        messages: Prompt string or list of chat messages
+
+    Yields:
+        Text chunks in order; their concatenation is the full answer
+
+    Raises:
+        Whatever ``llm.call`` raised, after the chunks received so far
+    """
+    from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+
+    chunks: "queue.Queue" = queue.Queue()
+    done = object()
+    outcome = {}
+
+    def on_chunk(source, event):
+        if source is llm and event.chunk and not event.tool_call:
+            chunks.put(event.chunk)
+
+    def run():
+        try:
+            outcome["text"] = llm.call(messages)
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            chunks.put(done)
+
+    crewai_event_bus.on(LLMStreamChunkEvent)(on_chunk)
+    streamed = []
+    try:
+        threading.Thread(target=run, daemon=True).start()
+        while (chunk := chunks.get()) is not done:
+            streamed.append(chunk)
+            yield chunk
+    finally:
+        crewai_event_bus.off(LLMStreamChunkEvent, on_chunk)
+
+    if "error" in outcome:
+        raise outcome["error"]
+    # Cache hits (and non-streaming LLMs) produce no chunks: yield what is missing
+    text, received = outcome.get("text") or "", "".join(streamed)
+    if len(text) > len(received) and text.startswith(received):
+        yield text[len(received):]
+
+
+def call_llm(llm, messages, on_token: Optional[Callable[[str], None]] = None) -> str:
+    """
+    ``llm.call`` that optionally reports the answer chunk by chunk.
+
+    Args:
+        llm: LLM from create_llm (use stream=True when on_token is given)
+        messages: Prompt string or list of chat messages
+        on_token: Called with each chunk as it arrives
+
+    Returns:
+        The full answer text
+    """
+    if on_token is None:
+        return llm.call(messages)
+    chunks = []
+    for chunk in stream_llm(llm, messages):
+        chunks.append(chunk)
+        on_token(chunk)
+    return "".join(chunks)
+
+
+class OrderedStream:
+    """
+    Forwards the output of concurrently generated sections in document order.
+
+    Chunks of the first unfinished section go straight to on_token; later
+    sections are buffered and released once every section before them is
+    done, so the receiver sees the document being written top to bottom.
+    Sections that are never streamed chunk by chunk are emitted whole by
+    finish.
+
+    chunk and finish may be called from worker threads: the text is queued
+    and on_token is only called by drain (and as_completed) on the thread
+    that consumes the stream, since callbacks such as Streamlit placeholders
+    must run on the script thread.
+    """
+
+    def __init__(self, count: int, on_token: Optional[Callable[[str], None]] = None,
+                 separator: str = "\n\n"):
+        self.on_token = on_token
+        self.separator = separator
+        self.buffers: List[List[str]] = [[] for _ in range(count)]
+        self.streamed = [False] * count
+        self.done = [False] * count
+        self.head = 0
+        self.lock = threading.Lock()
+        self.pending: "queue.Queue" = queue.Queue()
+
+    def _emit(self, text: str):
+        if self.on_token and text:
+            self.pending.put(text)
+
+    def drain(self):
+        """Pass the queued text to on_token (on the calling thread)"""
+        while True:
+            try:
+                text = self.pending.get_nowait()
+            except queue.Empty:
+                return
+            self.on_token(text)
+
+    def as_completed(self, futures, poll: float = 0.1):
+        """
+        concurrent.futures.as_completed that drains the stream while it waits.
+
+        Yields:
+            Each future as it completes; queued text is passed to on_token
+            every ``poll`` seconds and once more after the last future
+        """
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+            self.drain()
+            yield from done
+        self.drain()
+
+    def chunk(self, index: int, text: str):
+        """Forward (or buffer) a chunk of section ``index``"""
+        with self.lock:
+            if index == self.head:
+                self._emit(text)
+                self.streamed[index] = True
+            else:
+                self.buffers[index].append(text)
+
+    def restart(self, index: int):
+        """Drop the buffered output of a section that is being retried"""
+        with self.lock:
+            self.buffers[index] = []
+
+    def finish(self, index: int, text: str):
+        """Mark a section complete; text replaces its buffered chunks"""
+        with self.lock:
+            self.done[index] = True
+            if index == self.head:
+                if not self.streamed[index]:
+                    self._emit(text)
+                self.buffers[index] = []
+            else:
+                self.buffers[index] = [text]
+            while self.head < len(self.done) and self.done[self.head]:
+                self.head += 1
+                if self.head < len(self.done):
+                    self._emit(self.separator + "".join(self.buffers[self.head]))
+                    self.streamed[self.head] = bool(self.buffers[self.head]) or self.streamed[self.head]
+                    self.buffers[self.head] = []
@@ -0,0 +1,140 @@
+"""
+PDF Extract - Cached text extraction for uploaded resumes
+Text is cached by the SHA-256 of the file content: the upload is stored as
+data/uploads/<hash>.pdf with the extracted text next to it in <hash>.txt, so
+re-uploads and Streamlit reruns of the same file skip parsing entirely. Long
+documents are split into page ranges extracted in parallel worker processes
+
+Usage:
+    from utils.pdf_extract import extract_pdf_text
+
+    text = extract_pdf_text(uploaded_file.getvalue())
+    text = extract_pdf_text("resume.pdf")
+"""
+
+import hashlib
+import io
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, List, Optional, Union
+
+UPLOAD_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "uploads"
+)
+
+# Documents with at least this many pages are extracted across processes
+# (starting the pool costs ~0.4s, so resumes are always read in-process and
+# only long uploads such as portfolios use the pool)
+PARALLEL_MIN_PAGES = 40
+PAGES_PER_CHUNK = 8
+
+# Extracted texts kept in memory, least recently used evicted first
+# (older files are still read back from their <hash>.txt)
+MAX_MEMORY_ENTRIES = 32
+
+_memory: "OrderedDict[str, str]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_source(source: Union[bytes, str, BinaryIO]) -> bytes:
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    if hasattr(source, "getvalue"):  # Streamlit UploadedFile, BytesIO
+        return source.getvalue()
+    position = source.tell()
+    data = source.read()
+    source.seek(position)
+    return data
+
+
+def _write_atomic(path: str, data: Union[bytes, str]):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    mode, encoding = ("wb", None) if isinstance(data, bytes) else ("w", "utf-8")
+    with open(tmp_path, mode, encoding=encoding) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def extract_page_range(data: bytes, start: int, end: int) -> List[str]:
+    """Text of pages [start, end) of a PDF given as bytes (runs in pool workers)"""
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return [reader.pages[index].extract_text() or "" for index in range(start, end)]
+
+
+def _extract(data: bytes, workers: Optional[int] = None) -> str:
+    import PyPDF2
+
+    page_count = len(PyPDF2.PdfReader(io.BytesIO(data)).pages)
+    workers = workers or os.cpu_count() or 1
+
+    if page_count < PARALLEL_MIN_PAGES or workers < 2:
+        pages = extract_page_range(data, 0, page_count)
+    else:
+        ranges = [(start, min(start + PAGES_PER_CHUNK, page_count))
+                  for start in range(0, page_count, PAGES_PER_CHUNK)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges)),
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            chunks = pool.map(extract_page_range, [data] * len(ranges),
+                              [start for start, _ in ranges], [end for _, end in ranges])
+            pages = [page for chunk in chunks for page in chunk]
+
+    return "\n".join(page for page in pages if page) + "\n"
+
+
+def extract_pdf_text(source: Union[bytes, str, BinaryIO], upload_dir: str = UPLOAD_DIR,
+                     workers: Optional[int] = None) -> str:
+    """
+    Extract the text of a PDF, reusing the cached text of identical files.
+
+    Args:
+        source: PDF content, a path, or a file-like object (e.g. a Streamlit upload)
+        upload_dir: Where the upload and its extracted text are stored
+        workers: Processes for long documents (defaults to the CPU count)
+
+    Returns:
+        The text of all pages, one page per line block
+
+    Raises:
+        RuntimeError: If the file cannot be parsed as a PDF
+    """
+    data = _read_source(source)
+    digest = file_hash(data)
+    with _lock:
+        if digest in _memory:
+            _memory.move_to_end(digest)
+            return _memory[digest]
+
+    text_path = os.path.join(upload_dir, f"{digest}.txt")
+    if os.path.exists(text_path):
+        with open(text_path, "r", encoding="utf-8") as f:
+            text = f.read()
+    else:
+        try:
+            text = _extract(data, workers)
+        except Exception as e:
+            raise RuntimeError(f"❌ Failed to read PDF file: {e}")
+
+        os.makedirs(upload_dir, exist_ok=True)
+        pdf_path = os.path.join(upload_dir, f"{digest}.pdf")
+        if not os.path.exists(pdf_path):
+            _write_atomic(pdf_path, data)
+        _write_atomic(text_path, text)
+
+    with _lock:
+        _memory[digest] = text
+        _memory.move_to_end(digest)
+        while len(_memory) > MAX_MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+    return text
@@ -0,0 +1,202 @@
+"""
+Rate Limiter - Process-wide token-bucket limiter for outbound API calls
+Coordinates Serper, O*NET and OpenAI requests with per-provider budgets,
+optionally shared across processes through lock-protected state files
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    import fcntl  # POSIX only; cross-process sharing is disabled without it
+except ImportError:
+    fcntl = None
+
+
+# Per-provider budgets: (tokens refilled per second, bucket capacity)
+# Override with env vars such as RATE_LIMIT_SERPER="5/10"
+DEFAULT_BUDGETS = {
+    "serper": (5.0, 10),
+    "onet": (2.0, 4),
+    "openai": (3.0, 10),
+    "groq": (1.0, 5),
+}
+
+# Directory for cross-process bucket state (unset = limit within this process only)
+STATE_DIR_ENV = "RATE_LIMIT_STATE_DIR"
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at ``rate`` tokens per second up to ``capacity``.
+
+    When ``state_file`` is given, the bucket level is stored in that file and
+    updated under an exclusive file lock, so every process pointing at the same
+    file shares one budget.
+    """
+
+    def __init__(self, rate: float, capacity: float, state_file: Optional[str] = None):
+        self.rate = rate
+        self.capacity = capacity
+        self.state_file = state_file if fcntl else None
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        if self.state_file:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until ``tokens`` are available and consume them.
+
+        Returns:
+            Seconds spent waiting in the queue
+
+        Raises:
+            ValueError: If ``tokens`` exceeds the bucket capacity (the wait would never end)
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket with capacity {self.capacity}")
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                shortfall = self._try_consume(tokens)
+            if shortfall <= 0:
+                return time.monotonic() - start
+            time.sleep(shortfall / self.rate)
+
+    def _try_consume(self, tokens: float) -> float:
+        """Refill and consume; returns the token shortfall (<= 0 on success)"""
+        if not self.state_file:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return tokens - self._tokens
+
+        # Shared state uses wall-clock time so all processes agree on refills
+        with open(self.state_file, "a+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "{}")
+                except json.JSONDecodeError:
+                    state = {}
+
+                now = time.time()
+                level = state.get("tokens", self.capacity)
+                updated = state.get("updated", now)
+                level = min(self.capacity, level + max(0.0, now - updated) * self.rate)
+
+                shortfall = tokens - level
+                if shortfall <= 0:
+                    level -= tokens
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({"tokens": level, "updated": now}))
+                f.flush()
+                return shortfall
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """Registry of per-provider token buckets with queue wait-time metrics"""
+
+    def __init__(self, budgets: Optional[Dict] = None, state_dir: Optional[str] = None):
+        """
+        Args:
+            budgets: Mapping of provider -> (rate per second, capacity)
+            state_dir: Directory for cross-process bucket state files
+                       (defaults to the RATE_LIMIT_STATE_DIR env var)
+        """
+        self.budgets = dict(DEFAULT_BUDGETS)
+        self.budgets.update(budgets or {})
+        self.state_dir = state_dir if state_dir is not None else os.getenv(STATE_DIR_ENV)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _budget_for(self, provider: str):
+        """Resolve a provider budget, honouring RATE_LIMIT_<PROVIDER> overrides"""
+        override = os.getenv(f"RATE_LIMIT_{provider.upper()}")
+        if override:
+            try:
+                rate, _, capacity = override.partition("/")
+                rate, capacity = float(rate), float(capacity or rate)
+                # A bucket needs a positive refill rate and room for one token
+                if rate <= 0 or capacity < 1:
+                    raise ValueError(override)
+                return rate, capacity
+            except ValueError:
+                print(f"⚠️ Ignoring invalid RATE_LIMIT_{provider.upper()}={override!r}")
+        return self.budgets.get(provider, (1.0, 1))
+
+    def bucket(self, provider: str) -> TokenBucket:
+        """Get (or create) the bucket for a provider"""
+        with self._lock:
+            if provider not in self._buckets:
+                rate, capacity = self._budget_for(provider)
+                state_file = (
+                    os.path.join(self.state_dir, f"{provider}.bucket.json")
+                    if self.state_dir else None
+                )
+                self._buckets[provider] = TokenBucket(rate, capacity, state_file)
+                self._stats[provider] = {"calls": 0, "total_wait_s": 0.0, "max_wait_s": 0.0}
+            return self._buckets[provider]
+
+    def acquire(self, provider: str, tokens: float = 1.0) -> float:
+        """
+        Wait for the provider's budget before making a call.
+
+        Returns:
+            Seconds spent waiting in the queue
+        """
+        waited = self.bucket(provider).acquire(tokens)
+        with self._lock:
+            stats = self._stats[provider]
+            stats["calls"] += 1
+            stats["total_wait_s"] += waited
+            stats["max_wait_s"] = max(stats["max_wait_s"], waited)
+        return waited
+
+    def get_wait_stats(self) -> Dict[str, Dict]:
+        """
+        Get queue wait-time metrics per provider.
+
+        Returns:
+            Dict of provider -> {calls, total_wait_s, max_wait_s, avg_wait_s}
+        """
+        with self._lock:
+            return {
+                provider: {
+                    **stats,
+                    "total_wait_s": round(stats["total_wait_s"], 4),
+                    "max_wait_s": round(stats["max_wait_s"], 4),
+                    "avg_wait_s": round(stats["total_wait_s"] / stats["calls"], 4) if stats["calls"] else 0.0,
+                }
+                for provider, stats in self._stats.items()
+            }
+
+
+# Global rate limiter instance
+rate_limiter = RateLimiter()
+
+
+# Convenience functions for direct use
+def acquire(provider: str, tokens: float = 1.0) -> float:
+    """Wait for the global budget of a provider before making a call"""
+    return rate_limiter.acquire(provider, tokens)
+
+
+def get_wait_stats() -> Dict[str, Dict]:
+    """Get queue wait-time metrics from the global rate limiter"""
+    return rate_limiter.get_wait_stats()
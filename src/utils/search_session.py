@@ -0,0 +1,203 @@
+"""
+Search Session - First-class LinkedIn search sessions
+Each search gets its own ID, output directory and session_info.json manifest,
+so concurrent searches never write to the same files
+"""
+
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+try:
+    import fcntl  # POSIX only; manifest updates are then only serialized per process
+except ImportError:
+    fcntl = None
+
+
+class SearchSession:
+    """A single LinkedIn search with its own output directory and manifest"""
+
+    BASE_DIR = "src/outputs/linkedin"
+    MANIFEST_FILE = "session_info.json"
+    LOCK_FILE = ".session_info.lock"
+    # Manifest keys that are not extra fields
+    CORE_FIELDS = ("session_id", "created_at", "output_dir", "status", "search_params", "updated_at")
+
+    # Artifacts written by the LinkedIn search crew
+    ARTIFACTS = (
+        "user_search_params.json",
+        "job_postings.json",
+        "market_trends.json",
+        "verification_report.json",
+    )
+
+    _manifest_lock = threading.Lock()
+
+    def __init__(self, session_id: str, output_dir: str, created_at: str = None,
+                 status: str = "initialized", search_params: Optional[Dict] = None, **extra):
+        self.session_id = session_id
+        self.output_dir = output_dir
+        self.created_at = created_at or datetime.now().isoformat()
+        self.status = status
+        self.search_params = search_params or {}
+        self.extra = extra
+
+    @classmethod
+    def create(cls, search_params: Optional[Dict] = None, base_dir: str = None) -> "SearchSession":
+        """
+        Create a new session directory and manifest.
+
+        Args:
+            search_params: Search inputs to record in the manifest
+            base_dir: Parent directory for session folders (defaults to BASE_DIR)
+
+        Returns:
+            SearchSession: The new session
+        """
+        base_dir = base_dir or cls.BASE_DIR
+        os.makedirs(base_dir, exist_ok=True)
+
+        # exist_ok=False makes directory creation the uniqueness check
+        while True:
+            session_id = uuid.uuid4().hex[:8]
+            output_dir = f"{base_dir}/{session_id}"
+            try:
+                os.makedirs(output_dir, exist_ok=False)
+                break
+            except FileExistsError:
+                continue
+
+        session = cls(session_id, output_dir, search_params=search_params)
+        session.save()
+        return session
+
+    @classmethod
+    def load(cls, session: str, base_dir: str = None) -> Optional["SearchSession"]:
+        """
+        Load a session by ID or directory path.
+
+        Returns:
+            SearchSession or None if the session does not exist
+        """
+        output_dir = session if os.path.isdir(session) else f"{base_dir or cls.BASE_DIR}/{session}"
+        manifest_path = os.path.join(output_dir, cls.MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return None
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        data.setdefault("session_id", os.path.basename(output_dir.rstrip("/")))
+        data["output_dir"] = output_dir
+        return cls(**data)
+
+    @classmethod
+    def list_sessions(cls, base_dir: str = None, status: str = None) -> List["SearchSession"]:
+        """
+        List sessions, newest first.
+
+        Args:
+            base_dir: Parent directory for session folders
+            status: Only return sessions with this status
+        """
+        base_dir = base_dir or cls.BASE_DIR
+        if not os.path.exists(base_dir):
+            return []
+
+        sessions = []
+        for name in os.listdir(base_dir):
+            if not os.path.isdir(os.path.join(base_dir, name)):
+                continue
+            session = cls.load(f"{base_dir}/{name}")
+            if session and (status is None or session.status == status):
+                sessions.append(session)
+
+        return sorted(sessions, key=lambda s: s.created_at, reverse=True)
+
+    @classmethod
+    def latest(cls, base_dir: str = None, status: str = None) -> Optional["SearchSession"]:
+        """Get the most recently created session"""
+        sessions = cls.list_sessions(base_dir, status)
+        return sessions[0] if sessions else None
+
+    def path(self, filename: str) -> str:
+        """Path of a file inside this session's output directory"""
+        return f"{self.output_dir}/{filename}"
+
+    def artifact_paths(self) -> Dict[str, str]:
+        """Paths of all crew artifacts for this session"""
+        return {name: self.path(name) for name in self.ARTIFACTS}
+
+    def update(self, status: str = None, **fields) -> "SearchSession":
+        """
+        Update the status and/or extra manifest fields and save.
+
+        The manifest is re-read first, so fields written by another run of
+        the same session (e.g. a page and a worker) are kept.
+        """
+        with self._locked():
+            manifest = self._read_manifest()
+            if manifest:
+                self.status = manifest.get("status", self.status)
+                self.search_params = manifest.get("search_params", self.search_params)
+                self.extra.update({key: value for key, value in manifest.items() if key not in self.CORE_FIELDS})
+            if status:
+                self.status = status
+            if "search_params" in fields:
+                self.search_params = fields.pop("search_params")
+            self.extra.update(fields)
+            self._write_manifest()
+        return self
+
+    def to_dict(self) -> Dict:
+        """Manifest contents"""
+        return {
+            "session_id": self.session_id,
+            "created_at": self.created_at,
+            "output_dir": self.output_dir,
+            "status": self.status,
+            "search_params": self.search_params,
+            **self.extra,
+            "updated_at": datetime.now().isoformat(),
+        }
+
+    def save(self):
+        """Write the manifest atomically so readers never see a partial file"""
+        with self._locked():
+            self._write_manifest()
+
+    @contextmanager
+    def _locked(self):
+        """Serialize manifest writes across threads and, where flock exists, processes"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        with self._manifest_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.path(self.LOCK_FILE), 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_manifest(self) -> Optional[Dict]:
+        try:
+            with open(self.path(self.MANIFEST_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_manifest(self):
+        manifest_path = self.path(self.MANIFEST_FILE)
+        tmp_path = f"{manifest_path}.{uuid.uuid4().hex[:6]}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp_path, manifest_path)
@@ -0,0 +1,247 @@
+"""
+Skill Matcher - Find skills in resumes and job descriptions with synonyms
+A resume is normalized and indexed once (tokens plus word n-grams), then every
+skill is a set lookup instead of a regex pass over the whole text. Skills and
+their synonyms ("ML" <-> "machine learning") can also be found in one pass over
+any text with a single compiled pattern. Acronyms from the O*NET snapshot's
+reported job titles ("IT Manager (Information Technology Manager)") extend the
+built-in synonym table
+
+Usage:
+    from utils.skill_matcher import SkillMatcher, TokenIndex
+
+    matcher = SkillMatcher(["Python", "Machine Learning", "AWS"])
+    resume = TokenIndex(resume_text)
+    matcher.missing(resume)          # skills not in the resume
+    matcher.find(job_description)    # skills mentioned in a posting
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Union
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ONET_SNAPSHOT_PATH = os.path.join(SRC_DIR, "data", "onet", "onet_snapshot.json")
+
+# Longest skill phrase (in words) the index can look up
+MAX_NGRAM = 6
+
+# Groups of equivalent spellings; the first entry is the canonical name.
+# Acronyms written in capitals only match capitalised text ("IT", not "it")
+SYNONYM_GROUPS = [
+    ["machine learning", "ML"],
+    ["artificial intelligence", "AI"],
+    ["deep learning", "DL"],
+    ["natural language processing", "NLP"],
+    ["large language models", "large language model", "LLM", "LLMs"],
+    ["computer vision", "CV"],
+    ["amazon web services", "AWS"],
+    ["google cloud platform", "google cloud", "GCP"],
+    ["microsoft azure", "azure"],
+    ["kubernetes", "k8s"],
+    ["javascript", "JS"],
+    ["typescript", "TS"],
+    ["node.js", "nodejs"],
+    ["postgresql", "postgres"],
+    ["microsoft excel", "excel", "ms excel"],
+    ["power bi", "powerbi"],
+    ["scikit-learn", "sklearn", "scikit learn"],
+    ["ci/cd", "continuous integration", "continuous delivery"],
+    ["extract transform load", "ETL"],
+    ["user experience", "UX"],
+    ["user interface", "UI"],
+    ["search engine optimization", "SEO"],
+    ["key performance indicators", "key performance indicator", "KPI", "KPIs"],
+    ["customer relationship management", "CRM"],
+    ["enterprise resource planning", "ERP"],
+    ["application programming interface", "API", "APIs"],
+    ["statistics", "statistical analysis"],
+    ["project management", "project manager"],
+]
+
+# Tokens keep the symbols that are part of skill names (C++, C#, node.js, CI/CD)
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*", re.IGNORECASE)
+
+
+def tokenize(text: str, lower: bool = True) -> List[str]:
+    """Word tokens with trailing punctuation removed"""
+    tokens = [token.rstrip("./-") or token for token in TOKEN_RE.findall(text or "")]
+    return [token.lower() for token in tokens] if lower else tokens
+
+
+def normalize(text: str) -> str:
+    """Canonical single-spaced lowercase form used for all comparisons"""
+    return " ".join(tokenize(text))
+
+
+def is_acronym(spelling: str) -> bool:
+    """Capitalised synonyms (ML, AWS, KPIs) that must match case-sensitively"""
+    letters = spelling.rstrip("s")
+    return " " not in spelling and len(letters) >= 2 and letters.isupper()
+
+
+def acronym_pairs(title: str) -> List[tuple]:
+    """
+    Acronym expansions in a title such as
+    "IT Manager (Information Technology Manager)" -> [("IT", "information technology")].
+    """
+    match = re.match(r"^(?P<outer>[^()]+)\((?P<inner>[^()]+)\)\s*$", title or "")
+    if not match:
+        return []
+    pairs = []
+    sides = [match.group("outer").split(), match.group("inner").split()]
+    for short, long in (sides, sides[::-1]):
+        for word in short:
+            if not (2 <= len(word) <= 5 and word.isupper() and word.isalpha()):
+                continue
+            for start in range(len(long) - len(word) + 1):
+                window = long[start:start + len(word)]
+                if "".join(w[0] for w in window).upper() == word and not any(w.isupper() for w in window):
+                    pairs.append((word, normalize(" ".join(window))))
+                    break
+    return pairs
+
+
+@lru_cache(maxsize=None)
+def load_onet_synonyms(path: str = ONET_SNAPSHOT_PATH) -> tuple:
+    """Acronym synonym groups from the O*NET snapshot's occupation and reported titles"""
+    if not os.path.exists(path):
+        return ()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return ()
+    titles = [snapshot.get("title", "")]
+    titles += (snapshot.get("sample_of_reported_job_titles") or {}).get("title", [])
+    return tuple(sorted({(long, short) for title in titles for short, long in acronym_pairs(title)}))
+
+
+def exact_form(spelling: str) -> Optional[str]:
+    """The capitalised form an acronym must match exactly, None for any case"""
+    return spelling if is_acronym(spelling) else None
+
+
+@lru_cache(maxsize=None)
+def synonym_table() -> Dict[str, tuple]:
+    """Normalized spelling -> (canonical spelling, exact form), built-in groups plus O*NET acronyms"""
+    table = {}
+    for group in [*SYNONYM_GROUPS, *load_onet_synonyms()]:
+        canonical = normalize(group[0])
+        for spelling in group:
+            table.setdefault(normalize(spelling), (canonical, exact_form(spelling)))
+    return table
+
+
+def variants(skill: str) -> Dict[str, Optional[str]]:
+    """
+    All normalized spellings of a skill (its canonical form and synonyms).
+
+    Returns:
+        spelling -> the capitalised form it must match exactly (acronyms),
+        or None when it matches in any case
+    """
+    table = synonym_table()
+    normalized = normalize(skill)
+    canonical = table.get(normalized, (normalized, None))[0]
+    spellings = {spelling: exact for spelling, (target, exact) in table.items() if target == canonical}
+    spellings.setdefault(canonical, None)
+    spellings[normalized] = exact_form(skill.strip())
+    return spellings
+
+
+class TokenIndex:
+    """Normalized text indexed once by all word n-grams up to MAX_NGRAM words"""
+
+    def __init__(self, text: str, max_ngram: int = MAX_NGRAM):
+        raw_tokens = tokenize(text, lower=False)
+        self.tokens = [token.lower() for token in raw_tokens]
+        self.max_ngram = max_ngram
+        self.ngrams = {
+            " ".join(self.tokens[start:start + size])
+            for size in range(1, max_ngram + 1)
+            for start in range(len(self.tokens) - size + 1)
+        }
+        self.acronyms = {token for token in raw_tokens if is_acronym(token)}
+
+    def contains(self, phrase: str, exact: Optional[str] = None) -> bool:
+        """Whether a normalized phrase occurs as whole words (or the acronym ``exact`` as written)"""
+        return exact in self.acronyms if exact else phrase in self.ngrams
+
+
+class SkillMatcher:
+    """Compiled matcher for a fixed list of skills and their synonyms"""
+
+    def __init__(self, skills: Iterable[str]):
+        """
+        Args:
+            skills: Skill names; results use these names as given
+        """
+        self.skills = [skill for skill in dict.fromkeys(skills) if normalize(skill)]
+        self._variants = {skill: variants(skill) for skill in self.skills}
+        self._owner: Dict[str, List[str]] = {}
+        alternatives = {}
+        for skill, spellings in self._variants.items():
+            for spelling, exact in spellings.items():
+                self._owner.setdefault(spelling, []).append(skill)
+                if alternatives.get(spelling, "") is not None:  # any case wins over exact
+                    alternatives[spelling] = exact
+        alternation = "|".join(
+            re.escape(exact) if exact else f"(?i:{re.escape(spelling)})"
+            for spelling, exact in sorted(alternatives.items(), key=lambda item: -len(item[0]))
+        )
+        # Whole-token match on tokenized, case-preserving text
+        self.pattern = re.compile(rf"(?<![^ ])(?:{alternation})(?![^ ])") if alternation else None
+
+    def find(self, text: Union[str, TokenIndex]) -> List[str]:
+        """Skills present in a text or TokenIndex, in skill-list order"""
+        if isinstance(text, TokenIndex):
+            return [skill for skill in self.skills
+                    if any(text.contains(spelling, exact) for spelling, exact in self._variants[skill].items())]
+        found = set()
+        if self.pattern:
+            tokenized = " ".join(tokenize(text, lower=False))
+            # Try every token start so overlapping skills ("power bi" / "bi") all count
+            starts = [0] + [i + 1 for i, char in enumerate(tokenized) if char == " "]
+            for start in starts:
+                match = self.pattern.match(tokenized, start)
+                if match:
+                    found.update(self._owner[match.group(0).lower()])
+        return [skill for skill in self.skills if skill in found]
+
+    def missing(self, text: Union[str, TokenIndex]) -> List[str]:
+        """Skills not present in a text or TokenIndex, in skill-list order"""
+        found = set(self.find(text))
+        return [skill for skill in self.skills if skill not in found]
+
+
+def expand_skill(skill: str) -> List[str]:
+    """
+    Split research-data skill descriptions into matchable skills:
+    "Programming languages: Python, R, SQL" -> ["Python", "R", "SQL"],
+    "Cloud platforms (AWS, GCP, Azure)" -> ["AWS", "GCP", "Azure"].
+    """
+    listed = re.search(r"\(([^)]*,[^)]*)\)", skill) or re.search(r":\s*(.+,.+)$", skill)
+    if listed:
+        return [part.strip(" .") for part in re.split(r",|\band\b", listed.group(1)) if part.strip(" .")]
+    return [skill.strip()]
+
+
+def required_skills(job_data: Dict) -> List[str]:
+    """
+    Skills a job asks for: ``required_skills`` when present, otherwise the
+    research crew's ``skills.technical_skills`` and ``tools_and_technologies``.
+    """
+    if job_data.get("required_skills"):
+        return list(job_data["required_skills"])
+    skills = job_data.get("skills") or {}
+    listed = (skills.get("technical_skills") or []) + (skills.get("tools_and_technologies") or [])
+    return list(dict.fromkeys(part for skill in listed for part in expand_skill(skill)))
+
+
+# Convenience function for direct use
+def missing_skills(skills: Iterable[str], text: str, index: Optional[TokenIndex] = None) -> List[str]:
+    """Skills (with synonyms) that do not occur in text"""
+    return SkillMatcher(skills).missing(index or TokenIndex(text))
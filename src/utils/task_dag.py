@@ -0,0 +1,159 @@
+"""
+Task DAG - Schedule crew tasks from their declared context dependencies
+Groups tasks into dependency levels and marks independent tasks for
+asynchronous execution, so a sequential crew runs them concurrently and
+joins before the first task that needs their outputs
+"""
+
+from typing import Dict, List
+
+
+def task_levels(tasks: List) -> List[List]:
+    """
+    Group tasks into dependency levels using their ``context`` lists.
+
+    Level 0 holds tasks with no dependencies inside ``tasks``; every task in
+    level N depends only on tasks in earlier levels. Tasks keep their original
+    relative order within a level.
+
+    Args:
+        tasks: CrewAI Task objects
+
+    Returns:
+        List of levels, each a list of tasks
+
+    Raises:
+        ValueError: If the context dependencies contain a cycle
+    """
+    index = {id(task): i for i, task in enumerate(tasks)}
+    depends_on: Dict[int, set] = {
+        id(task): {
+            id(dep) for dep in (task.context if isinstance(task.context, list) else [])
+            if id(dep) in index
+        }
+        for task in tasks
+    }
+
+    levels = []
+    done = set()
+    remaining = list(tasks)
+    while remaining:
+        level = [task for task in remaining if depends_on[id(task)] <= done]
+        if not level:
+            names = ", ".join(getattr(task, "name", None) or task.description[:40] for task in remaining)
+            raise ValueError(f"Task context dependencies contain a cycle: {names}")
+        levels.append(level)
+        done.update(id(task) for task in level)
+        remaining = [task for task in remaining if id(task) not in done]
+
+    return levels
+
+
+def parallelize_tasks(tasks: List) -> List:
+    """
+    Order tasks by dependency level and set ``async_execution`` so that tasks
+    sharing a level run concurrently under ``Process.sequential``.
+
+    CrewAI starts async tasks in the background and waits for all of them
+    before the next synchronous task, which acts as the join. The scheduler
+    therefore keeps a task synchronous when:
+    - it is alone in its level
+    - it is the first task of a level that follows async tasks (the join)
+    - it is the last task of the final level (a crew must not end on
+      several async tasks)
+    - it is a ConditionalTask (these cannot run asynchronously)
+
+    Args:
+        tasks: CrewAI Task objects with ``context`` dependencies
+
+    Returns:
+        Tasks in execution order with ``async_execution`` updated
+    """
+    from crewai.tasks.conditional_task import ConditionalTask
+
+    levels = task_levels(tasks)
+    ordered = []
+    previous_async = False
+
+    for level_index, level in enumerate(levels):
+        is_final = level_index == len(levels) - 1
+        level_async = False
+
+        for position, task in enumerate(level):
+            run_async = (
+                len(level) > 1
+                and not (position == 0 and previous_async)
+                and not (is_final and position == len(level) - 1)
+                and not isinstance(task, ConditionalTask)
+            )
+            task.async_execution = run_async
+            level_async = level_async or run_async
+            ordered.append(task)
+
+        previous_async = level_async
+
+    return ordered
+
+
+def describe_schedule(tasks: List) -> str:
+    """Human-readable summary of the levels and async flags (for logging)"""
+    lines = []
+    for level_index, level in enumerate(task_levels(tasks)):
+        names = [
+            f"{getattr(task, 'name', None) or task.description[:40]}{' (async)' if task.async_execution else ''}"
+            for task in level
+        ]
+        lines.append(f"  Level {level_index}: {', '.join(names)}")
+    return "\n".join(lines)
+
+
+def execute_task_levels(crew, tasks: List, max_workers: int = None):
+    """
+    Execute tasks level by level, running each level's tasks in parallel threads.
+
+    Called from ``BudgetedCrew._execute_tasks`` (``parallel_levels=True``), so
+    it runs inside ``Crew.kickoff`` with its events, hooks and callbacks.
+    Unlike ``parallelize_tasks`` this does not rely on CrewAI's async flags:
+    CrewAI joins pending async tasks before the next synchronous one and a
+    crew may not end on several async tasks, so a DAG ending in independent
+    tasks (e.g. research -> verify and research -> content) could not run
+    them side by side. Each task receives its context from
+    ``crew._get_context``, as under ``Process.sequential``.
+
+    Args:
+        crew: Crew whose tasks declare their dependencies via ``context``
+        tasks: Tasks to execute (normally ``crew.tasks``)
+        max_workers: Upper bound on concurrently running tasks
+
+    Returns:
+        CrewOutput whose raw output is that of the last task in ``tasks``
+    """
+    import contextvars
+    from concurrent.futures import ThreadPoolExecutor
+
+    from crewai.crews.utils import prepare_task_execution
+
+    outputs = {}
+
+    def execute(task, agent, tools):
+        earlier = [outputs[id(done)] for done in tasks if id(done) in outputs]
+        return task.execute_sync(agent=agent, context=crew._get_context(task, earlier), tools=tools)
+
+    for level in task_levels(tasks):
+        prepared = [prepare_task_execution(crew, task, tasks.index(task), None, [], None)[0] for task in level]
+        if len(level) == 1:
+            results = [execute(level[0], prepared[0].agent, prepared[0].tools)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(level), max_workers or len(level))) as pool:
+                # Workers run in a copy of this context so CrewAI's event scope follows them
+                futures = [
+                    pool.submit(contextvars.copy_context().run, execute, task, data.agent, data.tools)
+                    for task, data in zip(level, prepared)
+                ]
+                results = [future.result() for future in futures]
+        for task, output in zip(level, results):
+            outputs[id(task)] = output
+            crew._process_task_result(task, output)
+            crew._store_execution_log(task, output, tasks.index(task))
+
+    return crew._create_crew_output([outputs[id(task)] for task in tasks])
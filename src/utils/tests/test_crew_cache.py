@@ -0,0 +1,126 @@
+"""
+Crew result cache: input normalization, per-artifact TTLs and stale refreshes
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.crew_cache import (
+    HOUR, CrewResultCache, artifact_ttl, cache_key, normalize_inputs, normalize_location, normalize_title,
+)
+from utils.search_session import SearchSession
+
+
+@pytest.mark.parametrize("location, expected", [
+    ("Portland, OR", "portland, or"),
+    ("Portland,ME, USA", "portland, me"),
+    ("  New York ,  NY ", "new york, ny"),
+    ("NYC", "new york, ny"),
+    ("SF", "san francisco, ca"),
+    ("Anywhere", ""),
+])
+def test_normalize_location_keeps_the_state(location, expected):
+    assert normalize_location(location) == expected
+
+
+def test_same_city_in_different_states_is_a_different_search():
+    assert cache_key("linkedin_search", {"location": "Portland, OR"}) != \
+        cache_key("linkedin_search", {"location": "Portland, ME"})
+
+
+def test_pm_is_not_an_alias():
+    assert normalize_title("Sr. PM") == "senior pm"
+    assert normalize_title("Sr. ML Eng") == "senior machine learning engineer"
+
+
+def test_normalize_inputs_drops_empty_and_ignored_inputs():
+    inputs = {
+        "job_title": "Sr. Data Scientist", "location": "Austin,TX", "job_type": "Any",
+        "company": "", "remote_option": " Hybrid ", "search_timestamp": "2026-01-01T00:00:00",
+    }
+    assert normalize_inputs(inputs) == {
+        "job_title": "senior data scientist", "location": "austin, tx", "remote_option": "hybrid",
+    }
+
+
+def test_artifact_ttls(monkeypatch):
+    assert artifact_ttl("job_postings.json") == 6 * HOUR
+    assert artifact_ttl("src/outputs/linkedin/abc/market_trends.json") == 24 * HOUR
+    assert artifact_ttl("unknown.json") == 6 * HOUR
+    monkeypatch.setenv("CREW_CACHE_TTL_JOB_POSTINGS", "600")
+    assert artifact_ttl("job_postings.json") == 600
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("CREW_CACHE", raising=False)
+    return CrewResultCache(cache_dir=str(tmp_path / "cache"), max_stale=HOUR)
+
+
+def put_and_age(cache, tmp_path, ages):
+    """Store one artifact per name and backdate each by ``ages[name]`` seconds"""
+    artifacts = {}
+    for name in ages:
+        path = tmp_path / name
+        path.write_text(json.dumps({"name": name}))
+        artifacts[name] = str(path)
+    entry_dir = cache.put("linkedin_search", {"job_title": "Data Analyst"}, artifacts, "done")
+
+    entry_path = os.path.join(entry_dir, "entry.json")
+    with open(entry_path) as f:
+        entry = json.load(f)
+    for name, age in ages.items():
+        entry["artifacts"][name] -= age
+    with open(entry_path, "w") as f:
+        json.dump(entry, f)
+
+
+def test_fresh_entry_is_a_hit_and_restores_its_artifacts(cache, tmp_path):
+    put_and_age(cache, tmp_path, {"job_postings.json": 0, "market_trends.json": 0})
+    cached = cache.get("linkedin_search", {"job_title": "data analyst"})
+    assert cached and not cached.is_stale and cached.result == "done"
+
+    restored = cached.restore({"job_postings.json": str(tmp_path / "session" / "job_postings.json")})
+    assert json.loads(Path(restored["job_postings.json"]).read_text()) == {"name": "job_postings.json"}
+
+
+def test_expired_artifact_is_served_stale_within_the_stale_window(cache, tmp_path):
+    # Postings (6h TTL) expired half an hour ago; market trends (24h TTL) are still fresh
+    put_and_age(cache, tmp_path, {"job_postings.json": 6.5 * HOUR, "market_trends.json": 6.5 * HOUR})
+    cached = cache.get("linkedin_search", {"job_title": "Data Analyst"})
+    assert cached.stale_artifacts == ["job_postings.json"]
+    assert cache.stats["stale_hits"] == 1
+
+
+def test_artifact_past_the_stale_window_is_a_miss(cache, tmp_path):
+    put_and_age(cache, tmp_path, {"job_postings.json": 7 * HOUR + 1, "market_trends.json": 0})
+    assert cache.get("linkedin_search", {"job_title": "Data Analyst"}) is None
+    assert cache.stats["misses"] == 1
+
+
+def test_stale_linkedin_refresh_does_not_create_a_listed_session(tmp_path, monkeypatch):
+    pytest.importorskip("crewai")
+    from Crew.linkedin_search_crew import LinkedInSearchCrew
+
+    monkeypatch.setattr(LinkedInSearchCrew, "REFRESH_DIR", str(tmp_path / "refresh"))
+    base_dir = str(tmp_path / "linkedin")
+    user_session = SearchSession.create(base_dir=base_dir)
+    refreshes = []
+
+    def fake_search(self, job_title, location=None, use_cache=True, save_results=True, **kwargs):
+        refreshes.append((self.session.output_dir, use_cache, save_results))
+
+    monkeypatch.setattr(LinkedInSearchCrew, "search_jobs", fake_search)
+    LinkedInSearchCrew(llm=None, session=user_session)._refresh_cache("Data Analyst", "Austin, TX")
+
+    [(scratch_dir, use_cache, save_results)] = refreshes
+    assert not use_cache and not save_results
+    assert scratch_dir.startswith(str(tmp_path / "refresh")) and not os.path.exists(scratch_dir)
+    assert [session.session_id for session in SearchSession.list_sessions(base_dir)] == [user_session.session_id]
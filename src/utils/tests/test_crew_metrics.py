@@ -0,0 +1,83 @@
+"""
+LLM-only metrics runs (the coaches) that overlap in different threads
+"""
+
+import contextvars
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+pytest.importorskip("crewai")
+
+from crewai.events import crewai_event_bus, LLMCallCompletedEvent
+from crewai.events.types.llm_events import LLMCallType
+
+from utils.crew_metrics import register_llm, track_llm_calls
+
+
+class FakeLLM:
+    """Event source standing in for a crewai LLM"""
+
+
+def emit_call(llm, prompt_tokens):
+    crewai_event_bus.emit(llm, event=LLMCallCompletedEvent(
+        call_id=f"call-{id(llm)}-{prompt_tokens}", model="gpt-4o-mini", response="ok",
+        call_type=LLMCallType.LLM_CALL, usage={"prompt_tokens": prompt_tokens, "completion_tokens": 1},
+    ))
+
+
+def test_overlapping_llm_runs_only_count_their_own_llms(tmp_path, monkeypatch):
+    monkeypatch.setenv("CREW_METRICS_DIR", str(tmp_path))
+    # The main thread joins both barriers so its call lands while both runs are open
+    both_open = threading.Barrier(3)
+    both_emitted = threading.Barrier(3)
+    totals = {}
+
+    def coach(name, prompt_tokens, calls):
+        with track_llm_calls(name) as collector:
+            both_open.wait()
+            llm = FakeLLM()
+            register_llm(llm)  # what create_llm does
+            for _ in range(calls):
+                emit_call(llm, prompt_tokens)
+            both_emitted.wait()
+        totals[name] = collector.to_dict()["totals"]
+
+    threads = [
+        threading.Thread(target=coach, args=("resume_coach", 100, 2)),
+        threading.Thread(target=coach, args=("interview_coach", 10, 3)),
+    ]
+    for thread in threads:
+        thread.start()
+    both_open.wait()
+    emit_call(FakeLLM(), 1000)  # An LLM created outside both runs
+    both_emitted.wait()
+    for thread in threads:
+        thread.join()
+
+    assert totals["resume_coach"]["llm_calls"] == 2
+    assert totals["resume_coach"]["prompt_tokens"] == 200
+    assert totals["interview_coach"]["llm_calls"] == 3
+    assert totals["interview_coach"]["prompt_tokens"] == 30
+
+
+def test_worker_llms_are_registered_through_a_copied_context(tmp_path, monkeypatch):
+    monkeypatch.setenv("CREW_METRICS_DIR", str(tmp_path))
+
+    def worker():
+        llm = FakeLLM()
+        register_llm(llm)
+        emit_call(llm, 5)
+
+    with track_llm_calls("interview_coach") as collector:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            for future in [pool.submit(contextvars.copy_context().run, worker) for _ in range(2)]:
+                future.result()
+            pool.submit(worker).result()  # Without the copied context the LLM is not tracked
+    assert collector.to_dict()["totals"]["llm_calls"] == 2
@@ -0,0 +1,91 @@
+"""
+Import-time budget checks
+Page and tool modules must import without constructing CrewAI agents, tools
+or LLMs; those are built lazily through utils.lazy_registry on first use
+"""
+
+import os
+import subprocess
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+SRC_DIR = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(SRC_DIR))
+
+from utils.lazy_registry import LazyImport, LazyRegistry
+
+# Seconds allowed per module import in a fresh interpreter (override for slow CI)
+IMPORT_BUDGET_S = float(os.getenv("IMPORT_BUDGET_S", "1.5"))
+
+LIGHT_MODULES = [
+    "Tools",
+    "onet_get",
+    "streamlit_pages.info_page",
+    "streamlit_pages.specific_jobs",
+]
+
+
+def import_in_subprocess(module: str, check: str = "") -> dict:
+    """Import a module in a clean interpreter and report time and loaded modules"""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"{check}\n"
+        "print(json.dumps({'elapsed': elapsed, 'crewai': 'crewai' in sys.modules, "
+        "'built': locals().get('built')}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", LIGHT_MODULES)
+def test_page_and_tool_modules_import_within_budget(module):
+    if module.startswith("streamlit_pages"):
+        pytest.importorskip("streamlit")
+    report = import_in_subprocess(module)
+    assert not report["crewai"], f"{module} imports crewai at import time"
+    assert report["elapsed"] < IMPORT_BUDGET_S, f"{module} took {report['elapsed']:.2f}s to import"
+
+
+def test_research_crew_import_does_not_build_manager():
+    pytest.importorskip("crewai")
+    report = import_in_subprocess(
+        "Crew.research_crew",
+        "from utils.lazy_registry import registry\n"
+        "built = [name for name in registry.names() if registry.is_built(name)]",
+    )
+    assert report["built"] == []
+
+
+def test_registry_builds_once_and_rebuilds_after_reset():
+    registry = LazyRegistry()
+    calls = []
+    registry.register("thing", lambda: calls.append(1) or object())
+
+    assert not registry.is_built("thing")
+    first = registry.get("thing")
+    assert registry.get("thing") is first
+    assert len(calls) == 1
+
+    registry.reset("thing")
+    assert registry.get("thing") is not first
+    assert len(calls) == 2
+
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+def test_lazy_import_defers_module_load():
+    lazy = LazyImport("json", "dumps")
+    assert "not loaded" in repr(lazy)
+    assert lazy({"a": 1}) == '{"a": 1}'
+    assert "(loaded)" in repr(lazy)
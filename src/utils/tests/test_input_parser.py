@@ -0,0 +1,45 @@
+"""
+Rule-based dashboard input parsing and its LLM fallback
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.input_parser import InputParser, match_title, split_location
+
+
+def test_titles_match_with_seniority_plurals_and_typos():
+    assert match_title("Data Scientist")[0]["code"] == "15-2051.00"
+    assert match_title("Sr. Data Scientists")[0]["title"] == "Senior Data Scientist"
+    assert match_title("Information Technology Project Manager")[0]["code"] == "15-1299.09"
+    entry, confidence = match_title("Data Scientst")
+    assert entry["title"] == "Data Scientist" and 0.85 <= confidence < 1.0
+    assert match_title("Chief Vibes Officer") == (None, 0.0)
+
+
+def test_dashboard_input_routes_on_location():
+    parser = InputParser()
+    assert split_location("Nurse near boston, ma") == ("Nurse", "boston, ma")
+    # "in Test" is part of the title, not a location
+    assert split_location("Software Engineer in Test") == ("Software Engineer in Test", "")
+    assert split_location("Software Engineer in Test in Austin, TX") == ("Software Engineer in Test", "Austin, TX")
+    assert parser.parse("Software Engineer in Test") is None
+    parsed = parser.parse("Nurse near boston, ma")
+    assert parsed["location"] == "Boston, MA" and parsed["routing_recommendation"] == "linkedin_scraper"
+    assert parser.parse("Data Analyst")["request_type"] == "job_research"
+    assert parser.parse("Marketing") is None
+    assert parser.get_stats() == {"hits": 2, "misses": 2, "hit_rate": 0.5}
+
+
+def test_search_inputs_fall_back_on_unknown_filters():
+    parser = InputParser()
+    parsed = parser.parse_search({"job_title": "software engineers", "location": "seattle wa",
+                                  "remote_option": "remote", "date_posted": "Any"})
+    assert parsed["search_parameters"] == {
+        "job_title": "Software Engineer", "location": "Seattle, WA", "company": "",
+        "job_type": "Any", "remote_option": "Remote", "date_posted": "Any time", "work_authorization": "Any",
+    }
+    assert parser.parse_search({"job_title": "Data Analyst", "job_type": "weekends only"}) is None
@@ -0,0 +1,52 @@
+"""
+Interview guide sections generated concurrently, with per-section retries
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from coaches import interview_coach
+from coaches.interview_coach import CATEGORIES, MAX_ATTEMPTS, run_llm
+
+HEADINGS = [heading for heading, _ in CATEGORIES]
+FAILING = HEADINGS[1]
+
+
+def test_failed_section_is_reported_without_aborting_the_guide(monkeypatch):
+    attempts = {}
+    lock = threading.Lock()
+
+    def fake_call_llm(llm, messages, on_token=None):
+        heading = next(heading for heading in HEADINGS if f"# {heading}\n" in messages[-1]["content"])
+        with lock:
+            attempts[heading] = attempts.get(heading, 0) + 1
+        if heading == FAILING:
+            raise RuntimeError("provider error")
+        # Later sections answer first
+        time.sleep(0.01 * (len(HEADINGS) - HEADINGS.index(heading)))
+        if on_token:
+            on_token(f"## {heading}\n")
+        return f"## {heading}\nanswer"
+
+    monkeypatch.setattr(interview_coach, "create_llm", lambda **kwargs: None)
+    monkeypatch.setattr(interview_coach, "call_llm", fake_call_llm)
+    monkeypatch.setattr(interview_coach, "time", SimpleNamespace(sleep=lambda seconds: None))
+
+    received = []
+    guide, failed = run_llm({"job_title": "Data Analyst"}, "Resume", received.append)
+
+    assert failed == [FAILING]
+    assert attempts[FAILING] == MAX_ATTEMPTS
+    assert all(attempts[heading] == 1 for heading in HEADINGS if heading != FAILING)
+    # Every section is present, in order, with a placeholder for the failed one
+    positions = [guide.index(f"## {heading}") for heading in HEADINGS]
+    assert positions == sorted(positions)
+    assert "could not be generated: provider error" in guide
+    streamed = "".join(received)
+    assert streamed.index(f"## {HEADINGS[0]}") < streamed.index(f"## {HEADINGS[-1]}")
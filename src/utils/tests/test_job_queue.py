@@ -0,0 +1,64 @@
+"""
+Job queue state transitions (no worker processes are started)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.job_queue import JobQueue, CANCELLED, COMPLETED, FAILED, QUEUED, RUNNING
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+
+def test_submit_claim_progress_complete(queue):
+    job_id = queue.submit("linkedin_search", {"job_title": "Data Analyst"})
+    assert queue.get(job_id)["status"] == QUEUED
+
+    claimed = queue.claim("worker-1")
+    assert claimed["id"] == job_id and claimed["status"] == RUNNING
+    assert queue.claim("worker-2") is None
+
+    queue.add_event(job_id, "Running task", progress=0.5)
+    queue.finish(job_id, COMPLETED, result={"raw": "{}"})
+    job = queue.get(job_id)
+    assert (job["status"], job["progress"], job["result"]) == (COMPLETED, 1.0, {"raw": "{}"})
+    assert [event["message"] for event in queue.events(job_id)] == ["Queued", "Running task", "Completed"]
+
+    # A final status is never overwritten
+    queue.finish(job_id, FAILED, error="late crash")
+    assert queue.get(job_id)["status"] == COMPLETED
+
+
+def test_cancel_queued_and_running(queue):
+    queued_id = queue.submit("job_research", {"job_title": "Nurse"})
+    assert queue.cancel(queued_id)
+    assert queue.get(queued_id)["status"] == CANCELLED
+
+    running_id = queue.submit("job_research", {"job_title": "Nurse"})
+    queue.claim("worker-1")
+    assert queue.cancel(running_id)
+    assert queue.cancel_requested(running_id)
+    assert queue.get(running_id)["status"] == RUNNING  # the worker terminates it
+
+
+def test_stale_running_job_fails_and_unknown_kind_rejected(queue):
+    job_id = queue.submit("job_research", {"job_title": "Nurse"})
+    queue.claim("worker-1")
+    assert queue.recover_stale(timeout=-1) == 1
+    assert queue.get(job_id)["status"] == FAILED
+
+    with pytest.raises(ValueError):
+        queue.submit("not_a_job")
+
+
+def test_worker_reservations_are_not_double_counted(queue):
+    assert queue.reserve_workers(2) == 2
+    assert queue.reserve_workers(2) == 0
@@ -0,0 +1,72 @@
+"""
+Serper call budget of the batched LinkedIn job search
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Tools.LinkedInJobSearchTool import LinkedInJobSearchTool
+
+
+def fake_search(per_company, skip=()):
+    """
+    _serper_search stand-in returning ``per_company`` results for each queried
+    company (two distinct postings, repeated), none for companies in ``skip``.
+    """
+    calls = []
+
+    def search(self, api_key, query, num):
+        or_clause = re.search(r"\(([^)]*)\)", query)
+        companies = re.findall(r'"([^"]+)"', or_clause.group(1)) if or_clause else [query.split('" ')[-1]]
+        calls.append((companies, num))
+        results = []
+        for company in companies:
+            if company in skip and len(companies) > 1:
+                continue
+            slug = re.sub(r"[^a-z0-9]+", "-", company.lower()).strip("-")
+            for i in range(per_company):
+                results.append({
+                    "title": f"{company} hiring Data Analyst | LinkedIn",
+                    "link": f"https://www.linkedin.com/jobs/view/data-analyst-at-{slug}-{sum(map(ord, company))}{i % 2}",
+                    "snippet": "",
+                })
+        return results[:num]
+
+    return search, calls
+
+
+@pytest.fixture
+def tool(tmp_path, monkeypatch):
+    monkeypatch.setenv("SERPER_API_KEY", "test")
+    return LinkedInJobSearchTool(output_dir=str(tmp_path), batch_size=5)
+
+
+def run(tool, monkeypatch, search):
+    monkeypatch.setattr(LinkedInJobSearchTool, "_serper_search", search)
+    return [event for event in tool.stream_jobs("Data Analyst") if event["event"] == "done"][0]["result"]
+
+
+def test_unsaturated_batches_need_one_call_each(tool, monkeypatch):
+    search, calls = fake_search(per_company=2)
+    result = run(tool, monkeypatch, search)
+    # 15 companies in batches of 5, each query asking for 10 results per company
+    assert [num for _, num in calls] == [50, 50, 50]
+    assert result["search_metadata"]["serper_calls"] == 3
+
+
+def test_saturated_batches_only_requery_companies_without_hits(tool, monkeypatch):
+    search, calls = fake_search(per_company=10)
+    run(tool, monkeypatch, search)
+    assert len(calls) == 3  # full pages, but every company has hits
+
+    # Four companies fill the 50-result page; the skipped fifth is searched alone
+    search, calls = fake_search(per_company=13, skip={"Meta", "LinkedIn", "Dell"})
+    run(tool, monkeypatch, search)
+    assert [companies for companies, _ in calls if len(companies) == 1] == [["Meta"], ["LinkedIn"], ["Dell"]]
+    assert len(calls) == 6
@@ -0,0 +1,47 @@
+"""
+Deterministic parsing of LinkedIn result titles and snippets
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from Tools.linkedin_result_parser import parse_snippet, parse_title
+
+TITLES = [
+    ("Google hiring Data Analyst in Mountain View, CA | LinkedIn", ("Data Analyst", "Google", "Mountain View, CA")),
+    ("Data Analyst - Google - Mountain View, CA | LinkedIn", ("Data Analyst", "Google", "Mountain View, CA")),
+    ("Software Engineer, Data at Scale - Meta - Remote | LinkedIn", ("Software Engineer, Data at Scale", "Meta", "Remote")),
+    ("Senior Data Scientist - Machine Learning - Google",
+     ("Senior Data Scientist - Machine Learning", "Google", None)),
+    ("Data Analyst | Google | LinkedIn", ("Data Analyst", "Google", None)),
+    ("Data Analyst job at Google in Mountain View, CA", ("Data Analyst", "Google", "Mountain View, CA")),
+    ("Data Analyst at Google - Remote", ("Data Analyst", "Google", "Remote")),
+    ("Data Analyst | LinkedIn", ("Data Analyst", None, None)),
+]
+
+SNIPPETS = [
+    ("$120,000.00/yr - $150,000.00/yr · Full-time · Seniority level: Mid-Senior level · OPT welcome",
+     {"salary_range": "$120,000.00/yr - $150,000.00/yr", "experience_level": "Mid-Senior level",
+      "work_authorization": "OPT"}),
+    ("$45/hr. Entry level role with H1B sponsorship",
+     {"salary_range": "$45/hr", "experience_level": "Entry level", "work_authorization": "H1B, sponsorship"}),
+    ("Opt out of alerts. You will report to the Director. Refer a friend for a $5 gift card.",
+     {"salary_range": None, "experience_level": None, "work_authorization": None}),
+]
+
+
+@pytest.mark.parametrize("title, expected", TITLES)
+def test_parse_title(title, expected):
+    parsed = parse_title(title)
+    assert (parsed["job_title"], parsed["company_name"], parsed["location"]) == expected
+
+
+@pytest.mark.parametrize("snippet, expected", SNIPPETS)
+def test_parse_snippet(snippet, expected):
+    parsed = parse_snippet(snippet)
+    assert {field: parsed[field] for field in expected} == expected
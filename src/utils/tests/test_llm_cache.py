@@ -0,0 +1,119 @@
+"""
+SQLite prompt/response cache: keys, TTL, LRU eviction and sampled calls
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils import llm_cache as llm_cache_module
+from utils.llm_cache import LLMCache
+
+
+class Clock:
+    """Controllable stand-in for time.time"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(llm_cache_module, "time", SimpleNamespace(time=clock, perf_counter=time.perf_counter))
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("LLM_CACHE", raising=False)
+    monkeypatch.delenv("LLM_CACHE_ALLOW_TEMPERATURE", raising=False)
+    return LLMCache(path=str(tmp_path / "llm_cache.sqlite3"), ttl=60, max_entries=2)
+
+
+def counting_call(response="answer"):
+    calls = []
+
+    def call():
+        calls.append(1)
+        return response
+
+    return call, calls
+
+
+def test_key_is_stable_across_param_order_and_prompt_form():
+    messages = [{"role": "user", "content": "Hi"}]
+    assert LLMCache.make_key("gpt-4o-mini", {"temperature": 0, "max_tokens": 10}, messages) == \
+        LLMCache.make_key("gpt-4o-mini", {"max_tokens": 10, "temperature": 0}, messages)
+    # A plain prompt is the same as a single user message
+    assert LLMCache.make_key("gpt-4o-mini", {}, "Hi") == LLMCache.make_key("gpt-4o-mini", {}, messages)
+    assert LLMCache.make_key("gpt-4o-mini", {"temperature": 0}, messages) != \
+        LLMCache.make_key("gpt-4o", {"temperature": 0}, messages)
+
+
+def test_repeated_prompt_is_answered_from_the_cache(cache, clock):
+    call, calls = counting_call()
+    for _ in range(3):
+        assert cache.get_or_call("gpt-4o-mini", {"temperature": 0}, "Hi", call) == "answer"
+    assert len(calls) == 1
+    assert cache.get_stats()["hits"] == 2 and cache.get_stats()["misses"] == 1
+
+
+def test_entries_expire_after_the_ttl(cache, clock):
+    call, calls = counting_call()
+    cache.get_or_call("gpt-4o-mini", {"temperature": 0}, "Hi", call)
+    clock.now += 59
+    cache.get_or_call("gpt-4o-mini", {"temperature": 0}, "Hi", call)
+    assert len(calls) == 1
+    clock.now += 2  # 61s after it was stored
+    cache.get_or_call("gpt-4o-mini", {"temperature": 0}, "Hi", call)
+    assert len(calls) == 2
+
+
+def test_least_recently_used_entry_is_evicted(cache, clock):
+    params = {"temperature": 0}
+    cache.set(LLMCache.make_key("m", params, "first"), "m", "1")
+    clock.now += 1
+    cache.set(LLMCache.make_key("m", params, "second"), "m", "2")
+    clock.now += 1
+    assert cache.get(LLMCache.make_key("m", params, "first")) == "1"  # first is now the most recent
+    clock.now += 1
+    cache.set(LLMCache.make_key("m", params, "third"), "m", "3")
+
+    assert cache.get(LLMCache.make_key("m", params, "second")) is None
+    assert cache.get(LLMCache.make_key("m", params, "first")) == "1"
+    assert cache.get(LLMCache.make_key("m", params, "third")) == "3"
+    assert cache.get_stats()["evictions"] == 1
+
+
+@pytest.mark.parametrize("params", [{"temperature": 0.7}, {}])
+def test_sampled_calls_are_only_cached_when_allowed(cache, clock, monkeypatch, params):
+    call, calls = counting_call()
+    cache.get_or_call("gpt-4o-mini", params, "Hi", call)
+    cache.get_or_call("gpt-4o-mini", params, "Hi", call)
+    assert len(calls) == 2 and cache.get_stats()["skipped"] == 2
+
+    cache.get_or_call("gpt-4o-mini", params, "Hi", call, allow_temperature=True)
+    cache.get_or_call("gpt-4o-mini", params, "Hi", call, allow_temperature=True)
+    assert len(calls) == 3
+
+    monkeypatch.setenv("LLM_CACHE_ALLOW_TEMPERATURE", "1")
+    cache.get_or_call("gpt-4o-mini", params, "Hi", call)
+    assert len(calls) == 3
+
+
+def test_disabled_cache_always_calls(cache, clock, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE", "off")
+    call, calls = counting_call()
+    cache.get_or_call("gpt-4o-mini", {"temperature": 0}, "Hi", call)
+    cache.get_or_call("gpt-4o-mini", {"temperature": 0}, "Hi", call)
+    assert len(calls) == 2
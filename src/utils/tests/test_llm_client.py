@@ -0,0 +1,53 @@
+"""
+Merging concurrently streamed sections back into document order
+"""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.llm_client import OrderedStream
+
+
+def test_sections_finishing_out_of_order_stream_in_order_on_the_calling_thread():
+    received = []
+    stream = OrderedStream(3, lambda text: received.append((text, threading.get_ident())))
+    first_may_finish = threading.Event()
+
+    def write(index):
+        if index == 0:
+            first_may_finish.wait(5)  # Sections 1 and 2 finish first
+        for part in ("a", "b"):
+            stream.chunk(index, f"{index}{part} ")
+        return index
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(write, index) for index in (2, 1, 0)]
+        completed = []
+        for future in stream.as_completed(futures, poll=0.01):
+            index = future.result()
+            completed.append(index)
+            stream.finish(index, f"{index} full")
+            if sorted(completed) == [1, 2]:
+                first_may_finish.set()
+
+    assert completed[-1] == 0
+    # Section 0 streams live; the buffered sections follow with their final text
+    assert "".join(text for text, _ in received) == "0a 0b \n\n1 full\n\n2 full"
+    assert {thread for _, thread in received} == {threading.get_ident()}
+
+
+def test_section_without_streamed_chunks_is_emitted_whole():
+    received = []
+    stream = OrderedStream(2, received.append, separator="|")
+    stream.finish(1, "second")
+    stream.chunk(0, "fir")
+    stream.drain()
+    assert received == ["fir"]
+    stream.finish(0, "first")
+    stream.drain()
+    assert "".join(received) == "fir|second"
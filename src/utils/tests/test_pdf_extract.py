@@ -0,0 +1,106 @@
+"""
+Cached PDF text extraction for uploaded resumes
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+pytest.importorskip("PyPDF2")
+
+from utils import pdf_extract
+from utils.pdf_extract import extract_pdf_text
+
+
+def make_pdf(pages):
+    """Minimal PDF with one line of text per page"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    pdf, offsets = b"%PDF-1.4\n", []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    """Clear the in-memory cache and count real extractions"""
+    monkeypatch.setattr(pdf_extract, "_memory", type(pdf_extract._memory)())
+    calls = []
+    extract = pdf_extract._extract
+
+    def counting_extract(data, workers=None):
+        calls.append(data)
+        return extract(data, workers)
+
+    monkeypatch.setattr(pdf_extract, "_extract", counting_extract)
+    return calls
+
+
+def test_identical_files_are_extracted_once(tmp_path, extractions):
+    pdf = make_pdf(["Jane Doe", "Experience"])
+    text = extract_pdf_text(pdf, upload_dir=str(tmp_path))
+    assert "Jane Doe" in text and "Experience" in text
+    assert extract_pdf_text(pdf, upload_dir=str(tmp_path)) == text
+    assert len(extractions) == 1
+
+    # A new process (empty memory) reads the stored text instead of parsing
+    pdf_extract._memory.clear()
+    assert extract_pdf_text(pdf, upload_dir=str(tmp_path)) == text
+    assert len(extractions) == 1
+
+
+def test_changed_file_is_extracted_again(tmp_path, extractions):
+    extract_pdf_text(make_pdf(["Jane Doe"]), upload_dir=str(tmp_path))
+    text = extract_pdf_text(make_pdf(["Jane Doe, PhD"]), upload_dir=str(tmp_path))
+    assert "PhD" in text
+    assert len(extractions) == 2
+
+
+def test_memory_keeps_only_the_most_recently_used_files(tmp_path, extractions, monkeypatch):
+    monkeypatch.setattr(pdf_extract, "MAX_MEMORY_ENTRIES", 2)
+    first, second, third = (make_pdf([f"Resume {n}"]) for n in range(3))
+    extract_pdf_text(first, upload_dir=str(tmp_path))
+    extract_pdf_text(second, upload_dir=str(tmp_path))
+    extract_pdf_text(first, upload_dir=str(tmp_path))  # first is now the most recent
+    extract_pdf_text(third, upload_dir=str(tmp_path))
+    assert list(pdf_extract._memory) == [pdf_extract.file_hash(first), pdf_extract.file_hash(third)]
+
+
+def test_only_long_documents_use_worker_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_extract, "PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(pdf_extract, "PAGES_PER_CHUNK", 2)
+    pools = []
+    executor = pdf_extract.ProcessPoolExecutor
+
+    def recording_executor(*args, **kwargs):
+        pools.append(kwargs.get("max_workers"))
+        return executor(*args, **kwargs)
+
+    monkeypatch.setattr(pdf_extract, "ProcessPoolExecutor", recording_executor)
+
+    short = [f"Page {n}" for n in range(3)]
+    assert pdf_extract._extract(make_pdf(short), workers=2) == "\n".join(short) + "\n"
+    assert pools == []
+
+    long = [f"Page {n}" for n in range(5)]
+    assert pdf_extract._extract(make_pdf(long), workers=2) == "\n".join(long) + "\n"
+    assert pools == [2]
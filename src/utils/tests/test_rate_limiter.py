@@ -0,0 +1,51 @@
+"""
+Token-bucket rate limiting and queue wait-time metrics
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_bucket_waits_for_refill_and_rejects_oversized_requests():
+    bucket = TokenBucket(rate=50.0, capacity=2)
+    assert bucket.acquire() < 0.01 and bucket.acquire() < 0.01
+    assert bucket.acquire() >= 0.015  # empty: one token takes 1/50 s to refill
+    with pytest.raises(ValueError):
+        bucket.acquire(3)
+
+
+def test_state_file_shares_one_budget(tmp_path):
+    state_file = str(tmp_path / "serper.bucket.json")
+    first, second = TokenBucket(50.0, 1, state_file), TokenBucket(50.0, 1, state_file)
+    assert first.acquire() < 0.01
+    assert second.acquire() >= 0.015
+
+
+def test_wait_stats_per_provider():
+    limiter = RateLimiter(budgets={"unit_test": (50.0, 1)}, state_dir="")
+    limiter.acquire("unit_test")
+    limiter.acquire("unit_test")
+    stats = limiter.get_wait_stats()["unit_test"]
+    assert stats["calls"] == 2
+    assert stats["max_wait_s"] >= 0.015
+    assert stats["avg_wait_s"] == pytest.approx(stats["total_wait_s"] / 2, abs=1e-4)
+
+
+@pytest.mark.parametrize("override", ["0/5", "-1", "2/0.5", "fast"])
+def test_invalid_overrides_fall_back_to_the_default_budget(monkeypatch, override):
+    monkeypatch.setenv("RATE_LIMIT_UNIT_TEST", override)
+    limiter = RateLimiter(budgets={"unit_test": (50.0, 1)}, state_dir="")
+    assert limiter._budget_for("unit_test") == (50.0, 1)
+    assert limiter.acquire("unit_test") < 0.01
+
+
+def test_valid_override_replaces_the_budget(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_UNIT_TEST", "2/5")
+    assert RateLimiter(budgets={"unit_test": (50.0, 1)}, state_dir="")._budget_for("unit_test") == (2.0, 5.0)
@@ -0,0 +1,85 @@
+"""
+Resume section parsing, rewrite planning and partial rewrites
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from coaches import resume_sections
+from coaches.resume_sections import has_weak_metrics, parse_sections, plan_rewrites, rewrite_sections
+
+LINE_RESUME = """Jane Doe
+jane@example.com
+
+## Skills:
+Python, SQL
+
+Experience
+- Built dashboards for the sales team
+- Cut report time by 40%
+- Migrated the warehouse in 2021
+"""
+
+# PDF extraction flattens the page and leaves "l" where the bullet glyph was
+PDF_RESUME = ("Jane Doe jane@example.com SUMMARY Analyst with a focus on reporting. "
+              "EXPERIENCE Acme Corp l Built dashboards l Automated the weekly report "
+              "SKILLS Python, SQL, Tableau")
+
+
+def test_parse_sections_uses_line_headings_and_keeps_them_as_written():
+    sections = parse_sections(LINE_RESUME)
+    assert [section["kind"] for section in sections] == ["header", "skills", "experience"]
+    assert sections[0]["body"] == "Jane Doe\njane@example.com"
+    assert sections[1]["heading_text"] == "## Skills:"
+    assert sections[1]["body"] == "Python, SQL"
+
+
+def test_parse_sections_falls_back_to_inline_pdf_headings():
+    sections = parse_sections(PDF_RESUME)
+    assert [section["kind"] for section in sections] == ["header", "summary", "experience", "skills"]
+    assert sections[0]["body"] == "Jane Doe jane@example.com"
+    assert sections[3]["body"] == "Python, SQL, Tableau"
+
+
+@pytest.mark.parametrize("body, weak", [
+    # Years are not metrics: only one of three bullets is quantified
+    ("- Built dashboards\n- Cut report time by 40%\n- Migrated the warehouse in 2021", True),
+    ("- Cut report time by 40%\n- Served 3 regions\n- Led the 2021 migration", False),
+    # Bullets after the PDF "l" glyph
+    ("Acme Corp l Built dashboards l Automated the weekly report", True),
+    ("Acme Corp l Saved $20k a year l Trained 12 analysts", False),
+])
+def test_has_weak_metrics(body, weak):
+    assert has_weak_metrics({"kind": "experience", "body": body}) is weak
+
+
+def test_plan_rewrites():
+    sections = parse_sections(LINE_RESUME)
+    assert plan_rewrites(sections, ["Tableau"]) == {1: "skills", 2: "metrics"}
+    assert plan_rewrites(sections, []) == {2: "metrics"}
+
+    # Without a skills section, missing skills go to the summary
+    sections = parse_sections(PDF_RESUME.replace(" SKILLS Python, SQL, Tableau", " EDUCATION BSc"))
+    assert plan_rewrites(sections, ["Tableau"]) == {1: "skills", 2: "metrics"}
+
+
+def test_failed_section_keeps_its_original_text(monkeypatch):
+    def fake_call_llm(llm, prompt, on_token=None):
+        if "Missing skills" in prompt:
+            raise RuntimeError("provider error")
+        return "- Built 12 dashboards for the sales team"
+
+    monkeypatch.setattr(resume_sections, "create_llm", lambda **kwargs: None)
+    monkeypatch.setattr(resume_sections, "call_llm", fake_call_llm)
+
+    merged, report = rewrite_sections({"job_title": "Data Analyst"}, LINE_RESUME, ["Tableau"])
+    assert "## Skills:\n\nPython, SQL" in merged
+    assert "Experience\n\n- Built 12 dashboards for the sales team" in merged
+    assert [(section["kind"], section["rewritten"], section.get("failed")) for section in report["sections"]] == [
+        ("header", None, None), ("skills", None, True), ("experience", "metrics", None),
+    ]
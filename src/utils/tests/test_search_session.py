@@ -0,0 +1,117 @@
+"""
+LinkedIn search sessions: directories, manifests and session-aware result saving
+"""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.json_manager import SearchResultsManager, load_latest_linkedin_search, save_linkedin_search
+from utils.search_session import SearchSession
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    return str(tmp_path / "linkedin")
+
+
+def read_manifest(session):
+    with open(session.path(SearchSession.MANIFEST_FILE), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_create_writes_a_manifest_in_its_own_directory(base_dir):
+    session = SearchSession.create({"job_title": "Data Analyst"}, base_dir=base_dir)
+    other = SearchSession.create(base_dir=base_dir)
+
+    assert session.session_id != other.session_id
+    assert session.output_dir == f"{base_dir}/{session.session_id}"
+    manifest = read_manifest(session)
+    assert manifest["status"] == "initialized"
+    assert manifest["search_params"] == {"job_title": "Data Analyst"}
+
+
+def test_load_by_id_or_directory(base_dir):
+    session = SearchSession.create({"job_title": "Data Analyst"}, base_dir=base_dir)
+    session.update(status="completed", results_file="results.json")
+
+    for key in (session.session_id, session.output_dir):
+        loaded = SearchSession.load(key, base_dir=base_dir)
+        assert loaded.session_id == session.session_id
+        assert loaded.status == "completed"
+        assert loaded.search_params == {"job_title": "Data Analyst"}
+        assert loaded.extra["results_file"] == "results.json"
+
+    assert SearchSession.load("missing", base_dir=base_dir) is None
+
+
+def test_latest_is_the_newest_session(base_dir):
+    first = SearchSession.create(base_dir=base_dir)
+    second = SearchSession.create(base_dir=base_dir)
+    first.update(status="completed")
+
+    assert SearchSession.latest(base_dir=base_dir).session_id == second.session_id
+    assert SearchSession.latest(base_dir=base_dir, status="completed").session_id == first.session_id
+    assert SearchSession.latest(base_dir=str(Path(base_dir) / "empty")) is None
+
+
+def test_save_replaces_the_manifest_without_leaving_temp_files(base_dir):
+    session = SearchSession.create(base_dir=base_dir)
+    for n in range(5):
+        session.update(step=n)
+
+    assert read_manifest(session)["step"] == 4
+    assert not [name for name in os.listdir(session.output_dir) if name.endswith(".tmp")]
+
+
+def test_updates_from_two_runs_of_the_same_session_are_merged(base_dir):
+    session = SearchSession.create({"job_title": "Data Analyst"}, base_dir=base_dir)
+    page = SearchSession.load(session.session_id, base_dir=base_dir)
+    worker = SearchSession.load(session.session_id, base_dir=base_dir)
+
+    worker.update(status="running", worker_started="now")
+    page.update(viewed=True)
+
+    manifest = read_manifest(session)
+    assert manifest["status"] == "running"
+    assert manifest["worker_started"] == "now" and manifest["viewed"] is True
+    assert manifest["search_params"] == {"job_title": "Data Analyst"}
+
+
+def test_concurrent_updates_keep_every_field(base_dir):
+    session = SearchSession.create(base_dir=base_dir)
+    runs = [SearchSession.load(session.session_id, base_dir=base_dir) for _ in range(8)]
+    threads = [threading.Thread(target=run.update, kwargs={f"field_{n}": n}) for n, run in enumerate(runs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    manifest = read_manifest(session)
+    assert {key: manifest[key] for key in manifest if key.startswith("field_")} == {f"field_{n}": n for n in range(8)}
+
+
+def test_save_linkedin_search_with_a_session(base_dir, monkeypatch):
+    monkeypatch.setattr(SearchResultsManager, "RESULTS_DIR", base_dir)
+    session = SearchSession.create({"job_title": "Data Analyst"}, base_dir=base_dir)
+
+    filepath = save_linkedin_search({"jobs": []}, "Data Analyst", "Austin, TX", session=session, job_type="Full-time")
+
+    assert os.path.basename(filepath).endswith(f"_{session.session_id}.json")
+    saved = SearchResultsManager.load_session_results(session)
+    assert saved["raw_result"] == {"jobs": []}
+    assert saved["search_metadata"]["session_id"] == session.session_id
+    assert saved["search_metadata"]["search_parameters"] == {"job_type": "Full-time"}
+    assert load_latest_linkedin_search() == saved
+
+    # The manifest points at the timestamped file and keeps the search params
+    manifest = read_manifest(session)
+    assert manifest["results_file"] == filepath
+    assert manifest["search_params"] == {"job_title": "Data Analyst"}
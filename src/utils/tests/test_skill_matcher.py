@@ -0,0 +1,40 @@
+"""
+Skill matching: word boundaries, synonyms and acronyms
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.skill_matcher import SkillMatcher, TokenIndex, acronym_pairs, required_skills
+
+RESUME = (
+    "Built ML pipelines in Python and C++ on Amazon Web Services; "
+    "PowerBI dashboards for the IT team. It is Javascript-free."
+)
+
+
+def test_index_and_pattern_agree_on_synonyms_and_boundaries():
+    matcher = SkillMatcher(["Machine Learning", "AWS", "Python", "C++", "Power BI", "Java", "R", "Tableau"])
+    found = ["Machine Learning", "AWS", "Python", "C++", "Power BI"]
+    assert matcher.find(TokenIndex(RESUME)) == found
+    assert matcher.find(RESUME) == found
+    assert matcher.missing(TokenIndex(RESUME)) == ["Java", "R", "Tableau"]
+
+
+def test_acronyms_only_match_capitalised_text():
+    matcher = SkillMatcher(["Information Technology"])
+    assert matcher.find(TokenIndex("Led the IT helpdesk")) == ["Information Technology"]
+    assert matcher.find("it is done") == []
+    assert acronym_pairs("IT Manager (Information Technology Manager)") == [("IT", "information technology")]
+
+
+def test_required_skills_falls_back_to_research_skill_lists():
+    job_data = {"skills": {
+        "technical_skills": ["Programming languages: Python, R, SQL", "Cloud platforms (AWS, GCP, Azure)"],
+        "tools_and_technologies": ["Jupyter Notebook"],
+    }}
+    assert required_skills(job_data) == ["Python", "R", "SQL", "AWS", "GCP", "Azure", "Jupyter Notebook"]
+    assert required_skills({"required_skills": ["Excel"]}) == ["Excel"]
@@ -0,0 +1,102 @@
+"""
+Scheduling crew tasks from their context dependencies
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+pytest.importorskip("crewai")
+
+from crewai import Agent, Crew, Process, Task
+from crewai.tasks.task_output import TaskOutput
+
+from utils.task_dag import execute_task_levels, parallelize_tasks, task_levels
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    return Agent(role="Analyst", goal="Analyse", backstory="An analyst", llm="gpt-4o-mini")
+
+
+def make_task(name, agent, context=None):
+    extra = {"context": context} if context is not None else {}
+    return Task(name=name, description=f"Do {name}", expected_output=name, agent=agent, **extra)
+
+
+def linkedin_shape(agent):
+    """input -> (scraping, trends) -> verification, as in LinkedInSearchCrew"""
+    parse = make_task("input", agent)
+    scrape = make_task("scraping", agent, [parse])
+    trends = make_task("trends", agent, [parse])
+    verify = make_task("verification", agent, [scrape, trends])
+    return parse, scrape, trends, verify
+
+
+def test_levels_follow_context(agent):
+    parse, scrape, trends, verify = linkedin_shape(agent)
+    # Declaration order does not matter, only the context dependencies
+    levels = task_levels([verify, trends, scrape, parse])
+    assert [[task.name for task in level] for level in levels] == [["input"], ["trends", "scraping"], ["verification"]]
+
+
+def test_cycles_are_rejected(agent):
+    first = make_task("first", agent)
+    second = make_task("second", agent, [first])
+    first.context = [second]
+    with pytest.raises(ValueError, match="cycle"):
+        task_levels([first, second])
+
+
+def test_verification_joins_both_parents(agent):
+    tasks = parallelize_tasks(list(linkedin_shape(agent)))
+    assert {task.name: task.async_execution for task in tasks} == {
+        "input": False, "scraping": True, "trends": True, "verification": False,
+    }
+    # CrewAI's validators accept the schedule
+    Crew(agents=[agent], tasks=tasks, process=Process.sequential)
+
+
+def test_final_level_keeps_its_last_task_synchronous(agent):
+    research = make_task("research", agent)
+    verify = make_task("verify", agent, [research])
+    content = make_task("content", agent, [research])
+    tasks = parallelize_tasks([research, verify, content])
+    assert [task.async_execution for task in tasks] == [False, True, False]
+    Crew(agents=[agent], tasks=tasks, process=Process.sequential)
+
+    # Ending on both independent tasks asynchronously is what CrewAI rejects
+    content.async_execution = True
+    with pytest.raises(ValueError):
+        Crew(agents=[agent], tasks=tasks, process=Process.sequential)
+
+
+def test_execute_task_levels_runs_each_level_in_parallel(agent, monkeypatch):
+    parse, scrape, trends, verify = linkedin_shape(agent)
+    crew = Crew(agents=[agent], tasks=[parse, scrape, trends, verify], process=Process.sequential)
+    spans = {}
+    lock = threading.Lock()
+
+    def fake_execute_sync(self, agent=None, context=None, tools=None):
+        start = time.perf_counter()
+        time.sleep(0.2)
+        with lock:
+            spans[self.name] = (start, time.perf_counter(), context)
+        self.output = TaskOutput(description=self.description, raw=f"{self.name} done", agent=agent.role)
+        return self.output
+
+    monkeypatch.setattr(Task, "execute_sync", fake_execute_sync)
+    result = execute_task_levels(crew, crew.tasks)
+
+    assert result.raw == "verification done"
+    # Scraping and trends overlap; verification starts after both finished and sees both outputs
+    assert spans["scraping"][0] < spans["trends"][1] and spans["trends"][0] < spans["scraping"][1]
+    assert spans["verification"][0] >= max(spans["scraping"][1], spans["trends"][1])
+    assert "scraping done" in spans["verification"][2] and "trends done" in spans["verification"][2]
@@ -0,0 +1,43 @@
+"""
+Token budget: pruning, minification and fitting tool results into a budget
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.token_budget import LINKEDIN_UNUSED_FIELDS, count_tokens, fit_json, fit_text
+
+RESULT = {
+    "search_metadata": {"job_title": "Data Analyst", "company": "", "total_results_found": 40},
+    "job_postings": [
+        {"job_id": str(i), "job_title": "Data Analyst", "raw_title": "Data Analyst | LinkedIn",
+         "salary_range": "Not specified", "job_description": "Build SQL dashboards. " * 20}
+        for i in range(40)
+    ],
+}
+
+
+def test_fit_json_prunes_and_minifies_within_budget():
+    text = fit_json(RESULT, 100000, drop=LINKEDIN_UNUSED_FIELDS)
+    data = json.loads(text)
+    assert ": " not in text and "\n" not in text
+    assert data["search_metadata"] == {"job_title": "Data Analyst", "total_results_found": 40}
+    assert set(data["job_postings"][0]) == {"job_id", "job_title", "job_description"}
+
+
+def test_fit_json_cuts_the_longest_list_and_notes_the_cut():
+    text = fit_json(RESULT, 1000, drop=LINKEDIN_UNUSED_FIELDS)
+    data = json.loads(text)
+    assert count_tokens(text) <= 1000
+    assert len(data["job_postings"]) + data["job_postings_omitted"] == 40
+
+
+def test_fit_text_keeps_head_and_tail_of_plain_text():
+    text = "start " + "filler " * 3000 + "end"
+    fitted = fit_text(text, 200)
+    assert fitted.startswith("start") and fitted.endswith("end")
+    assert "tokens omitted" in fitted and count_tokens(fitted) < 250
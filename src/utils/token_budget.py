@@ -0,0 +1,239 @@
+"""
+Token Budget - Keep tool results and task context within a per-agent token budget
+Tool results and the outputs handed to downstream tasks are pruned (unused
+fields, empty and "Not specified" values dropped), minified, and then fitted
+into the agent's budget: long strings are shortened first, then the longest
+lists are cut, and text that is not JSON keeps its head and tail
+
+Budgets are in tokens, per agent key from config/*agents.yaml, and can be
+overridden with TOKEN_BUDGET_<AGENT_KEY> (e.g. TOKEN_BUDGET_LINKEDIN_SCRAPER=8000);
+TOKEN_BUDGET sets the default for every other agent
+
+Usage:
+    from utils.token_budget import budget_for, fit_json, fit_text
+
+    text = fit_json(result_data, budget_for("LinkedIn_Scraper"), drop=LINKEDIN_UNUSED_FIELDS)
+    context = fit_text(previous_output, 4000)
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_BUDGET = 4000
+
+# Tokens per agent (keys of config/*agents.yaml); each tool result and the
+# task context an agent receives must fit in its budget
+AGENT_BUDGETS = {
+    "dashboard_input_processor": 1500,
+    "LinkedIn_Scraper": 6000,
+    "linkedin_market_trends_analyst": 6000,
+    "verification_specialist": 8000,
+    "lead_research_analyst": 4000,
+    "verification_analyst": 6000,
+    "content_editor": 6000,
+}
+
+# Values that carry no information for the agent
+EMPTY_VALUES = (None, "", "Not specified", [], {})
+
+# Job posting fields no task reads (the full postings stay in job_postings_raw.json)
+LINKEDIN_UNUSED_FIELDS = {"raw_title", "source", "posting_age_days"}
+
+# Serper response fields no agent uses
+SERPER_UNUSED_FIELDS = {"searchParameters", "credits", "position", "sitelinks", "imageUrl", "relatedSearches"}
+
+# String lengths tried, in order, before lists are cut
+STRING_LIMITS = (600, 300, 150)
+
+# Same divider CrewAI puts between context task outputs
+CONTEXT_DIVIDER = "\n\n----------\n\n"
+
+
+@lru_cache(maxsize=1)
+def _encoder():
+    """tiktoken encoder, or None when tiktoken or its encoding files are unavailable"""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        print("⚠️ tiktoken unavailable; estimating tokens as 4 characters each")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in text (tiktoken when available, else about 4 characters per token)"""
+    if not text:
+        return 0
+    encoder = _encoder()
+    return len(encoder.encode(text, disallowed_special=())) if encoder else max(1, len(text) // 4)
+
+
+def budget_for(agent_key: Optional[str] = None) -> int:
+    """Token budget for an agent, from TOKEN_BUDGET_<AGENT_KEY>, AGENT_BUDGETS or TOKEN_BUDGET"""
+    override = os.getenv(f"TOKEN_BUDGET_{agent_key.upper()}") if agent_key else None
+    if override:
+        return int(override)
+    return AGENT_BUDGETS.get(agent_key) or int(os.getenv("TOKEN_BUDGET", DEFAULT_BUDGET))
+
+
+def role_budgets(agents_config: Dict) -> Dict[str, int]:
+    """Map each agent's role (as CrewAI reports it) to its budget"""
+    return {
+        " ".join(str(config.get("role", "")).split()): budget_for(key)
+        for key, config in (agents_config or {}).items()
+    }
+
+
+def task_budget(task, agent_budgets: Optional[Dict[str, int]] = None) -> int:
+    """Budget of the agent assigned to a CrewAI task (see role_budgets)"""
+    role = " ".join(str(getattr(getattr(task, "agent", None), "role", "") or "").split())
+    return (agent_budgets or {}).get(role) or budget_for()
+
+
+def minify_json(data: Any) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def parse_json(text: str) -> Optional[Any]:
+    """JSON value in text (optionally inside a ```json fence), or None"""
+    stripped = re.sub(r"^```(?:json)?\s*|\s*```$", "", (text or "").strip())
+    if not stripped or stripped[0] not in "[{":
+        return None
+    try:
+        return json.loads(stripped)
+    except json.JSONDecodeError:
+        return None
+
+
+def prune(data: Any, drop: Iterable[str] = ()) -> Any:
+    """Copy of data without the ``drop`` fields and empty or "Not specified" values"""
+    drop = set(drop)
+    if isinstance(data, dict):
+        pruned = {key: prune(value, drop) for key, value in data.items() if key not in drop}
+        return {key: value for key, value in pruned.items() if value not in EMPTY_VALUES}
+    if isinstance(data, list):
+        return [prune(item, drop) for item in data]
+    return data
+
+
+def _shorten_strings(data: Any, limit: int) -> Any:
+    if isinstance(data, dict):
+        return {key: _shorten_strings(value, limit) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_shorten_strings(item, limit) for item in data]
+    if isinstance(data, str) and len(data) > limit:
+        return data[:limit].rstrip() + "…"
+    return data
+
+
+def _list_items(data: list) -> tuple:
+    """(items, omitted count) of a list that may end with an {"_omitted": n} marker"""
+    if data and isinstance(data[-1], dict) and set(data[-1]) == {"_omitted"}:
+        return data[:-1], data[-1]["_omitted"]
+    return data, 0
+
+
+def _longest_list(data: Any, path: tuple = ()) -> Optional[tuple]:
+    """(path, items) of the longest list with more than one item inside data"""
+    found = None
+    if isinstance(data, list) and len(_list_items(data)[0]) > 1:
+        found = (path, _list_items(data)[0])
+    children = data.items() if isinstance(data, dict) else enumerate(data) if isinstance(data, list) else []
+    for key, value in children:
+        candidate = _longest_list(value, path + (key,))
+        if candidate and (found is None or len(candidate[1]) > len(found[1])):
+            found = candidate
+    return found
+
+
+def _cut_list(data: Any, path: tuple, keep: int) -> Any:
+    """Copy of data with the list at path cut to ``keep`` items and the cut noted"""
+    if not path:
+        items, omitted = _list_items(data)
+        return items[:keep] + [{"_omitted": omitted + len(items) - keep}]
+    key, rest = path[0], path[1:]
+    copy = dict(data) if isinstance(data, dict) else list(data)
+    if isinstance(data, dict) and not rest:
+        copy[key] = data[key][:keep]
+        copy[f"{key}_omitted"] = data.get(f"{key}_omitted", 0) + len(data[key]) - keep
+    else:
+        copy[key] = _cut_list(data[key], rest, keep)
+    return copy
+
+
+def fit_json(data: Any, budget: int, drop: Iterable[str] = ()) -> str:
+    """
+    Minified JSON of data that fits in ``budget`` tokens.
+
+    Args:
+        data: JSON-serializable value
+        budget: Maximum tokens of the result
+        drop: Field names to remove at any depth
+
+    Returns:
+        Minified JSON; lists that had to be cut get a ``<name>_omitted`` count
+    """
+    data = prune(data, drop)
+    text = minify_json(data)
+    if count_tokens(text) <= budget:
+        return text
+
+    for limit in STRING_LIMITS:
+        data = _shorten_strings(data, limit)
+        text = minify_json(data)
+        if count_tokens(text) <= budget:
+            return text
+
+    while count_tokens(text) > budget:
+        longest = _longest_list(data)
+        if not longest:
+            return truncate_text(text, budget)
+        path, items = longest
+        # Shrink in proportion to the overshoot, always dropping at least one item
+        keep = min(len(items) - 1, int(len(items) * budget / count_tokens(text)))
+        data = _cut_list(data, path, max(1, keep))
+        text = minify_json(data)
+    return text
+
+
+def fit_text(text: str, budget: int, drop: Iterable[str] = ()) -> str:
+    """
+    Fit text into ``budget`` tokens: JSON goes through fit_json, other
+    text keeps its beginning and end around an omission marker.
+    """
+    data = parse_json(text)
+    if data is not None:
+        return fit_json(data, budget, drop)
+    return truncate_text(text, budget)
+
+
+def truncate_text(text: str, budget: int) -> str:
+    """Text cut to about ``budget`` tokens, keeping its beginning and end"""
+    tokens = count_tokens(text)
+    if tokens <= budget:
+        return text
+    keep = int(len(text) * budget / tokens * 0.95)
+    head, tail = text[:keep * 2 // 3], text[len(text) - keep // 3:]
+    return f"{head}\n[... {tokens - budget} tokens omitted to fit the token budget ...]\n{tail}"
+
+
+def fit_context(outputs: List[str], budget: int) -> str:
+    """
+    Join context task outputs like CrewAI does, each fitted into an equal
+    share of the budget.
+    """
+    if not outputs:
+        return ""
+    share = max(1, budget // len(outputs))
+    return CONTEXT_DIVIDER.join(fit_text(output, share) for output in outputs)
+
+
+def task_context(task, agent_budgets: Optional[Dict[str, int]] = None) -> str:
+    """Outputs of a task's ``context`` tasks, fitted into its agent's budget"""
+    context_tasks = task.context if isinstance(task.context, list) else []
+    outputs = [context_task.output.raw for context_task in context_tasks if context_task.output is not None]
+    return fit_context(outputs, task_budget(task, agent_budgets))